@@ -0,0 +1,12 @@
+"""Filesystem locations for the local build process, resolved once at import."""
+
+from pathlib import Path
+
+from scripts.otel_layer_utils.cache_utils import CACHE_DIR
+
+# ocelot.py is run from the repository root
+REPO_ROOT = Path.cwd()
+DIST_YAML_PATH = REPO_ROOT / "config" / "distributions.yaml"
+
+# Parsed distributions.yaml, reused across runs while the file is unchanged
+DISTRIBUTIONS_CACHE_PATH = CACHE_DIR / "distributions.json"
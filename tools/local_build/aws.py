@@ -1,5 +1,8 @@
 """AWS utilities for the local build process."""
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
 from scripts.otel_layer_utils.ui_utils import (
     success,
     warning,
@@ -12,46 +15,68 @@ from .context import BuildContext
 from .exceptions import TerminateApp
 from .testing import inject_error
 
+# Shared boto3 session, created on first use. Only touched from the main
+# thread; worker threads receive clients built from it instead.
+_SESSION = None
+
 
-def check_aws_credentials() -> bool:
+def _session():
     """
-    Check if AWS credentials are configured correctly.
+    Return the shared boto3 session, creating it on first use.
 
-    Returns:
-        bool: True if credentials are properly configured, False otherwise
+    Raises:
+        ImportError: If boto3 is not installed
     """
-    try:
-        # Import boto3 (should be available as it's in the script requirements)
+    global _SESSION
+    if _SESSION is None:
         import boto3
 
-        # Create a boto3 STS client
-        sts_client = boto3.client("sts")
+        _SESSION = boto3.session.Session()
+    return _SESSION
+
 
-        # Call get_caller_identity directly using boto3
-        response = sts_client.get_caller_identity()
+def _sts_client():
+    """Create an STS client from the shared session."""
+    from scripts.otel_layer_utils.boto_utils import client_config
 
-        # Extract account ID from response
-        account_id = response.get("Account")
-        if account_id:
-            success("AWS credentials are configured", f"Account: {account_id}")
-            return True
-        else:
-            warning(
-                "AWS credentials are configured but account ID couldn't be determined."
-            )
-            return False
+    return _session().client("sts", config=client_config())
 
-    except ImportError:
+
+def _caller_account_id(sts_client) -> Optional[str]:
+    """Return the account ID of the caller. Performs no UI output."""
+    return sts_client.get_caller_identity().get("Account")
+
+
+def _report_credentials(
+    account_id: Optional[str], exc: Optional[BaseException] = None
+) -> bool:
+    """
+    Report the outcome of an STS caller identity lookup.
+
+    Args:
+        account_id: Account ID returned by STS, if the call succeeded
+        exc: Exception raised by the lookup, if it failed
+
+    Returns:
+        bool: True if credentials are properly configured, False otherwise
+    """
+    if isinstance(exc, ImportError):
         error("boto3 is not installed", "Please install it: pip install boto3")
         return False
-    except Exception as e:
-        error("AWS credentials are not configured correctly", str(e))
+    if exc is not None:
+        error("AWS credentials are not configured correctly", str(exc))
+        return False
+    if not account_id:
+        warning("AWS credentials are configured but account ID couldn't be determined.")
         return False
 
+    success("AWS credentials are configured", f"Account: {account_id}")
+    return True
+
 
-def get_aws_region() -> str:
+def _report_region(region: Optional[str], exc: Optional[BaseException] = None) -> str:
     """
-    Get the current AWS region from boto3 session.
+    Report the outcome of a region lookup.
 
     Returns:
         str: The detected AWS region
@@ -59,33 +84,23 @@ def get_aws_region() -> str:
     Raises:
         TerminateApp: If AWS region cannot be determined
     """
-    try:
-        import boto3
-
-        # Get the region from the default session
-        session = boto3.session.Session()
-        region = session.region_name
-
-        if region:
-            return region
-        else:
-            # Don't fallback, require configuration
-            error("Could not determine AWS region from boto3 session.")
-            detail(
-                "Hint", "Configure region via AWS_REGION env var or 'aws configure'."
-            )
-            raise TerminateApp(
-                "Could not determine AWS region",
-                step_index=4,
-                step_message="AWS region not configured",
-            )
-    except Exception as e:
-        error("Error getting AWS region", str(e))
+    if exc is not None:
+        error("Error getting AWS region", str(exc))
         raise TerminateApp(
-            f"Failed to get AWS region: {str(e)}",
+            f"Failed to get AWS region: {str(exc)}",
             step_index=4,
             step_message="AWS region error",
         )
+    if not region:
+        # Don't fallback, require configuration
+        error("Could not determine AWS region from boto3 session.")
+        detail("Hint", "Configure region via AWS_REGION env var or 'aws configure'.")
+        raise TerminateApp(
+            "Could not determine AWS region",
+            step_index=4,
+            step_message="AWS region not configured",
+        )
+    return region
 
 
 @inject_error(step_index=4)
@@ -108,7 +123,36 @@ def verify_credentials(context: BuildContext, tracker) -> BuildContext:
 
     # Sub-step: Check AWS Credentials
     subheader("Checking AWS credentials")
-    if not check_aws_credentials():
+    account_id = None
+    credentials_error = None
+    region = None
+    region_error = None
+
+    # Only the raw STS round-trip runs on the worker thread; the session and
+    # client are built here and all output happens on this thread, in order.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        fut_account = None
+        if not context.skip_aws_checks:
+            try:
+                fut_account = executor.submit(_caller_account_id, _sts_client())
+            except Exception as e:
+                credentials_error = e
+
+        # Resolve the region while the STS call is in flight
+        try:
+            region = _session().region_name
+        except Exception as e:
+            region_error = e
+
+        if fut_account is not None:
+            try:
+                account_id = fut_account.result()
+            except Exception as e:
+                credentials_error = e
+
+    if context.skip_aws_checks:
+        warning("Skipping AWS credentials check", "--skip-aws-checks is set")
+    elif not _report_credentials(account_id, credentials_error):
         error("AWS credentials check failed", "Skipping publish step")
         detail("Hint", "Run 'aws configure' or set AWS environment variables")
         raise TerminateApp(
@@ -119,7 +163,7 @@ def verify_credentials(context: BuildContext, tracker) -> BuildContext:
 
     # Sub-step: Get AWS Region
     subheader("Determining AWS region")
-    region = get_aws_region()
+    region = _report_region(region, region_error)
     success("Target AWS Region", region)
 
     # Update the context with the AWS region
@@ -1,6 +1,5 @@
 """Build process for local OTel Collector layer."""
 
-import os
 import sys
 
 from scripts.otel_layer_utils.ui_utils import (
@@ -11,7 +10,10 @@ from scripts.otel_layer_utils.ui_utils import (
     format_file_size,
     separator,
 )
-from scripts.otel_layer_utils.subprocess_utils import run_command
+from scripts.otel_layer_utils.subprocess_utils import (
+    default_stream_bufsize,
+    run_command,
+)
 from .context import BuildContext
 from .exceptions import TerminateApp
 from .testing import inject_error
@@ -68,15 +70,17 @@ def build_layer(context: BuildContext, tracker) -> BuildContext:
         build_cmd.extend(["--config-file", context.config_file])
 
     try:
-        # Run build script (don't capture output by default, let it stream)
-        run_command(build_cmd)
+        # Run build script (don't capture output, let it stream)
+        run_command(build_cmd, stream_bufsize=default_stream_bufsize())
 
         # Check output file
         layer_file = (
             context.build_dir
             / f"collector-{context.architecture}-{context.distribution}.zip"
         )
-        if not layer_file.exists():
+        try:
+            st = layer_file.stat()
+        except FileNotFoundError:
             error("Expected layer file not found after build", f"{layer_file}")
             raise TerminateApp(
                 "Layer file not found",
@@ -85,7 +89,7 @@ def build_layer(context: BuildContext, tracker) -> BuildContext:
             )
 
         # Get file size
-        file_size = os.path.getsize(layer_file)
+        file_size = st.st_size
         formatted_size = format_file_size(file_size)
 
         # Update context
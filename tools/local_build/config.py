@@ -1,5 +1,8 @@
 """Configuration handling for local build process."""
 
+import json
+import os
+import sys
 from pathlib import Path
 from typing import Dict, List, Tuple
 
@@ -9,6 +12,7 @@ from scripts.otel_layer_utils.distribution_utils import (
     DistributionError,
 )
 from scripts.otel_layer_utils.ui_utils import success, error, header, warning, info
+from ._paths import DIST_YAML_PATH, DISTRIBUTIONS_CACHE_PATH
 from .context import BuildContext
 from .exceptions import TerminateApp
 from .testing import inject_error
@@ -27,15 +31,15 @@ def load_distribution_choices() -> Tuple[List[str], Dict]:
     distribution_choices = []
     distributions_data = {}
 
-    try:
-        repo_root = Path().cwd()
-        dist_yaml_path = repo_root / "config" / "distributions.yaml"
+    dist_yaml_path = DIST_YAML_PATH
 
+    try:
         # Attempt to load distributions data
-        distributions_data = _load_distributions_utils(dist_yaml_path)
+        distributions_data = _load_distributions_cached(dist_yaml_path)
 
         # If successful, populate choices
-        distribution_choices = sorted(list(distributions_data.keys()))
+        # Names are interned by the loader, so Click hands back the same objects
+        distribution_choices = sorted(distributions_data)
         success("Loaded distribution choices", ", ".join(distribution_choices))
 
         # Fail fast if loaded data is empty or invalid
@@ -53,8 +57,8 @@ def load_distribution_choices() -> Tuple[List[str], Dict]:
             step_index=None,  # Not part of the tracked steps
             step_message=None,
         )
-    except Exception as e:
-        # Catch other errors during loading/parsing (e.g., YAMLError, ValueError)
+    except (DistributionError, ValueError) as e:
+        # Errors during loading/parsing, or an empty config
         error(
             f"Fatal Error: Could not load distributions from config file {dist_yaml_path}",
             str(e),
@@ -66,6 +70,71 @@ def load_distribution_choices() -> Tuple[List[str], Dict]:
         )
 
 
+def _load_distributions_cached(yaml_path: Path) -> Dict:
+    """
+    Load distributions, reusing the on-disk cache while the YAML is unchanged.
+
+    Args:
+        yaml_path: Path to the distributions YAML file
+
+    Returns:
+        Dict: The distributions data
+
+    Raises:
+        DistributionError: If the YAML cannot be loaded
+    """
+    try:
+        st = os.stat(yaml_path)
+    except OSError:
+        # Let the loader report the missing file
+        return _load_distributions_utils(yaml_path)
+    # A list, since that is what the key reads back as from JSON
+    cache_key = [str(yaml_path), st.st_mtime_ns, st.st_size]
+
+    try:
+        with open(DISTRIBUTIONS_CACHE_PATH, "r") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        # Missing or unreadable cache; rebuild it below
+        cached = None
+    if (
+        isinstance(cached, dict)
+        and cached.get("key") == cache_key
+        and isinstance(cached.get("distributions"), dict)
+    ):
+        return {
+            sys.intern(name): info for name, info in cached["distributions"].items()
+        }
+
+    distributions_data = _load_distributions_utils(yaml_path)
+    try:
+        DISTRIBUTIONS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = DISTRIBUTIONS_CACHE_PATH.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"key": cache_key, "distributions": distributions_data}, f)
+        os.replace(tmp_path, DISTRIBUTIONS_CACHE_PATH)
+    except (OSError, TypeError, ValueError):
+        # Unwritable cache dir, or values JSON cannot represent
+        pass
+    return distributions_data
+
+
+def prefetch_distributions(context: BuildContext) -> None:
+    """
+    Parse the distributions data into the context without any output.
+
+    Meant to run in a background thread while the upstream clone is in
+    flight. Errors are left for load_distributions to report.
+
+    Args:
+        context: The build context
+    """
+    try:
+        context.distributions_data
+    except DistributionError:
+        pass
+
+
 @inject_error(step_index=None)
 def load_distributions(context: BuildContext) -> BuildContext:
     """
@@ -84,11 +153,9 @@ def load_distributions(context: BuildContext) -> BuildContext:
     header("Loading distributions")
 
     try:
-        repo_root = Path().cwd()
-        dist_yaml_path = repo_root / "config" / "distributions.yaml"
-        distributions_data = _load_distributions_utils(dist_yaml_path)
-        context.set_distributions_data(distributions_data)
-    except Exception as e: # Catch critical errors from loading the main distributions data
+        # First access parses config/distributions.yaml and caches it on the context
+        context.distributions_data
+    except DistributionError as e:  # Critical errors from loading the main distributions data
         error("CRITICAL: Failed to load distributions data from YAML", str(e))
         raise TerminateApp(
             f"CRITICAL: Failed to load distributions data: {str(e)}",
@@ -96,43 +163,24 @@ def load_distributions(context: BuildContext) -> BuildContext:
             step_message=None,
         )
 
-    # Now, safely attempt to extract the description for the current context.distribution
+    # Explain a missing description for the current context.distribution
     current_dist_name = context.distribution
-    dist_description = None
-    try:
-        # Ensure distributions_data was actually populated before trying to access it
-        if context.distributions_data and current_dist_name in context.distributions_data:
-            distribution_info = context.distributions_data[current_dist_name]
-            if isinstance(distribution_info, dict):
-                dist_description = distribution_info.get("description")
-            else:
-                warning(f"Data for distribution '{current_dist_name}' in config/distributions.yaml is not structured as a dictionary; cannot get description.")
-        else:
-            # This warning might be redundant if distribution name validity is checked by Click against loaded choices first,
-            # but kept for safety if context.distribution could somehow be out of sync with loaded data.
-            if context.distributions_data: # Only warn if data was loaded but key is missing
-                warning(f"Distribution '{current_dist_name}' not found in loaded YAML data (config/distributions.yaml); cannot retrieve description.")
-            # If context.distributions_data is empty, the critical error above would have already been raised.
-
-    except Exception as e:
-        # Catch any unexpected error during the description extraction specifically
-        warning(f"Non-critical error while trying to extract description for distribution '{current_dist_name}'", str(e))
-        # dist_description will remain None or its last state
-
-    context.set_distribution_description_from_config(dist_description)
-    
+    raw_dist_info = context.distributions_data.get(current_dist_name)
+    dist_description = context.distribution_description
+
+    if raw_dist_info is None:
+        # This warning might be redundant if distribution name validity is checked by Click against loaded choices first,
+        # but kept for safety if context.distribution could somehow be out of sync with loaded data.
+        warning(f"Distribution '{current_dist_name}' not found in loaded YAML data (config/distributions.yaml); cannot retrieve description.")
+    elif not isinstance(raw_dist_info, dict):
+        warning(f"Data for distribution '{current_dist_name}' in config/distributions.yaml is not structured as a dictionary; cannot get description.")
+
     if dist_description:
         success(f"Loaded description for '{current_dist_name}'", f'"{dist_description}"')
-    else:
-        # Refined info/warning based on why description might be missing
-        if context.distributions_data and current_dist_name in context.distributions_data and \
-           isinstance(context.distributions_data.get(current_dist_name), dict) and \
-           "description" not in context.distributions_data[current_dist_name]:
-            info(f"No 'description' field found for distribution '{current_dist_name}' in config.")
-        elif not (context.distributions_data and current_dist_name in context.distributions_data):
-            # This case should have been covered by warnings above about dist not found in data.
-            info(f"Description for '{current_dist_name}' not available (distribution not found or data malformed).")
-        # else: already covered by other warnings or success message
+    elif raw_dist_info is None:
+        info("Description not available", f"Distribution '{current_dist_name}' not found in config")
+    elif isinstance(raw_dist_info, dict) and "description" not in raw_dist_info:
+        info("No description in config", f"Distribution '{current_dist_name}' has no 'description' field")
 
     return context
 
@@ -168,14 +216,14 @@ def determine_build_tags(context: BuildContext, tracker) -> BuildContext:
         buildtags_list = resolve_build_tags(
             context.distribution, context.distributions_data
         )
-        build_tags_string = ",".join(filter(None, buildtags_list))
+        # resolve_build_tags keeps empty entries (e.g. a bare "-" in the YAML)
+        build_tags_string = ",".join([t for t in buildtags_list if t])
 
         # Update the context
         context.set_build_tags(build_tags_string)
 
         # Also check for optional custom config file
-        dist_info = context.distributions_data.get(context.distribution, {})
-        config_file = dist_info.get("config-file")
+        config_file = context.dist_info.get("config-file")
         context.set_config_file(config_file)
 
         # Use the already imported success function
@@ -196,10 +244,3 @@ def determine_build_tags(context: BuildContext, tracker) -> BuildContext:
         raise TerminateApp(
             f"Error resolving build tags: {str(e)}", step_index=2, step_message=str(e)
         )
-    except Exception as e:
-        error("An unexpected error occurred resolving build tags", str(e))
-        raise TerminateApp(
-            f"An unexpected error occurred resolving build tags: {str(e)}",
-            step_index=2,
-            step_message=f"Unexpected error: {str(e)}",
-        )
@@ -1,5 +1,16 @@
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
+
+from scripts.otel_layer_utils.distribution_utils import (
+    load_distributions as _load_distributions_utils,
+    load_single_distribution as _load_single_distribution,
+    DistributionError,
+)
+from scripts.otel_layer_utils.ui_utils import detail
+from ._paths import DIST_YAML_PATH, REPO_ROOT
+
+# Marks a lazily loaded BuildContext value that has not been computed yet
+_UNSET = object()
 
 
 class BuildContext:
@@ -8,6 +19,41 @@ class BuildContext:
     This replaces passing many individual variables between functions.
     """
 
+    __slots__ = (
+        "distribution",
+        "architecture",
+        "upstream_repo",
+        "upstream_ref",
+        "layer_name",
+        "runtimes",
+        "skip_publish",
+        "verbose",
+        "_public",
+        "public_str",
+        "keep_temp",
+        "skip_aws_checks",
+        "reuse_upstream",
+        "repo_root",
+        "_build_dir",
+        "_scripts_dir",
+        "temp_upstream_dir",
+        "temp_upstream_path",
+        "upstream_version",
+        "build_tags_string",
+        "layer_file",
+        "layer_file_size",
+        "layer_arn",
+        "aws_region",
+        "_dynamodb_region",
+        "dynamodb_region_str",
+        "start_time",
+        "config_file",
+        # Backing slots for the lazily loaded properties below
+        "_distributions_data",
+        "_dist_info",
+        "_distribution_description",
+    )
+
     def __init__(
         self,
         distribution: str,
@@ -20,6 +66,8 @@ class BuildContext:
         verbose: bool,
         public: bool,
         keep_temp: bool,
+        skip_aws_checks: bool = False,
+        reuse_upstream: Optional[str] = None,
     ):
         # CLI parameters
         self.distribution = distribution
@@ -32,31 +80,126 @@ class BuildContext:
         self.verbose = verbose
         self.public = public
         self.keep_temp = keep_temp
+        self.skip_aws_checks = skip_aws_checks
+        self.reuse_upstream = reuse_upstream
 
-        # Paths
-        self.repo_root = Path().cwd()
-        self.build_dir = self.repo_root / "build"
-        self.scripts_dir = self.repo_root / "tools" / "scripts"
+        # Paths (derived paths are resolved on first access)
+        self.repo_root = REPO_ROOT
+        self._build_dir = _UNSET
+        self._scripts_dir = _UNSET
 
         # Runtime state
+        self._distributions_data = _UNSET
+        self._dist_info = _UNSET
+        self._distribution_description = _UNSET
         self.temp_upstream_dir: Optional[str] = None
+        self.temp_upstream_path: Optional[Path] = None
         self.upstream_version: Optional[str] = None
         self.build_tags_string: Optional[str] = None
-        self.distributions_data: Dict = {}
-        self.distribution_description_from_config: Optional[str] = None
         self.layer_file: Optional[Path] = None
         self.layer_file_size: Optional[int] = None
         self.layer_arn: Optional[str] = None
         self.aws_region: Optional[str] = None
-        self.dynamodb_region: Optional[str] = None
+        self.dynamodb_region = None
         self.start_time = None
 
         # Optional custom config file name (relative, e.g., 'clickhouse.yaml')
         self.config_file: Optional[str] = None
 
-    def set_temp_dir(self, temp_dir: str) -> None:
+    @property
+    def build_dir(self) -> Path:
+        """Directory for build outputs, <repo_root>/build unless overridden."""
+        if self._build_dir is _UNSET:
+            self._build_dir = self.repo_root / "build"
+        return self._build_dir
+
+    @build_dir.setter
+    def build_dir(self, path: Path) -> None:
+        self._build_dir = path
+
+    @property
+    def scripts_dir(self) -> Path:
+        """Directory holding the build scripts, <repo_root>/tools/scripts unless overridden."""
+        if self._scripts_dir is _UNSET:
+            self._scripts_dir = self.repo_root / "tools" / "scripts"
+        return self._scripts_dir
+
+    @scripts_dir.setter
+    def scripts_dir(self, path: Path) -> None:
+        self._scripts_dir = path
+
+    @property
+    def public(self) -> bool:
+        """Whether the layer is made public; public_str holds its CLI form."""
+        return self._public
+
+    @public.setter
+    def public(self, public: bool) -> None:
+        self._public = public
+        self.public_str = "true" if public else "false"
+
+    @property
+    def dynamodb_region(self) -> Optional[str]:
+        """DynamoDB region; dynamodb_region_str holds its display form."""
+        return self._dynamodb_region
+
+    @dynamodb_region.setter
+    def dynamodb_region(self, region: Optional[str]) -> None:
+        self._dynamodb_region = region
+        self.dynamodb_region_str = str(region)
+
+    @property
+    def distributions_data(self) -> Dict:
+        """Distributions configuration, loaded from config/distributions.yaml on first access."""
+        if self._distributions_data is _UNSET:
+            self._distributions_data = _load_distributions_utils(DIST_YAML_PATH)
+        return self._distributions_data
+
+    @distributions_data.setter
+    def distributions_data(self, data: Dict) -> None:
+        self._distributions_data = data
+        # Re-derive the entry and description from the new data on next access
+        self._dist_info = _UNSET
+        self._distribution_description = _UNSET
+
+    @property
+    def dist_info(self) -> Dict:
+        """The selected distribution's entry in distributions_data ({} if missing or malformed)."""
+        if self._dist_info is _UNSET:
+            dist_info = self.distributions_data.get(self.distribution)
+            self._dist_info = dist_info if isinstance(dist_info, dict) else {}
+        return self._dist_info
+
+    @property
+    def distribution_description(self) -> Optional[str]:
+        """Description of the selected distribution from the config, if any."""
+        if self._distribution_description is _UNSET:
+            self._distribution_description = self._load_distribution_description()
+        return self._distribution_description
+
+    @distribution_description.setter
+    def distribution_description(self, description: Optional[str]) -> None:
+        self._distribution_description = description
+
+    # Former attribute name, kept for existing callers
+    distribution_description_from_config = distribution_description
+
+    def _load_distribution_description(self) -> Optional[str]:
+        """Look up the selected distribution's description in the config."""
+        if self._distributions_data is not _UNSET:
+            return self.dist_info.get("description")
+        try:
+            # Only this distribution is needed, so skip building the whole file
+            dist_info = _load_single_distribution(DIST_YAML_PATH, self.distribution)
+        except DistributionError:
+            # The description is informational; load_distributions reports load errors
+            return None
+        return dist_info.get("description") if dist_info else None
+
+    def set_temp_dir(self, temp_dir: Union[str, Path, None]) -> None:
         """Set the temporary directory for the upstream clone."""
-        self.temp_upstream_dir = temp_dir
+        self.temp_upstream_path = Path(temp_dir) if temp_dir is not None else None
+        self.temp_upstream_dir = str(temp_dir) if temp_dir is not None else None
 
     def set_upstream_version(self, version: str) -> None:
         """Set the upstream version."""
@@ -67,12 +210,15 @@ class BuildContext:
         self.build_tags_string = tags
 
     def set_distributions_data(self, data: Dict) -> None:
-        """Set the distributions data."""
+        """Set the distributions data, overriding the lazily loaded config."""
         self.distributions_data = data
 
-    def set_distribution_description_from_config(self, description: Optional[str]) -> None:
-        """Set the distribution description loaded from the config file."""
-        self.distribution_description_from_config = description
+    def set_distribution_description(self, description: Optional[str]) -> None:
+        """Set the distribution description, overriding the one from the config."""
+        self.distribution_description = description
+
+    # Former setter name, kept for existing callers
+    set_distribution_description_from_config = set_distribution_description
 
     def set_layer_file(self, file_path: Path, size: int) -> None:
         """Set the built layer file and its size."""
@@ -89,8 +235,6 @@ class BuildContext:
 
     def set_dynamodb_region(self, region: str) -> None:
         """Set the DynamoDB region."""
-        from scripts.otel_layer_utils.ui_utils import detail
-
         if self.verbose:
             detail("Setting DynamoDB region", f"region={region}")
         self.dynamodb_region = region
@@ -2,23 +2,48 @@
 
 import re
 import sys
+from itertools import chain
 
 from scripts.otel_layer_utils.ui_utils import (
     header,
     subheader,
     status,
     info,
-    detail,
+    details,
     error,
     warning,
     success,
     separator,
 )
-from scripts.otel_layer_utils.subprocess_utils import run_command
+from scripts.otel_layer_utils.subprocess_utils import (
+    default_stream_bufsize,
+    run_command,
+)
 from .context import BuildContext
 from .exceptions import TerminateApp
 from .testing import inject_error
 
+# Publisher flags, in the order their values are built in publish_layer
+_PUBLISH_FLAGS = (
+    "--layer-name",
+    "--artifact-name",
+    "--region",
+    "--dynamodb-region",
+    "--architecture",
+    "--runtimes",
+    "--release-group",
+    "--distribution",
+    "--collector-version",
+    "--make-public",
+    "--build-tags",
+)
+
+# Fallback for reading the published ARN from the publisher's output
+_ARN_MARKER = "Published Layer ARN:"
+_ARN_RE = re.compile(
+    r"Published Layer ARN: (arn:aws:lambda:[^:]+:[^:]+:layer:[^:]+:[0-9]+)"
+)
+
 
 @inject_error(step_index=4)
 def publish_layer(context: BuildContext, tracker) -> BuildContext:
@@ -55,57 +80,58 @@ def publish_layer(context: BuildContext, tracker) -> BuildContext:
     # Sub-step: Prepare Publish Environment
     subheader("Preparing for publish")
 
+    layer_file_str = str(context.layer_file)
+
     # Print debug info if verbose
     if context.verbose:
         info("Debug info", "Publishing with parameters:")
-        detail("Layer name", context.layer_name)
-        detail("Artifact", str(context.layer_file))
-        detail("Region", context.aws_region)
-        detail("DynamoDB Region", str(context.dynamodb_region))
-        detail("Architecture", context.architecture)
-        detail("Runtimes", context.runtimes)
-        detail("Release group", "local")
-        detail("Distribution", context.distribution)
-        detail("Collector version", context.upstream_version)
-        detail("Build tags", context.build_tags_string)
-        detail("Make public", str(context.public).lower())
-        detail("Distribution Description (from config)", context.distribution_description_from_config or "[Not set in context]")
+        details(
+            [
+                ("Layer name", context.layer_name),
+                ("Artifact", layer_file_str),
+                ("Region", context.aws_region),
+                ("DynamoDB Region", context.dynamodb_region_str),
+                ("Architecture", context.architecture),
+                ("Runtimes", context.runtimes),
+                ("Release group", "local"),
+                ("Distribution", context.distribution),
+                ("Collector version", context.upstream_version),
+                ("Build tags", context.build_tags_string),
+                ("Make public", context.public_str),
+                (
+                    "Distribution Description (from config)",
+                    context.distribution_description or "[Not set in context]",
+                ),
+            ]
+        )
 
     # Sub-step: Execute Publish Script
     subheader("Publishing layer")
     publisher_script = context.scripts_dir / "lambda_layer_publisher.py"
 
     # Build command with all arguments including build-tags
-    publish_cmd = [
-        sys.executable,
-        str(publisher_script),
-        "--layer-name",
+    values = (
         context.layer_name,
-        "--artifact-name",
-        str(context.layer_file),
-        "--region",
+        layer_file_str,
         context.aws_region,
-        "--dynamodb-region",
         context.dynamodb_region,
-        "--architecture",
         context.architecture,
-        "--runtimes",
         context.runtimes,
-        "--release-group",
         "local",  # Always use 'local' for testing
-        "--distribution",
         context.distribution,
-        "--collector-version",
         context.upstream_version,
-        "--make-public",
-        str(context.public).lower(),
-        "--build-tags",
+        context.public_str,
         context.build_tags_string,
+    )
+    publish_cmd = [
+        sys.executable,
+        str(publisher_script),
+        *chain.from_iterable(zip(_PUBLISH_FLAGS, values)),
     ]
 
     # Add distribution-description if available in context
-    if context.distribution_description_from_config:
-        publish_cmd.extend(["--distribution-description", context.distribution_description_from_config])
+    if context.distribution_description:
+        publish_cmd.extend(["--distribution-description", context.distribution_description])
 
     try:
         # Run publish script
@@ -113,16 +139,16 @@ def publish_layer(context: BuildContext, tracker) -> BuildContext:
             publish_cmd,
             capture_github_env=True,
             capture_output=False,  # Don't capture output since this script uses spinners
+            stream_bufsize=default_stream_bufsize(),
         )
 
         # Display layer information from GitHub environment variables or stdout
         layer_arn = github_env.get("layer_arn")
-        if not layer_arn:
-            # Fallback: Try to extract from stdout
-            arn_match = re.search(
-                r"Published Layer ARN: (arn:aws:lambda:[^:]+:[^:]+:layer:[^:]+:[0-9]+)",
-                publish_result.stdout,
-            )
+        # Fallback: Try to extract from stdout. Output is not captured, so this
+        # only applies if the process object carries it anyway.
+        stdout = publish_result.stdout
+        if not layer_arn and stdout and _ARN_MARKER in stdout:
+            arn_match = _ARN_RE.search(stdout)
             if arn_match:
                 layer_arn = arn_match.group(1)
 
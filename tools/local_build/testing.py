@@ -4,8 +4,13 @@ import os
 import functools
 from typing import Optional, Any, Callable
 
+from scripts.otel_layer_utils.ui_utils import warning
 from .exceptions import TerminateApp
 
+# Error injection target, read once at import time. The variable is set for
+# the whole process when testing, so it cannot change between calls.
+_INJECT_ERROR_TARGET = os.environ.get("LOCAL_BUILD_INJECT_ERROR")
+
 
 def inject_error(step_index: Optional[int] = None, step_message: Optional[str] = None):
     """
@@ -18,37 +23,34 @@ def inject_error(step_index: Optional[int] = None, step_message: Optional[str] =
     The actual error injection is controlled by setting an environment variable:
     LOCAL_BUILD_INJECT_ERROR=function_name
 
+    Functions other than the targeted one are returned unchanged.
+
     Example:
         To test a failure in clone_repository:
         $ LOCAL_BUILD_INJECT_ERROR=clone_repository uv run tools/ocelot.py
     """
 
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Get the function name
-            func_name = func.__name__
-
-            # Check if error injection is enabled for this function
-            error_target = os.environ.get("LOCAL_BUILD_INJECT_ERROR")
-            if error_target and error_target == func_name:
-                # Generate clear error message that indicates this is a simulated error
-                error_msg = f"SIMULATED ERROR: Injected test failure in '{func_name}'"
+        func_name = func.__name__
 
-                # Log information about the simulated error
-                from scripts.otel_layer_utils.ui_utils import warning
+        # Only the targeted function gets a wrapper; everything else is untouched
+        if _INJECT_ERROR_TARGET != func_name:
+            return func
 
-                warning(f"Injecting simulated error in '{func_name}' function")
-
-                # Raise the error with the appropriate step information
-                raise TerminateApp(
-                    error_msg,
-                    step_index=step_index,
-                    step_message=f"Simulated failure in {func_name}",
-                )
-
-            # Normal execution if not injecting error
-            return func(*args, **kwargs)
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            # Generate clear error message that indicates this is a simulated error
+            error_msg = f"SIMULATED ERROR: Injected test failure in '{func_name}'"
+
+            # Log information about the simulated error
+            warning(f"Injecting simulated error in '{func_name}' function")
+
+            # Raise the error with the appropriate step information
+            raise TerminateApp(
+                error_msg,
+                step_index=step_index,
+                step_message=f"Simulated failure in {func_name}",
+            )
 
         return wrapper
 
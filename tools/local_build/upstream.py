@@ -1,7 +1,14 @@
 """Upstream repository management for the local build process."""
 
 from pathlib import Path
+import json
+import os
+import re
+import shutil
+import subprocess
 import tempfile
+import threading
+from typing import Any, Dict, Optional
 
 from scripts.otel_layer_utils.ui_utils import (
     status,
@@ -10,12 +17,29 @@ from scripts.otel_layer_utils.ui_utils import (
     error,
     success,
     debug,
+    warning,
 )
 from scripts.otel_layer_utils.subprocess_utils import run_command
+from ._paths import CACHE_DIR
 from .context import BuildContext
 from .exceptions import TerminateApp
 from .testing import inject_error
 
+# Literal version assignment in the upstream collector Makefile, e.g.
+# "OTELCOL_VERSION ?= v0.119.0". Computed values ("$(shell ...)") don't match.
+_OTELCOL_VERSION_RE = re.compile(
+    r"^OTELCOL_VERSION\s*[:?]?=\s*([^\s$#]+)[ \t]*(?:#.*)?$", re.MULTILINE
+)
+
+# Versions resolved on previous runs, keyed by "<repo>@<ref>", stored in the
+# build directory so a re-run against an unchanged ref can skip the clone.
+_VERSION_CACHE_FILE = ".upstream-version-cache.json"
+_SHA_RE = re.compile(r"[0-9a-f]{40}")
+
+# Persistent bare mirrors of upstream repositories, reused across runs so the
+# network is only hit for an incremental fetch.
+MIRROR_CACHE_DIR = CACHE_DIR
+
 
 @inject_error(step_index=0)
 def clone_repository(context: BuildContext, tracker) -> BuildContext:
@@ -36,9 +60,41 @@ def clone_repository(context: BuildContext, tracker) -> BuildContext:
     tracker.start_step(0)
     subheader("Cloning repository")
 
-    # Create temporary directory
-    temp_upstream_dir = tempfile.mkdtemp(prefix="otel-upstream-")
-    temp_upstream_path = Path(temp_upstream_dir)
+    if context.reuse_upstream:
+        reuse_path = Path(context.reuse_upstream)
+        if (reuse_path / "collector" / "Makefile").is_file():
+            return _reuse_checkout(context, tracker, reuse_path)
+        warning(
+            "Not reusing upstream checkout",
+            f"{reuse_path} has no collector/Makefile, cloning instead",
+        )
+
+    repo_url = f"https://github.com/{context.upstream_repo}.git"
+    cache_path = context.build_dir / _VERSION_CACHE_FILE
+    cache_key = f"{context.upstream_repo}@{context.upstream_ref}"
+    resolved_sha = _resolve_remote_sha(repo_url, context.upstream_ref)
+    version_cache = _load_version_cache(cache_path)
+
+    cached = version_cache.get(cache_key)
+    if (
+        resolved_sha
+        and isinstance(cached, dict)
+        and cached.get("resolved_sha") == resolved_sha
+        and cached.get("version")
+    ):
+        status("Target repo", f"{context.upstream_repo}@{context.upstream_ref}")
+        info("Resolved commit", resolved_sha)
+        return _use_version_without_clone(
+            context,
+            tracker,
+            cached["version"],
+            f"Skipped (cached for {resolved_sha[:12]})",
+            "cached",
+        )
+
+    # Create temporary directory, on tmpfs when available
+    temp_base = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+    temp_upstream_dir = tempfile.mkdtemp(prefix="otel-upstream-", dir=temp_base)
 
     # Store in context
     context.set_temp_dir(temp_upstream_dir)
@@ -47,35 +103,241 @@ def clone_repository(context: BuildContext, tracker) -> BuildContext:
     status("Target repo", f"{context.upstream_repo}@{context.upstream_ref}")
     info("Temp directory", temp_upstream_dir)
 
-    # Clone the repository
-    repo_url = f"https://github.com/{context.upstream_repo}.git"
+    # Refresh the local mirror, then clone the working copy from it. Only
+    # collector/ is read afterwards, so materialize just that directory.
+    mirror_path = MIRROR_CACHE_DIR / f"{context.upstream_repo}.git"
+    clone_path = temp_upstream_dir
+    try:
+        _update_mirror(repo_url, mirror_path, context.upstream_ref)
+        _clone_working_copy(mirror_path, clone_path, context.upstream_ref)
+        tracker.complete_step(0, "Repository cloned successfully")
+    except Exception as e:
+        error(f"Failed to clone repository {repo_url}", str(e))
+        # The temp dir may be on tmpfs; don't leave a partial clone in memory
+        shutil.rmtree(temp_upstream_dir, ignore_errors=True)
+        context.set_temp_dir(None)
+        raise TerminateApp(
+            f"Failed to clone repository: {str(e)}",
+            step_index=0,
+            step_message=f"Failed to clone repository: {str(e)}",
+        )
+
+    # Get upstream version from the cloned repository
+    context = determine_upstream_version(context, tracker)
+
+    if resolved_sha and context.upstream_version:
+        _save_version_cache(
+            cache_path, version_cache, cache_key, context.upstream_version, resolved_sha
+        )
+
+    return context
+
+
+def _reuse_checkout(context: BuildContext, tracker, reuse_path: Path) -> BuildContext:
+    """
+    Update an existing upstream checkout to the requested ref instead of cloning.
+
+    Args:
+        context: The build context
+        tracker: Step tracker for progress reporting
+        reuse_path: Path to the existing checkout
+
+    Returns:
+        BuildContext: Updated build context with upstream directory and version
+
+    Raises:
+        TerminateApp: If updating the checkout or version determination fails
+    """
+    status("Target repo", f"{context.upstream_repo}@{context.upstream_ref}")
+    info("Reusing checkout", str(reuse_path))
     try:
+        git_cmd = ["git", "-C", str(reuse_path)]
+        run_command(
+            git_cmd + ["fetch", "--depth", "1", "origin", context.upstream_ref],
+            capture_output=True,
+        )
+        run_command(git_cmd + ["reset", "--hard", "FETCH_HEAD"], capture_output=True)
+    except Exception as e:
+        error(f"Failed to update checkout {reuse_path}", str(e))
+        raise TerminateApp(
+            f"Failed to update checkout: {str(e)}",
+            step_index=0,
+            step_message=f"Failed to update checkout: {str(e)}",
+        )
+    context.set_temp_dir(reuse_path)
+    tracker.complete_step(0, "Existing checkout updated")
+
+    return determine_upstream_version(context, tracker)
+
+
+def _use_version_without_clone(
+    context: BuildContext, tracker, version: str, clone_message: str, source: str
+) -> BuildContext:
+    """
+    Record an upstream version obtained without cloning and complete steps 0-1.
+
+    Args:
+        context: The build context
+        tracker: Step tracker for progress reporting
+        version: The upstream version
+        clone_message: Completion message for the skipped clone step
+        source: Where the version came from, shown next to it
+
+    Returns:
+        BuildContext: Updated build context with upstream version
+    """
+    tracker.complete_step(0, clone_message)
+    tracker.start_step(1)
+    context.set_upstream_version(version)
+    success("Determined Upstream Version", f"{version} ({source})")
+    tracker.complete_step(1, f"Version: {version} ({source})")
+    return context
+
+
+def _clone_working_copy(mirror_path: Path, clone_path: str, ref: str) -> None:
+    """
+    Clone the working copy from the local mirror, materializing only collector/.
+
+    Args:
+        mirror_path: Location of the bare mirror
+        clone_path: Destination of the working copy
+        ref: Branch or tag to check out
+    """
+    run_command(
+        [
+            "git",
+            "clone",
+            "--no-checkout",
+            "--sparse",
+            "--depth",
+            "1",
+            "--branch",
+            ref,
+            mirror_path.as_uri(),
+            clone_path,
+        ],
+        capture_output=True,
+    )
+    git_cmd = ["git", "-C", clone_path]
+    run_command(
+        git_cmd + ["sparse-checkout", "set", "--cone", "collector"],
+        capture_output=True,
+    )
+    run_command(git_cmd + ["checkout", ref], capture_output=True)
+
+
+def _update_mirror(repo_url: str, mirror_path: Path, ref: str) -> None:
+    """
+    Create or refresh the local bare mirror of the upstream repository.
+
+    Args:
+        repo_url: The upstream repository URL
+        mirror_path: Location of the bare mirror
+        ref: Branch or tag to fetch into the mirror
+    """
+    if (mirror_path / "HEAD").is_file():
+        info("Updating mirror", str(mirror_path))
+        fetch_cmd = ["git", "-C", str(mirror_path), "fetch", "--depth", "1", "origin"]
+        # The ref may name a branch or a tag; try the branch first.
+        result = run_command(
+            fetch_cmd + [f"+refs/heads/{ref}:refs/heads/{ref}"],
+            check=False,
+            capture_output=True,
+        )
+        if result.returncode != 0:
+            run_command(
+                fetch_cmd + [f"+refs/tags/{ref}:refs/tags/{ref}"],
+                capture_output=True,
+            )
+    else:
+        info("Creating mirror", str(mirror_path))
+        mirror_path.parent.mkdir(parents=True, exist_ok=True)
         run_command(
             [
                 "git",
                 "clone",
+                "--bare",
                 "--depth",
                 "1",
                 "--branch",
-                context.upstream_ref,
+                ref,
                 repo_url,
-                str(temp_upstream_path),
+                str(mirror_path),
             ],
             capture_output=True,
         )
-        tracker.complete_step(0, "Repository cloned successfully")
+
+
+def _resolve_remote_sha(repo_url: str, ref: str) -> Optional[str]:
+    """
+    Resolve a ref to its commit SHA without cloning.
+
+    Args:
+        repo_url: The repository URL
+        ref: Branch, tag or commit SHA
+
+    Returns:
+        Optional[str]: The commit SHA, or None if it could not be resolved
+    """
+    if _SHA_RE.fullmatch(ref):
+        return ref
+
+    try:
+        result = run_command(["git", "ls-remote", repo_url, ref], capture_output=True)
     except Exception as e:
-        error(f"Failed to clone repository {repo_url}", str(e))
-        raise TerminateApp(
-            f"Failed to clone repository: {str(e)}",
-            step_index=0,
-            step_message=f"Failed to clone repository: {str(e)}",
-        )
+        debug(f"git ls-remote failed, not using the version cache: {e}")
+        return None
 
-    # Get upstream version from the cloned repository
-    context = determine_upstream_version(context, tracker)
+    stdout = result.stdout if isinstance(result.stdout, str) else ""
+    # Prefer the peeled commit of an annotated tag over the tag object itself
+    shas = {}
+    for line in stdout.splitlines():
+        parts = line.split()
+        if len(parts) == 2:
+            shas[parts[1]] = parts[0]
+    for name, sha in shas.items():
+        if name.endswith("^{}"):
+            return sha
+    return next(iter(shas.values()), None)
 
-    return context
+
+def _load_version_cache(cache_path: Path) -> Dict[str, Any]:
+    """
+    Load the upstream version cache, returning an empty cache if unusable.
+
+    Args:
+        cache_path: Path to the cache file
+
+    Returns:
+        Dict[str, Any]: Cache entries keyed by "<repo>@<ref>"
+    """
+    try:
+        with open(cache_path, "r") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_version_cache(
+    cache_path: Path, cache: Dict[str, Any], key: str, version: str, sha: str
+) -> None:
+    """
+    Add an entry to the upstream version cache and write it. Failures are not fatal.
+
+    Args:
+        cache_path: Path to the cache file
+        cache: Cache entries keyed by "<repo>@<ref>"
+        key: The "<repo>@<ref>" key to store
+        version: The upstream version
+        sha: The commit SHA the ref resolved to
+    """
+    cache[key] = {"version": version, "resolved_sha": sha}
+    try:
+        with open(cache_path, "w") as f:
+            json.dump(cache, f, indent=2)
+    except OSError as e:
+        debug(f"Could not write upstream version cache: {e}")
 
 
 @inject_error(step_index=1)
@@ -83,6 +345,9 @@ def determine_upstream_version(context: BuildContext, tracker) -> BuildContext:
     """
     Determine the upstream version from the cloned repository.
 
+    The version is read from the collector Makefile when it is defined there;
+    otherwise the set-otelcol-version make target is run to produce VERSION.
+
     Args:
         context: The build context
         tracker: Step tracker for progress reporting
@@ -93,23 +358,53 @@ def determine_upstream_version(context: BuildContext, tracker) -> BuildContext:
     Raises:
         TerminateApp: If version determination fails
     """
-    temp_upstream_path = Path(context.temp_upstream_dir)
-    upstream_collector_dir = temp_upstream_path / "collector"
+    upstream_collector_dir = context.temp_upstream_path / "collector"
     upstream_makefile = upstream_collector_dir / "Makefile"
-    upstream_version_file = upstream_collector_dir / "VERSION"
 
     # Start the version determination step
     tracker.start_step(1)
     subheader("Determining version")
 
-    # Check if Makefile exists
-    if not upstream_makefile.exists():
+    # Read the Makefile
+    try:
+        makefile_text = upstream_makefile.read_text()
+    except FileNotFoundError:
         error("Makefile not found", f"{upstream_makefile}")
         debug(f"Looking for Makefile at {upstream_makefile}")
         raise TerminateApp(
             "Makefile not found", step_index=1, step_message="Makefile not found"
         )
 
+    match = _OTELCOL_VERSION_RE.search(makefile_text)
+    if match:
+        upstream_version = match.group(1)
+    else:
+        debug("OTELCOL_VERSION not set in Makefile, running set-otelcol-version")
+        upstream_version = _run_set_otelcol_version(upstream_collector_dir)
+
+    # Update context with version
+    context.set_upstream_version(upstream_version)
+    success("Determined Upstream Version", upstream_version)
+    tracker.complete_step(1, f"Version: {upstream_version}")
+
+    return context
+
+
+def _run_set_otelcol_version(upstream_collector_dir: Path) -> str:
+    """
+    Run the set-otelcol-version make target and read the VERSION file it writes.
+
+    Args:
+        upstream_collector_dir: The collector directory of the upstream clone
+
+    Returns:
+        str: The upstream version
+
+    Raises:
+        TerminateApp: If make fails or VERSION is missing or empty
+    """
+    upstream_version_file = upstream_collector_dir / "VERSION"
+
     # Run the set-otelcol-version make target
     try:
         run_command(
@@ -125,34 +420,17 @@ def determine_upstream_version(context: BuildContext, tracker) -> BuildContext:
             step_message=f"Failed to run make: {str(e)}",
         )
 
-    # Check if VERSION file was created
-    if not upstream_version_file.is_file():
+    # Read version from VERSION file
+    try:
+        with open(upstream_version_file, "r") as vf:
+            upstream_version = vf.read().strip()
+    except (FileNotFoundError, IsADirectoryError):
         error("VERSION file not created", f"{upstream_version_file}")
         raise TerminateApp(
             "VERSION file not created",
             step_index=1,
             step_message="VERSION file not created",
         )
-
-    # Read version from VERSION file
-    try:
-        with open(upstream_version_file, "r") as vf:
-            upstream_version = vf.read().strip()
-
-        if not upstream_version:
-            error("VERSION file is empty", f"{upstream_version_file}")
-            raise TerminateApp(
-                "VERSION file is empty",
-                step_index=1,
-                step_message="VERSION file is empty",
-            )
-
-        # Update context with version
-        context.set_upstream_version(upstream_version)
-        success("Determined Upstream Version", upstream_version)
-        tracker.complete_step(1, f"Version: {upstream_version}")
-
-        return context
     except Exception as e:
         error("Failed to read VERSION file", str(e))
         raise TerminateApp(
@@ -161,20 +439,65 @@ def determine_upstream_version(context: BuildContext, tracker) -> BuildContext:
             step_message=f"Failed to read VERSION: {str(e)}",
         )
 
+    if not upstream_version:
+        error("VERSION file is empty", f"{upstream_version_file}")
+        raise TerminateApp(
+            "VERSION file is empty",
+            step_index=1,
+            step_message="VERSION file is empty",
+        )
+
+    return upstream_version
+
 
 def cleanup_temp_dir(context: BuildContext) -> None:
     """
     Clean up temporary directory if needed.
 
+    The directory is renamed out of the way and deleted in the background so
+    the process does not wait on removing the clone.
+
     Args:
         context: The build context
     """
-    import shutil
-
-    if context.temp_upstream_dir and Path(context.temp_upstream_dir).exists():
+    if context.temp_upstream_path and context.temp_upstream_path.exists():
+        if context.reuse_upstream and context.temp_upstream_path == Path(
+            context.reuse_upstream
+        ):
+            # Never remove a checkout the user asked to reuse
+            return
         if context.keep_temp:
             info("Keeping temporary upstream clone", context.temp_upstream_dir)
         else:
             subheader("Cleaning up")
             status("Removing temporary upstream clone", context.temp_upstream_dir)
-            shutil.rmtree(context.temp_upstream_dir)
+            _remove_in_background(context.temp_upstream_dir)
+
+
+def _remove_in_background(path: str) -> None:
+    """
+    Remove a directory tree without blocking the caller.
+
+    Args:
+        path: The directory to remove
+    """
+    doomed = f"{path}.deleting-{os.getpid()}"
+    try:
+        os.rename(path, doomed)
+    except OSError as e:
+        debug(f"Could not rename {path} for background removal: {e}")
+        shutil.rmtree(path, ignore_errors=True)
+        return
+
+    if os.name == "nt":
+        # Non-daemon threads are joined at interpreter shutdown
+        threading.Thread(
+            target=shutil.rmtree, args=(doomed,), kwargs={"ignore_errors": True}
+        ).start()
+    else:
+        subprocess.Popen(
+            ["rm", "-rf", doomed],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
@@ -34,6 +34,7 @@ import sys
 import time
 import subprocess
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
@@ -46,13 +47,12 @@ sys.path.insert(0, str(Path(__file__).parent))  # Add tools directory
 from local_build.exceptions import TerminateApp
 from local_build.config import (
     load_distributions,
+    prefetch_distributions,
     determine_build_tags,
     load_distribution_choices,
 )
 from local_build.upstream import clone_repository, cleanup_temp_dir
 from local_build.build import build_layer
-from local_build.publish import publish_layer
-from local_build.report import generate_summary
 from local_build.context import BuildContext
 
 # Import from the UI utilities
@@ -62,6 +62,7 @@ from scripts.otel_layer_utils.ui_utils import (
     StepTracker,
     info,
     warning,
+    error,
 )
 
 # Check for error injection environment variable
@@ -130,6 +131,17 @@ ARCHITECTURE_CHOICES = ["amd64", "arm64"]
     is_flag=True,
     help="Keep temporary directories (e.g., upstream clone).",
 )
+@click.option(
+    "--skip-aws-checks",
+    is_flag=True,
+    help="Skip the AWS credentials check before publishing (for local testing).",
+)
+@click.option(
+    "--reuse-upstream",
+    type=click.Path(file_okay=False),
+    envvar="OCELOT_REUSE_UPSTREAM",
+    help="Update and reuse an existing upstream checkout instead of cloning.",
+)
 def main(
     distribution,
     architecture,
@@ -141,6 +153,8 @@ def main(
     verbose,
     public,
     keep_temp,
+    skip_aws_checks,
+    reuse_upstream,
 ):
     """Build and test custom OTel Collector distributions locally."""
 
@@ -162,6 +176,8 @@ def main(
         verbose=verbose,
         public=public,
         keep_temp=keep_temp,
+        skip_aws_checks=skip_aws_checks,
+        reuse_upstream=reuse_upstream,
     )
 
     # Ensure build directory exists
@@ -182,12 +198,16 @@ def main(
     tracker = StepTracker(build_steps, title="Build Process Steps")
 
     try:
-        # --- Step 0: Load Distribution Configuration ---
+        # --- Step 0: Clone Upstream Repository and Determine Version ---
+        # distributions.yaml is parsed in the background meanwhile; the clone
+        # does not touch the distribution fields of the context.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(prefetch_distributions, context)
+            context = clone_repository(context, tracker)
+
+        # --- Step 1: Load Distribution Configuration ---
         context = load_distributions(context)
 
-        # --- Step 1: Clone Upstream Repository and Determine Version ---
-        context = clone_repository(context, tracker)
-
         # --- Step 2: Determine Build Tags ---
         context = determine_build_tags(context, tracker)
 
@@ -199,6 +219,7 @@ def main(
             if context.verbose:
                 info("Build step", "Starting AWS credential verification")
             from local_build.aws import verify_credentials
+            from local_build.publish import publish_layer
 
             context = verify_credentials(context, tracker)
             if context.verbose:
@@ -206,12 +227,12 @@ def main(
             context = publish_layer(context, tracker)
 
         # --- Step 5: Generate Summary Report ---
+        from local_build.report import generate_summary
+
         generate_summary(context, start_time)
 
     except TerminateApp as e:
         # Display the error message if it hasn't been displayed yet
-        from scripts.otel_layer_utils.ui_utils import error
-
         error("Process terminated", e.message, exc_info=e)
 
         # Update the tracker if step information is provided
@@ -227,13 +248,9 @@ def main(
         sys.exit(e.exit_code)
     except subprocess.CalledProcessError as e:
         # Error message should have been printed by run_command
-        from scripts.otel_layer_utils.ui_utils import error
-
         error("An error occurred during execution", exc_info=e)
         sys.exit(1)
     except Exception as e:
-        from scripts.otel_layer_utils.ui_utils import error
-
         error("An unexpected error occurred", str(e), exc_info=e)
         sys.exit(1)
     finally:
@@ -246,12 +263,8 @@ if __name__ == "__main__":
         main()
     except TerminateApp as e:
         # Display the error if not already displayed
-        from scripts.otel_layer_utils.ui_utils import error
-
         error("Process terminated", e.message, exc_info=e)
         sys.exit(e.exit_code)
     except Exception as e:
-        from scripts.otel_layer_utils.ui_utils import error
-
         error("An unexpected error occurred", str(e), exc_info=e)
         sys.exit(1)
@@ -15,12 +15,17 @@ This is a maintenance utility to clean up old or unneeded Lambda layers.
 CAUTION: Use with care as layer deletion CANNOT be undone.
 """
 
-import boto3
 import fnmatch
+import functools
+import re
 import sys
+import threading
 import click
 from botocore.exceptions import ClientError
-from typing import Dict, List, Tuple
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
+from typing import Callable, Dict, List, Optional, Tuple
 from yaspin import yaspin
 
 # Import UI utilities from shared module
@@ -34,16 +39,14 @@ from scripts.otel_layer_utils.ui_utils import (
     warning,
     spinner,
     format_table,
+    progress_bar,
     StepTracker,
     set_verbose_mode,
     debug,
 )
 
-# Import DynamoDB utilities
-from scripts.otel_layer_utils.dynamodb_utils import delete_item
-
 # List of regions to query - keep in sync with publish workflow
-REGIONS = [
+REGIONS = (
     "ca-central-1",
     "ca-west-1",
     "eu-central-1",
@@ -57,7 +60,38 @@ REGIONS = [
     "us-east-1",
     "us-east-2",
     "us-west-2",
-]
+)
+
+# Layer summary table formatting
+_DATE_FMT = "%Y-%m-%d %H:%M:%S"
+_ARN_DISPLAY_MAX = 80
+
+# Shared boto3 session and per-region clients, created on first use.
+# boto3 is imported lazily so that --help does not pay for loading it.
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _session():
+    """Return the process-wide boto3 session, creating it on first use."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import boto3
+
+            _SESSION = boto3.Session()
+        return _SESSION
+
+
+@functools.lru_cache(maxsize=None)
+def _lambda_client(region: str):
+    """Return a cached Lambda client for the given region."""
+    from scripts.otel_layer_utils.boto_utils import client_config
+
+    session = _session()
+    # Sessions are not thread-safe, so client creation is serialized
+    with _SESSION_LOCK:
+        return session.client("lambda", region_name=region, config=client_config())
 
 
 def check_aws_cli() -> bool:
@@ -65,10 +99,11 @@ def check_aws_cli() -> bool:
     Check if AWS credentials are configured properly.
     """
     try:
-        # Create a boto3 session to check if credentials are available
+        # Use the shared boto3 session to check if credentials are available
         def check_credentials():
-            session = boto3.Session()
-            sts = session.client("sts")
+            from scripts.otel_layer_utils.boto_utils import client_config
+
+            sts = _session().client("sts", config=client_config())
             identity = sts.get_caller_identity()
             return identity.get("Account")
 
@@ -84,9 +119,103 @@ def check_aws_cli() -> bool:
         return False
 
 
+# Largest page size accepted by ListLayers / ListLayerVersions
+_PAGE_SIZE = 50
+
+
+def _list_layer_versions(lambda_client, layer_name: str) -> List[Dict]:
+    """
+    List all versions of a layer, following NextMarker manually.
+    """
+    versions = []
+    marker = None
+
+    while True:
+        kwargs = {"LayerName": layer_name, "MaxItems": _PAGE_SIZE}
+        if marker:
+            kwargs["Marker"] = marker
+
+        response = lambda_client.list_layer_versions(**kwargs)
+        for version in response["LayerVersions"]:
+            versions.append(
+                {
+                    "Version": version["Version"],
+                    "Arn": version["LayerVersionArn"],
+                    "CreatedDate": version.get("CreatedDate", "Unknown"),
+                }
+            )
+
+        marker = response.get("NextMarker")
+        if not marker:
+            break
+
+    return versions
+
+
+def _scan_region(
+    region: str, matcher: Callable[[str], Optional[re.Match]]
+) -> Tuple[List[Dict], List[Tuple[str, str]]]:
+    """
+    Find the layers whose name is accepted by the matcher in a single region.
+    Runs in a worker thread, so it reports problems back instead of printing them.
+
+    Returns:
+        Tuple[List[Dict], List[Tuple[str, str]]]: (matching layers, per-layer errors)
+    """
+    matching_layers = []
+    layer_errors = []
+
+    lambda_client = _lambda_client(region)
+
+    # List all layers, following NextMarker manually rather than through a
+    # paginator to avoid its per-page overhead
+    marker = None
+
+    while True:
+        kwargs = {"MaxItems": _PAGE_SIZE}
+        if marker:
+            kwargs["Marker"] = marker
+
+        response = lambda_client.list_layers(**kwargs)
+
+        # The first page doubles as a probe: regions without any layers
+        # (common for opt-in regions) are done after a single request
+        if marker is None and not response["Layers"]:
+            return matching_layers, layer_errors
+
+        for layer in response["Layers"]:
+            layer_name = layer["LayerName"]
+
+            # Check if the layer name matches the pattern
+            if matcher(layer_name):
+                # Get all versions of this layer
+                try:
+                    versions = _list_layer_versions(lambda_client, layer_name)
+
+                    matching_layers.append(
+                        {
+                            "Name": layer_name,
+                            "Region": region,
+                            "Versions": versions,
+                        }
+                    )
+
+                except ClientError as e:
+                    layer_errors.append(
+                        (f"Error getting versions for layer {layer_name}", str(e))
+                    )
+
+        marker = response.get("NextMarker")
+        if not marker:
+            break
+
+    return matching_layers, layer_errors
+
+
 def find_matching_layers(pattern: str) -> List[Dict]:
     """
     Find all Lambda layers that match the given glob pattern across all regions.
+    Regions are scanned concurrently, one worker per region.
     Returns a list of dicts containing layer info.
     """
     matching_layers = []
@@ -103,104 +232,113 @@ def find_matching_layers(pattern: str) -> List[Dict]:
         )
         return matching_layers
 
-    for region in REGIONS:
-        with yaspin(text=f"Searching in {region}...") as sp:
-            layers_found = 0
-            try:
-                # Create a Lambda client for the region
-                lambda_client = boto3.client("lambda", region_name=region)
-
-                # List all layers
-                paginator = lambda_client.get_paginator("list_layers")
-
-                for page in paginator.paginate():
-                    for layer in page["Layers"]:
-                        layer_name = layer["LayerName"]
-
-                        # Check if the layer name matches the pattern
-                        if fnmatch.fnmatch(layer_name, pattern):
-                            # Get all versions of this layer
-                            try:
-                                versions_paginator = lambda_client.get_paginator(
-                                    "list_layer_versions"
-                                )
-                                versions = []
-
-                                for version_page in versions_paginator.paginate(
-                                    LayerName=layer_name
-                                ):
-                                    for version in version_page["LayerVersions"]:
-                                        versions.append(
-                                            {
-                                                "Version": version["Version"],
-                                                "Arn": version["LayerVersionArn"],
-                                                "CreatedDate": version.get(
-                                                    "CreatedDate", "Unknown"
-                                                ),
-                                            }
-                                        )
-
-                                matching_layers.append(
-                                    {
-                                        "Name": layer_name,
-                                        "Region": region,
-                                        "Versions": versions,
-                                    }
-                                )
-
-                                layers_found += 1
-
-                            except ClientError as e:
-                                sp.fail("✗")
-                                error(
-                                    f"Error getting versions for layer {layer_name}",
-                                    str(e),
-                                )
+    # Translate the glob once instead of on every fnmatch call
+    matcher = re.compile(fnmatch.translate(pattern)).match
+
+    results = {}
+    region_errors = {}
+
+    # yaspin is not thread-safe, so a single spinner covers the whole fan-out
+    # and per-region results are written from the main thread as they arrive
+    with yaspin(text=f"Searching in {len(REGIONS)} regions...") as sp:
+        with ThreadPoolExecutor(max_workers=min(32, len(REGIONS))) as executor:
+            futures = {
+                executor.submit(_scan_region, region, matcher): region
+                for region in REGIONS
+            }
+            for future in as_completed(futures):
+                region = futures[future]
+                try:
+                    results[region] = future.result()
+                except ClientError as e:
+                    region_errors[region] = e
+                    sp.write(f"✗ Error searching in region {region}")
+                    continue
 
+                layers_found = len(results[region][0])
                 if layers_found:
-                    sp.text = f"Found {layers_found} layer(s) in {region}"
-                    sp.ok("✓")
+                    sp.write(f"✓ Found {layers_found} layer(s) in {region}")
                 else:
-                    sp.text = f"No matching layers in {region}"
-                    sp.ok("-")
+                    sp.write(f"- No matching layers in {region}")
+
+        if region_errors:
+            sp.fail("✗")
+        else:
+            sp.ok("✓")
+
+    # Report in the configured region order so output is deterministic
+    for region in REGIONS:
+        if region in region_errors:
+            error(f"Error searching in region {region}", str(region_errors[region]))
+            continue
 
-            except ClientError as e:
-                sp.fail("✗")
-                error(f"Error searching in region {region}", str(e))
+        region_layers, layer_errors = results[region]
+        for message, details in layer_errors:
+            error(message, details)
+        matching_layers.extend(region_layers)
 
     return matching_layers
 
 
-def delete_dynamodb_record(layer_arn: str, region: str) -> bool:
+def delete_dynamodb_records(layer_arns: List[str], region: str) -> int:
     """
-    Delete a record from DynamoDB using the layer ARN as the primary key.
+    Delete records from DynamoDB in batches using the layer ARNs as primary keys.
 
     Args:
-        layer_arn: The ARN of the layer to delete from DynamoDB
+        layer_arns: The ARNs of the layers to delete from DynamoDB
         region: The AWS region of the DynamoDB table
 
     Returns:
-        bool: True if deletion was successful, False otherwise
+        int: Number of records that could not be deleted
     """
+    # Imported here since dynamodb_utils loads boto3 at import time
+    from scripts.otel_layer_utils.dynamodb_utils import (
+        BatchDeleteError,
+        batch_delete_items,
+    )
+
     try:
-        # Call the updated delete_item with layer_arn and region
-        return delete_item(layer_arn=layer_arn, region=region)
-    except ClientError as e:
+        return len(batch_delete_items(layer_arns, region=region))
+    except BatchDeleteError as e:
+        # Earlier chunks may have been deleted; only count what was not
+        _report_dynamodb_error(e.__cause__, region)
+        return len(e.unprocessed)
+    except Exception as e:
+        _report_dynamodb_error(e, region)
+        return len(layer_arns)
+
+
+def _report_dynamodb_error(e: Exception, region: str) -> None:
+    """Log why DynamoDB records could not be deleted in a region."""
+    if isinstance(e, ClientError):
         error_code = e.response.get("Error", {}).get("Code", "")
         if error_code == "ResourceNotFoundException":
-            debug(f"DynamoDB record not found for {layer_arn}")
+            debug(f"DynamoDB table not found in {region}")
         elif error_code == "AccessDeniedException":
-            debug(f"Access denied to DynamoDB for {layer_arn}")
+            debug(f"Access denied to DynamoDB in {region}")
         else:
             debug(f"DynamoDB error: {e}")
-        return False
-    except Exception as e:
-        debug(f"Unexpected error deleting DynamoDB record: {e}")
-        return False
+    else:
+        debug(f"Unexpected error deleting DynamoDB records: {e}")
+
+
+def _delete_one(lambda_client, layer_name: str, version: Dict) -> None:
+    """
+    Delete a single layer version. Runs in a worker thread.
+
+    Raises:
+        ClientError: If the Lambda layer version could not be deleted
+    """
+    lambda_client.delete_layer_version(
+        LayerName=layer_name, VersionNumber=version["Version"]
+    )
 
 
 def delete_layers(
-    layers: List[Dict], dry_run: bool = False, skip_dynamodb: bool = False
+    layers: List[Dict],
+    dry_run: bool = False,
+    skip_dynamodb: bool = False,
+    total_versions: Optional[int] = None,
 ) -> Tuple[int, int, int, int]:
     """
     Delete the specified layers and all their versions, including DynamoDB records.
@@ -209,6 +347,7 @@ def delete_layers(
         layers: List of layer info dictionaries
         dry_run: If True, only simulate the deletion
         skip_dynamodb: If True, skip DynamoDB record deletion
+        total_versions: Total version count across layers, computed if not given
 
     Returns:
         Tuple[int, int, int, int]: (lambda_success, lambda_failure, dynamo_success, dynamo_failure)
@@ -236,78 +375,96 @@ def delete_layers(
 
     tracker = StepTracker(steps, title="Layer Deletion Steps")
 
-    for idx, layer in enumerate(layers):
-        region = layer["Region"]
-        layer_name = layer["Name"]
-        versions = layer["Versions"]
-
-        tracker.start_step(idx)
+    # Overall progress across all layers
+    if total_versions is None:
+        total_versions = sum(len(layer["Versions"]) for layer in layers)
 
-        if dry_run:
+    # Dry runs only report what discovery already found; no AWS clients needed
+    if dry_run:
+        for idx, layer in enumerate(layers):
+            tracker.start_step(idx)
+            versions_count = len(layer["Versions"])
             info(
                 "[DRY RUN]",
-                f"Would delete layer {layer_name} in {region} with {len(versions)} version(s)",
+                f"Would delete layer {layer['Name']} in {layer['Region']} with {versions_count} version(s)",
             )
-            lambda_success += len(versions)
-
             if not skip_dynamodb:
                 info(
                     "[DRY RUN]",
-                    f"Would delete DynamoDB records for {len(versions)} version(s)",
+                    f"Would delete DynamoDB records for {versions_count} version(s)",
                 )
-                dynamo_success += len(versions)
-
             tracker.complete_step(idx, "[DRY RUN] Deletion simulated")
-            continue
+
+        return (total_versions, 0, 0 if skip_dynamodb else total_versions, 0)
+
+    versions_done = 0
+
+    for idx, layer in enumerate(layers):
+        region = layer["Region"]
+        layer_name = layer["Name"]
+        versions = layer["Versions"]
+
+        tracker.start_step(idx)
 
         try:
-            lambda_client = boto3.client("lambda", region_name=region)
+            lambda_client = _lambda_client(region)
 
             versions_success = 0
             versions_failed = 0
             dynamo_versions_success = 0
             dynamo_versions_failed = 0
 
-            for version in versions:
-                version_number = version["Version"]
-                layer_arn = version["Arn"]
+            version_errors = []
+            deleted_arns = []
+
+            # Delete versions concurrently; progress is reported from the main
+            # thread on a single batch-wide progress line
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                futures = {
+                    executor.submit(
+                        _delete_one, lambda_client, layer_name, version
+                    ): version
+                    for version in versions
+                }
+                for future in as_completed(futures):
+                    version_number = futures[future]["Version"]
+                    try:
+                        future.result()
+                    except ClientError as e:
+                        version_errors.append((version_number, e))
+                        lambda_failure += 1
+                        versions_failed += 1
+                    else:
+                        lambda_success += 1
+                        versions_success += 1
+                        deleted_arns.append(futures[future]["Arn"])
+
+                    versions_done += 1
+                    progress_bar(
+                        versions_done,
+                        total_versions,
+                        prefix="Deleting versions",
+                        suffix=f"{versions_done}/{total_versions}",
+                    )
 
-                # Delete Lambda layer version
-                try:
-                    with yaspin(
-                        text=f"Deleting {layer_name} version {version_number} in {region}..."
-                    ) as sp:
-                        lambda_client.delete_layer_version(
-                            LayerName=layer_name, VersionNumber=version_number
-                        )
-                        sp.ok("✓")
-
-                    lambda_success += 1
-                    versions_success += 1
-
-                    # Delete DynamoDB record if requested
-                    if not skip_dynamodb:
-                        with yaspin(
-                            text=f"Deleting DynamoDB record for {layer_arn}..."
-                        ) as sp:
-                            # Pass the current region to delete_dynamodb_record
-                            if delete_dynamodb_record(layer_arn, region=region):
-                                sp.ok("✓")
-                                dynamo_success += 1
-                                dynamo_versions_success += 1
-                            else:
-                                sp.fail("✗")
-                                dynamo_failure += 1
-                                dynamo_versions_failed += 1
+            # Finish the progress line before the tracker renders below it
+            if versions_done < total_versions:
+                click.echo()
 
-                except ClientError as e:
-                    sp.fail("✗")
-                    error(
-                        f"Error deleting {layer_name} version {version_number} in {region}",
-                        str(e),
-                    )
-                    lambda_failure += 1
-                    versions_failed += 1
+            for version_number, e in sorted(version_errors, key=lambda x: x[0]):
+                error(
+                    f"Error deleting {layer_name} version {version_number} in {region}",
+                    str(e),
+                )
+
+            # Delete DynamoDB records for the deleted versions in batches
+            if not skip_dynamodb and deleted_arns:
+                dynamo_versions_failed = delete_dynamodb_records(
+                    deleted_arns, region=region
+                )
+                dynamo_versions_success = len(deleted_arns) - dynamo_versions_failed
+                dynamo_success += dynamo_versions_success
+                dynamo_failure += dynamo_versions_failed
 
             # Update step tracker with a better formatted result message
             has_failures = versions_failed > 0 or (
@@ -343,7 +500,7 @@ def delete_layers(
     return (lambda_success, lambda_failure, dynamo_success, dynamo_failure)
 
 
-def print_layer_summary(layers: List[Dict]):
+def print_layer_summary(layers: List[Dict], total_versions: Optional[int] = None):
     """
     Print a summary of layers that will be deleted.
     """
@@ -352,7 +509,8 @@ def print_layer_summary(layers: List[Dict]):
         return
 
     total_layers = len(layers)
-    total_versions = sum(len(layer["Versions"]) for layer in layers)
+    if total_versions is None:
+        total_versions = sum(len(layer["Versions"]) for layer in layers)
 
     header("LAYERS SUMMARY")
     status(
@@ -360,51 +518,49 @@ def print_layer_summary(layers: List[Dict]):
     )
 
     # Group by region for better organization
-    layers_by_region = {}
+    layers_by_region = defaultdict(list)
     for layer in layers:
-        region = layer["Region"]
-        if region not in layers_by_region:
-            layers_by_region[region] = []
-        layers_by_region[region].append(layer)
+        layers_by_region[layer["Region"]].append(layer)
 
     # Print by region
-    for region in sorted(layers_by_region.keys()):
+    for region in sorted(layers_by_region):
         subheader(f"Region: {region}")
 
         for layer in layers_by_region[region]:
             layer_name = layer["Name"]
-            versions = layer["Versions"]
 
             # Sort versions by number
-            versions.sort(key=lambda x: x["Version"])
+            versions = sorted(layer["Versions"], key=itemgetter("Version"))
 
             status("Layer", layer_name)
 
-            # Create a table for versions
+            # Create a table for versions, truncating long ARNs
             headers = ["Version", "Created Date", "ARN"]
-            rows = []
-            for version in versions:
-                version_number = version["Version"]
-                created_date = version["CreatedDate"]
-                arn = version["Arn"]
-
-                if isinstance(created_date, str):
-                    created_date_str = created_date
-                else:
-                    created_date_str = created_date.strftime("%Y-%m-%d %H:%M:%S")
-
-                # Truncate ARN if too long
-                arn_display = arn
-                if len(arn) > 80:
-                    arn_display = arn[:77] + "..."
-
-                rows.append([version_number, created_date_str, arn_display])
+            rows = [
+                [
+                    v["Version"],
+                    (
+                        v["CreatedDate"]
+                        if isinstance(v["CreatedDate"], str)
+                        else v["CreatedDate"].strftime(_DATE_FMT)
+                    ),
+                    (
+                        v["Arn"]
+                        if len(v["Arn"]) <= _ARN_DISPLAY_MAX
+                        else v["Arn"][: _ARN_DISPLAY_MAX - 3] + "..."
+                    ),
+                ]
+                for v in versions
+            ]
 
             format_table(headers, rows)
 
 
 def confirm_deletion(
-    layers: List[Dict], force: bool = False, skip_dynamodb: bool = False
+    layers: List[Dict],
+    force: bool = False,
+    skip_dynamodb: bool = False,
+    total_versions: Optional[int] = None,
 ) -> bool:
     """
     Ask for confirmation before deleting layers.
@@ -415,7 +571,8 @@ def confirm_deletion(
     if not layers:
         return False
 
-    total_versions = sum(len(layer["Versions"]) for layer in layers)
+    if total_versions is None:
+        total_versions = sum(len(layer["Versions"]) for layer in layers)
 
     header("CONFIRMATION REQUIRED")
     warning(
@@ -475,7 +632,10 @@ def main(pattern, dry_run, force, regions, verbose, skip_dynamodb):
     # Use specified regions if provided
     global REGIONS
     if regions:
-        REGIONS = [region.strip() for region in regions.split(",")]
+        # Drop blanks and duplicates, keeping the order given
+        REGIONS = tuple(
+            dict.fromkeys(r for r in (r.strip() for r in regions.split(",")) if r)
+        )
         status("Using regions", ", ".join(REGIONS))
 
     # Show summary of options
@@ -491,19 +651,20 @@ def main(pattern, dry_run, force, regions, verbose, skip_dynamodb):
 
     # Find matching layers
     matching_layers = find_matching_layers(pattern)
+    total_versions = sum(len(layer["Versions"]) for layer in matching_layers)
 
     # Print summary
-    print_layer_summary(matching_layers)
+    print_layer_summary(matching_layers, total_versions)
 
     # Ask for confirmation
     if not dry_run:
-        if not confirm_deletion(matching_layers, force, skip_dynamodb):
+        if not confirm_deletion(matching_layers, force, skip_dynamodb, total_versions):
             warning("Deletion cancelled", "User did not confirm deletion")
             return
 
     # Delete layers
     lambda_success, lambda_failure, dynamo_success, dynamo_failure = delete_layers(
-        matching_layers, dry_run, skip_dynamodb
+        matching_layers, dry_run, skip_dynamodb, total_versions
     )
 
     # Print results
@@ -13,7 +13,10 @@ import shutil
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
+from typing import Optional
 import yaml  # Import yaml for dependency config loading
 import click
 
@@ -39,9 +42,37 @@ DEFAULT_UPSTREAM_REF = "main"
 DEFAULT_DISTRIBUTION = "default"
 DEFAULT_ARCHITECTURE = "amd64"
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-def load_component_dependencies(yaml_path: Path) -> dict:
-    """Load component dependency mappings from YAML file."""
+# Builds go to tmpfs only when it has room for the clone and Go build output
+TMPFS_ROOT = "/dev/shm"
+TMPFS_MIN_FREE_BYTES = 4 * 1024**3
+
+# Map of component tag prefixes to directory paths (read-only)
+COMPONENT_TYPE_DIRS = MappingProxyType(
+    {
+        "lambdacomponents.connector": "connector",
+        "lambdacomponents.exporter": "exporter",
+        "lambdacomponents.processor": "processor",
+        "lambdacomponents.receiver": "receiver",
+        "lambdacomponents.extension": "extension",
+    }
+)
+
+# resolve_components_by_tags results for this build, keyed by the active tags
+# and the identity of the mappings. The mappings object is kept in the value so
+# its id cannot be reused while the entry exists.
+_resolved_cache: dict[tuple[frozenset, int], tuple[dict, list[str]]] = {}
+
+
+def load_component_dependencies(yaml_path: Path) -> dict[str, tuple[str, ...]]:
+    """
+    Load component dependency mappings from YAML file.
+
+    Each component tag maps to a tuple of module paths; a single string entry
+    becomes a one-element tuple.
+    """
     if not yaml_path.is_file():
         warning(
             f"Component dependency file not found at {yaml_path}",
@@ -51,7 +82,7 @@ def load_component_dependencies(yaml_path: Path) -> dict:
 
     try:
         with open(yaml_path, "r") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YAML_LOADER)
             if (
                 not data
                 or "dependencies" not in data
@@ -63,8 +94,23 @@ def load_component_dependencies(yaml_path: Path) -> dict:
                 )
                 return {}
 
+            # Normalize once so callers never have to check entry types
+            dependencies = {}
+            for component_tag, modules in data["dependencies"].items():
+                if isinstance(modules, str):
+                    dependencies[component_tag] = (modules,)
+                elif isinstance(modules, list):
+                    dependencies[component_tag] = tuple(modules)
+                else:
+                    # Keep the tag so the component is still selected
+                    warning(
+                        f"Invalid format for tag '{component_tag}' in dependency config",
+                        "Expected list or string",
+                    )
+                    dependencies[component_tag] = ()
+
             success("Loaded dependency mappings", f"from {yaml_path}")
-            return data["dependencies"]
+            return dependencies
     except yaml.YAMLError as e:
         error("Error parsing component dependency YAML file", str(e))
         return {}  # Return empty on error
@@ -103,24 +149,31 @@ def resolve_components_by_tags(
     Returns:
         List of component tags that should be included
     """
+    # Both the overlay and the dependency step ask for the same resolution
+    cache_key = (frozenset(active_build_tags), id(dependency_mappings))
+    cached = _resolved_cache.get(cache_key)
+    if cached is not None and cached[0] is dependency_mappings:
+        return list(cached[1])
+
     included_components = []
 
     # Check for hierarchical tag resolution
-    has_global_all = "lambdacomponents.all" in active_build_tags
-
-    # Identify categories with 'all' tags
-    category_all_tags = {}
-    for tag in active_build_tags:
-        if tag.endswith(".all") and tag != "lambdacomponents.all":
-            category = tag.rsplit(".", 1)[0]  # e.g., 'lambdacomponents.connector'
-            category_all_tags[category] = True
+    active_set = set(active_build_tags)
+    has_global_all = "lambdacomponents.all" in active_set
+
+    # Identify categories with 'all' tags, e.g. 'lambdacomponents.connector'
+    category_all = {
+        tag.rsplit(".", 1)[0]
+        for tag in active_set
+        if tag.endswith(".all") and tag != "lambdacomponents.all"
+    }
 
     # Determine which components should be included
-    for component_tag in dependency_mappings.keys():
+    for component_tag in dependency_mappings:
         should_include = False
 
         # Direct match with active tag
-        if component_tag in active_build_tags:
+        if component_tag in active_set:
             should_include = True
             detail("Including component", f"Direct match: {component_tag}")
 
@@ -129,12 +182,13 @@ def resolve_components_by_tags(
             should_include = True
             detail("Including component", f"Via global 'all' tag: {component_tag}")
 
-        # Category "all" tag includes components in that category
-        else:
-            for category in category_all_tags:
-                if component_tag.startswith(
-                    f"{category}."
-                ) and not component_tag.endswith(".all"):
+        # Category "all" tag includes components in that category; look up
+        # each dotted prefix of the tag instead of scanning every category
+        elif category_all and not component_tag.endswith(".all"):
+            parts = component_tag.split(".")
+            for depth in range(1, len(parts)):
+                category = ".".join(parts[:depth])
+                if category in category_all:
                     should_include = True
                     detail(
                         "Including component",
@@ -145,7 +199,49 @@ def resolve_components_by_tags(
         if should_include:
             included_components.append(component_tag)
 
-    return included_components
+    _resolved_cache[cache_key] = (dependency_mappings, included_components)
+    return list(included_components)
+
+
+def _fast_copy(source, destination) -> None:
+    """
+    Hard-link a file into place, copying it when a link is not possible.
+
+    Overlay files are only read by the build, so sharing the inode is safe.
+    Linking fails across filesystems or when the destination already exists
+    (an upstream file being overridden); those fall back to a real copy. A
+    destination already linked to the source (a file covered both by a
+    "<type>.all" tag and by its own tag) is left as it is.
+    """
+    try:
+        os.link(source, destination)
+    except OSError:
+        if os.path.exists(destination) and os.path.samefile(source, destination):
+            return
+        shutil.copy2(source, destination)
+
+
+def default_tmp_root() -> Optional[str]:
+    """Return the tmpfs mount for the build directory, or None for the default."""
+    if sys.platform != "linux" or not os.path.isdir(TMPFS_ROOT):
+        return None
+    try:
+        if shutil.disk_usage(TMPFS_ROOT).free > TMPFS_MIN_FREE_BYTES:
+            return TMPFS_ROOT
+    except OSError:
+        pass
+    return None
+
+
+def _copy_item(item: tuple[Path, Path]) -> None:
+    """Copy a directory tree or a single file to its destination."""
+    source, destination = item
+    if source.is_dir():
+        shutil.copytree(
+            source, destination, dirs_exist_ok=True, copy_function=_fast_copy
+        )
+    else:
+        _fast_copy(source, destination)
 
 
 def selective_copy_components(
@@ -185,27 +281,8 @@ def selective_copy_components(
         f"Included: {len(included_components)} components",
     )
 
-    # Map of component tag prefixes to directory paths
-    component_type_dirs = {
-        "lambdacomponents.connector": "connector",
-        "lambdacomponents.exporter": "exporter",
-        "lambdacomponents.processor": "processor",
-        "lambdacomponents.receiver": "receiver",
-        "lambdacomponents.extension": "extension",
-    }
-
-    # Track what was actually copied
-    copied_components = []
-
-    # Copy base/common files first (if they exist)
-    common_dir = component_dir / "common"
-    if common_dir.is_dir():
-        upstream_common_dir = upstream_dir / "collector" / "common"
-        upstream_common_dir.mkdir(parents=True, exist_ok=True)
-        shutil.copytree(common_dir, upstream_common_dir, dirs_exist_ok=True)
-        success("Copied common files", f"From {common_dir} to {upstream_common_dir}")
-
-    # Copy each component type directory if needed
+    # Parse each tag once into (tag, type directory, component name)
+    plan: list[tuple[str, str, str]] = []
     for component_tag in included_components:
         # Extract the component type (e.g., 'connector', 'exporter')
         component_parts = component_tag.split(".")
@@ -214,15 +291,33 @@ def selective_copy_components(
             continue
 
         component_type_prefix = f"{component_parts[0]}.{component_parts[1]}"
-        component_name = component_parts[2]
-
-        # Get the directory name for this component type
-        if component_type_prefix not in component_type_dirs:
+        component_type_dir = COMPONENT_TYPE_DIRS.get(component_type_prefix)
+        if component_type_dir is None:
             warning(f"Unknown component type: {component_type_prefix}", "Skipping")
             continue
 
-        component_type_dir = component_type_dirs[component_type_prefix]
+        plan.append((component_tag, component_type_dir, component_parts[2]))
+
+    # Track what was actually copied
+    copied_components = []
 
+    # Plan the copies first; they are then run concurrently and reported here
+    copy_items: list[tuple[Path, Path]] = []
+    copy_reports: list[tuple[str, str, list[str]]] = []
+    type_dir_cache: dict[Path, list[os.DirEntry]] = {}
+
+    # Copy base/common files first (if they exist)
+    common_dir = component_dir / "common"
+    if common_dir.is_dir():
+        upstream_common_dir = upstream_dir / "collector" / "common"
+        upstream_common_dir.mkdir(parents=True, exist_ok=True)
+        copy_items.append((common_dir, upstream_common_dir))
+        copy_reports.append(
+            ("Copied common files", f"From {common_dir} to {upstream_common_dir}", [])
+        )
+
+    # Copy each component type directory if needed
+    for component_tag, component_type_dir, component_name in plan:
         # Source and destination paths - use the collector/lambdacomponents structure to match upstream
         source_type_dir = component_dir / "collector" / "lambdacomponents" / component_type_dir
         if not source_type_dir.is_dir():
@@ -240,16 +335,27 @@ def selective_copy_components(
             dest_type_dir.mkdir(parents=True, exist_ok=True)
 
             # Copy all files in this component type directory
-            shutil.copytree(source_type_dir, dest_type_dir, dirs_exist_ok=True)
-            success(
-                f"Copied all {component_type_dir} components",
-                f"From {source_type_dir} to {dest_type_dir}",
+            copy_items.append((source_type_dir, dest_type_dir))
+            copy_reports.append(
+                (
+                    f"Copied all {component_type_dir} components",
+                    f"From {source_type_dir} to {dest_type_dir}",
+                    [],
+                )
             )
             copied_components.append(component_tag)
         else:
             # Look for specific component file(s)
             # Common naming patterns: component_name.go, component_name_factory.go, etc.
-            component_files = list(source_type_dir.glob(f"*{component_name}*.go"))
+            # The type directory is listed once and shared by its components
+            go_entries = type_dir_cache.get(source_type_dir)
+            if go_entries is None:
+                with os.scandir(source_type_dir) as entries:
+                    go_entries = [e for e in entries if e.name.endswith(".go")]
+                type_dir_cache[source_type_dir] = go_entries
+            component_files = [
+                Path(e.path) for e in go_entries if component_name in e.name
+            ]
 
             if not component_files:
                 warning(f"No files found for component: {component_tag}", "Skipping")
@@ -263,13 +369,29 @@ def selective_copy_components(
 
             # Copy each file individually
             for file in component_files:
-                dest_file = dest_type_dir / file.name
-                shutil.copy2(file, dest_file)
-                detail("Copied file", f"{file.name}")
-
-            success(f"Copied {component_name} component files", f"To {dest_type_dir}")
+                copy_items.append((file, dest_type_dir / file.name))
+            copy_reports.append(
+                (
+                    f"Copied {component_name} component files",
+                    f"To {dest_type_dir}",
+                    [file.name for file in component_files],
+                )
+            )
             copied_components.append(component_tag)
 
+    # Copies are I/O bound, so overlap them on a thread pool
+    copy_items = list(dict.fromkeys(copy_items))
+    if copy_items:
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(copy_items))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Consume the results so a failed copy raises here
+            list(executor.map(_copy_item, copy_items))
+
+    for message, details, file_names in copy_reports:
+        if file_names:
+            detail("Copied files", ", ".join(file_names))
+        success(message, details)
+
     if copied_components:
         success(
             "Component overlay complete",
@@ -281,6 +403,47 @@ def selective_copy_components(
     return copied_components
 
 
+def _go_mod_require(
+    collector_dir: Path, versioned_modules: list[str]
+) -> tuple[list[str], list[str]]:
+    """
+    Require modules with as few go mod edit runs as possible.
+
+    All modules are tried in one invocation. If that fails the set is split in
+    half and each half retried, so a single bad module among N costs about
+    2*log2(N) extra runs instead of N.
+
+    Returns:
+        Tuple of (added modules, failed modules)
+    """
+    try:
+        run_command(
+            ["go", "mod", "edit"]
+            + [f"-require={module}" for module in versioned_modules],
+            cwd=str(collector_dir),
+            capture_output=True,
+        )
+        return list(versioned_modules), []
+    except subprocess.CalledProcessError as e:
+        if len(versioned_modules) > 1:
+            middle = len(versioned_modules) // 2
+            added_first, failed_first = _go_mod_require(
+                collector_dir, versioned_modules[:middle]
+            )
+            added_second, failed_second = _go_mod_require(
+                collector_dir, versioned_modules[middle:]
+            )
+            return added_first + added_second, failed_first + failed_second
+
+        versioned_module = versioned_modules[0]
+        # run_command captures text output, so stderr is already a str
+        warning(
+            f"Failed to add dependency with exact version: {versioned_module}",
+            f"Error: {(e.stderr or str(e)).strip()}",
+        )
+        return [], [versioned_module]
+
+
 def add_dependencies(
     collector_dir: Path,
     active_build_tags: list[str],
@@ -305,16 +468,7 @@ def add_dependencies(
 
     # Add dependencies for each component
     for component_tag in components_to_include:
-        modules = dependency_mappings.get(component_tag)
-        if isinstance(modules, list):
-            modules_to_add.update(modules)
-        elif isinstance(modules, str):
-            modules_to_add.add(modules)
-        else:
-            warning(
-                f"Invalid format for tag '{component_tag}' in dependency config",
-                "Expected list or string",
-            )
+        modules_to_add.update(dependency_mappings.get(component_tag, ()))
 
     if not modules_to_add:
         info("No custom component dependencies required", "For this distribution")
@@ -333,27 +487,20 @@ def add_dependencies(
 
         # Check if we have any dependencies to add
         if modules_to_add:
-            # First, analyze go.mod to understand existing dependencies
+            # Check go.mod is there before editing it; its size is enough to report
             status("Analyzing", "go.mod file for dependency compatibility")
+            go_mod_path = collector_dir / "go.mod"
             try:
-                go_mod_path = collector_dir / "go.mod"
-                with open(go_mod_path, "r") as f:
-                    go_mod_content = f.read()
-                    status(
-                        "Read go.mod file", f"{len(go_mod_content.splitlines())} lines"
-                    )
-            except Exception as e:
+                status("Found go.mod file", f"{go_mod_path.stat().st_size} bytes")
+            except OSError as e:
                 warning("Could not read go.mod file", str(e))
-                go_mod_content = ""
 
             # Add dependencies using go mod edit for more precise control
             status(
                 "Using go mod edit to add dependencies",
                 f"{len(modules_to_add)} modules",
             )
-            success_count = 0
-            failure_count = 0
-
+            versioned_modules = []
             for module_path in modules_to_add:
                 # Check if module_path already contains a version specification
                 if "@" in module_path:
@@ -362,32 +509,18 @@ def add_dependencies(
                 else:
                     versioned_module = f"{module_path}@{version_tag}"  # Append upstream version
                     status("Adding dependency with upstream version", versioned_module)
+                versioned_modules.append(versioned_module)
 
-                try:
-                    # Use go mod edit for a more controlled approach
-                    run_command(
-                        ["go", "mod", "edit", f"-require={versioned_module}"],
-                        cwd=str(collector_dir),
-                        capture_output=True,
-                    )
-                    success_count += 1
-                    success(f"Added dependency {versioned_module}")
-                except subprocess.CalledProcessError as e:
-                    # Import traceback module
-                    import traceback
-                    
-                    # Print all error details and backtrace
-                    print(f"Error adding dependency: {versioned_module}")
-                    print(f"Error message: {e.stderr.decode() if hasattr(e, 'stderr') else str(e)}")
-                    print(f"Command: {e.cmd if hasattr(e, 'cmd') else 'Unknown command'}")
-                    print(f"Return code: {e.returncode if hasattr(e, 'returncode') else 'Unknown'}")
-                    print("Traceback:")
-                    traceback.print_exc()
-                    warning(
-                        f"Failed to add dependency with exact version: {versioned_module}",
-                        f"Error: {e.stderr if hasattr(e, 'stderr') else str(e)}",
-                    )
-                    failure_count += 1
+            # go mod edit accepts any number of -require flags and writes nothing
+            # if one is rejected, so add everything in one invocation and only
+            # bisect the set when it fails
+            added_modules, failed_modules = _go_mod_require(
+                collector_dir, versioned_modules
+            )
+            for versioned_module in added_modules:
+                success(f"Added dependency {versioned_module}")
+            success_count = len(added_modules)
+            failure_count = len(failed_modules)
 
             # Summary of dependency addition
             if success_count > 0:
@@ -395,7 +528,9 @@ def add_dependencies(
             if failure_count > 0:
                 warning(f"Failed to add {failure_count} dependencies")
 
-            # Run go mod tidy once at the end to resolve all dependencies
+            # Run go mod tidy once at the end to resolve all dependencies. It
+            # runs even if go.mod is unchanged: the overlaid component sources
+            # may import packages whose go.sum entries only tidy adds.
             if success_count > 0:
                 status("Running", "go mod tidy to resolve dependencies")
                 try:
@@ -485,6 +620,11 @@ def add_dependencies(
     "--config-file",
     help="Optional custom collector config file name (relative to config/examples/)",
 )
+@click.option(
+    "--tmp-root",
+    type=click.Path(file_okay=False),
+    help="Directory for the temporary build tree (default: /dev/shm when it has space)",
+)
 def main(
     upstream_repo,
     upstream_ref,
@@ -495,6 +635,7 @@ def main(
     upstream_version,
     build_tags,
     config_file,
+    tmp_root,
 ):
     """Build Custom OpenTelemetry Collector Lambda Layer."""
 
@@ -539,68 +680,93 @@ def main(
     config_dir = custom_repo_path / "config"
     dependency_yaml_path = config_dir / "component_dependencies.yaml"
 
-    # Load component dependencies config
-    dependency_mappings = load_component_dependencies(dependency_yaml_path)
-
-    # Display build configuration using property list
-    header("Build configuration")
-
-    # Group important configuration properties
-    build_props = {
-        "Upstream Repository": upstream_repo,
-        "Upstream Ref": upstream_ref,
-        "Distribution": distribution,
-        "Architecture": arch,
-        "Upstream Version": upstream_version,
-        "Build Tags": build_tags_string or "[none]",
-        "Output Directory": str(output_dir),
-    }
-
-    # Less important properties with dimmer styling
-    other_props = {
-        "Keep Temp Directory": str(keep_temp),
-        "Custom Component Dir": str(component_dir),
-        "Dependency Config": str(dependency_yaml_path),
-    }
+    # --- Build Process ---
+    temp_dir = tempfile.mkdtemp(dir=tmp_root or default_tmp_root())
+    clone_proc = None
+    try:
+        temp_dir_path = Path(temp_dir)
+        upstream_dir = temp_dir_path / "upstream"
 
-    # Display configuration
-    property_list(build_props)
-    property_list(other_props)
+        # Start cloning the upstream repository right away; the configuration is
+        # loaded and displayed while git is busy on the network. The clone is
+        # sparse and blobless, so only the blobs of checked-out paths are fetched.
+        repo_url = f"https://github.com/{upstream_repo}.git"
+        clone_proc = subprocess.Popen(
+            [
+                "git",
+                "clone",
+                "--quiet",
+                "--depth",
+                "1",
+                "--single-branch",
+                "--no-tags",
+                "--filter=blob:none",
+                "--sparse",
+                "--branch",
+                upstream_ref,
+                repo_url,
+                str(upstream_dir),
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
 
-    # --- Build Process ---
-    temp_dir = tempfile.mkdtemp()
-    temp_dir_path = Path(temp_dir)
-    upstream_dir = temp_dir_path / "upstream"
+        # Load component dependencies config
+        dependency_mappings = load_component_dependencies(dependency_yaml_path)
+
+        # Display build configuration using property list
+        header("Build configuration")
+
+        # Group important configuration properties
+        build_props = {
+            "Upstream Repository": upstream_repo,
+            "Upstream Ref": upstream_ref,
+            "Distribution": distribution,
+            "Architecture": arch,
+            "Upstream Version": upstream_version,
+            "Build Tags": build_tags_string or "[none]",
+            "Output Directory": str(output_dir),
+        }
+
+        # Less important properties with dimmer styling
+        other_props = {
+            "Keep Temp Directory": str(keep_temp),
+            "Custom Component Dir": str(component_dir),
+            "Dependency Config": str(dependency_yaml_path),
+        }
+
+        # Display configuration
+        property_list(build_props)
+        property_list(other_props)
 
-    try:
         info("Temporary Directory", temp_dir)
 
         # Step 1: Clone upstream repository
         subheader("Clone upstream repository")
 
-        repo_url = f"https://github.com/{upstream_repo}.git"
+        # The clone was started before loading the configuration; wait for it
+        def wait_for_clone():
+            _, clone_stderr = clone_proc.communicate()
+            return clone_proc.returncode, clone_stderr
 
-        def clone_repo():
-            return subprocess.run(
-                [
-                    "git",
-                    "clone",
-                    "--depth",
-                    "1",
-                    "--branch",
-                    upstream_ref,
-                    repo_url,
-                    str(upstream_dir),
-                ],
-                capture_output=True,
-                text=True,
+        clone_returncode, clone_stderr = spinner("Cloning repository", wait_for_clone)
+        if clone_returncode != 0:
+            error(
+                "Failed to clone repository",
+                clone_stderr.decode("utf-8", "replace"),
             )
-
-        clone_result = spinner("Cloning repository", clone_repo)
-        if clone_result.returncode != 0:
-            error("Failed to clone repository", clone_result.stderr)
             sys.exit(1)
 
+        # Only collector/ is read from upstream; materializing it fetches just
+        # its blobs
+        spinner(
+            "Checking out collector/",
+            lambda: run_command(
+                ["git", "-C", str(upstream_dir), "sparse-checkout", "set", "collector"],
+                capture_output=True,
+            ),
+        )
+
         success("Repository cloned successfully")
 
         # Step 2: Copy custom components to the upstream directory
@@ -668,20 +834,22 @@ def main(
             detail("Detail", "Cannot build using make")
             sys.exit(1)
 
+        make_env = {**os.environ, **build_env}
+
         def run_make_package():
             return subprocess.run(
                 ["make", "package"],
                 cwd=str(collector_dir),
-                env={**os.environ.copy(), **build_env},
+                env=make_env,
                 capture_output=True,
-                text=True,
             )
 
+        # Output is only decoded when it is shown
         build_result = spinner("Running make package", run_make_package)
         if build_result.returncode != 0:
-            error("Build failed", build_result.stderr)
+            error("Build failed", build_result.stderr.decode("utf-8", "replace"))
             if build_result.stdout:
-                click.echo(build_result.stdout)
+                click.echo(build_result.stdout.decode("utf-8", "replace"))
             sys.exit(1)
 
         success("Build successful")
@@ -725,7 +893,16 @@ def main(
         # Copy the RENAMED file to the final output directory
         target_file = output_dir / new_filename  # Final destination uses the new name
         status("Copying layer", f"To {target_file}")
-        shutil.copy(renamed_build_file, target_file)
+        try:
+            if keep_temp:
+                # The artifact also stays in the kept temp dir, so link it
+                target_file.unlink(missing_ok=True)
+                os.link(renamed_build_file, target_file)
+            else:
+                os.replace(renamed_build_file, target_file)
+        except OSError:
+            # Different filesystems; fall back to copying the bytes
+            shutil.copy2(renamed_build_file, target_file)
 
         header("Build successful")
         status("Layer available at", str(target_file))
@@ -740,6 +917,15 @@ def main(
         detail("Detail", str(e))
         sys.exit(1)
     finally:
+        # Don't leave the clone running if the build stopped early
+        if clone_proc is not None and clone_proc.poll() is None:
+            clone_proc.terminate()
+            try:
+                clone_proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                clone_proc.kill()
+                clone_proc.wait()
+
         # Cleanup temporary directory
         if not keep_temp:
             subheader("Cleaning up")
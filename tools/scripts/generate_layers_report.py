@@ -12,17 +12,34 @@ by fetching metadata from a DynamoDB table.
 """
 
 import fnmatch
+import functools
+import gzip
+import hashlib
+import io
+import json
+import os
+import re
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List
+from operator import itemgetter
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 import sys
+import boto3
 import click
+from boto3.dynamodb.conditions import Attr, ConditionBase
 
 
+from otel_layer_utils.cache_utils import CACHE_DIR
+
 # Import DynamoDB utilities
 from otel_layer_utils.dynamodb_utils import (
     DYNAMODB_TABLE_NAME,
+    GSI_DISTRIBUTION_INDEX,
     query_by_distribution,
-    scan_items,
+    scan_items_parallel,
 )
 
 DISTRIBUTIONS = [
@@ -33,78 +50,245 @@ DISTRIBUTIONS = [
     "full",
     "custom",
 ]
+DISTRIBUTIONS_SET = frozenset(DISTRIBUTIONS)
 
 ARCHITECTURES = ["amd64", "arm64", "unknown"]  # Add unknown as fallback
+ARCHITECTURES_SET = frozenset(ARCHITECTURES)
+
+# Per-user cache for --cache-ttl, shared with the local build tooling
+REPORT_CACHE_DIR = CACHE_DIR
+
+# The only item attributes the report reads; fetching just these keeps pages small
+REPORT_ATTRIBUTES = (
+    "distribution",
+    "architecture",
+    "region",
+    "layer_arn",
+    "layer_version_str",
+    "publish_timestamp",
+)
+
+
+# Glob metacharacters, including whole bracket expressions, that separate the
+# literal tokens of a --pattern
+_GLOB_SPLIT_RE = re.compile(r"\[[^\]]*\]|[*?]")
+# A distribution pinned by literal text on both sides: the architecture before
+# it and the start of a numeric version after it, e.g. "arm64-clickhouse-0_4"
+_PINNED_DISTRIBUTION_RE = re.compile(r"(?:amd64|arm64)-([A-Za-z0-9-]+?)-[0-9]")
+
+# Numeric AWS layer version suffix of a layer version ARN
+_ARN_VERSION_RE = re.compile(r":(\d+)$")
 
 
-def fetch_layers_from_dynamodb(pattern: str = None) -> List[Dict]:
+def _plan_from_pattern(
+    pattern: Optional[str],
+) -> Tuple[List[str], Optional[ConditionBase], Optional[Callable[[str], object]]]:
     """
-    Fetch all layer metadata items from the DynamoDB table.
-    Optionally filters items based on a glob pattern against the layer_arn.
+    Work out how to fetch the items matching a glob pattern on layer_arn.
+
+    Layer names are "<name>-<arch>-<distribution>-<version>-<group>". When a
+    literal token spells out the architecture, a known distribution and the
+    start of the version (e.g. "arm64-clickhouse-0_42"), no other distribution
+    can match, so only that one is queried through the GSI. Anything looser,
+    such as "*arm64-clickhouse*", could also match a distribution that is not
+    in DISTRIBUTIONS, so the table is scanned instead.
+
+    Every literal token must also appear somewhere in a matching ARN, so the
+    tokens become a server-side FilterExpression of contains() conditions.
+    This does not reduce the capacity a read consumes, but anchors like a
+    region or architecture drop most items before they are sent. The compiled
+    pattern is returned as the residual filter for whatever is returned.
+
+    Returns a tuple of (distributions to query, filter expression, ARN matcher).
+    An empty list of distributions means a full scan is needed; the filter
+    expression and matcher are None when there is no pattern.
     """
-    all_items = []
+    if not pattern:
+        return [], None, None
+
+    matcher = re.compile(fnmatch.translate(pattern)).match
+    tokens = [token for token in _GLOB_SPLIT_RE.split(pattern) if token]
+    filter_expression = None
+    for token in dict.fromkeys(tokens):
+        condition = Attr("layer_arn").contains(token)
+        filter_expression = (
+            condition if filter_expression is None else filter_expression & condition
+        )
 
-    print(f"Querying DynamoDB table '{DYNAMODB_TABLE_NAME}' for layer metadata...")
+    pinned = {
+        match.group(1)
+        for token in tokens
+        for match in _PINNED_DISTRIBUTION_RE.finditer(token)
+    }
+    if len(pinned) != 1 or not pinned <= DISTRIBUTIONS_SET:
+        return [], filter_expression, matcher
+    return list(pinned), filter_expression, matcher
 
-    # If no pattern is provided, we'll get all items
-    # If pattern is a specific distribution pattern, we can use query by distribution
-    if (
-        pattern
-        and pattern.startswith("*")
-        and pattern.endswith("*")
-        and "*" not in pattern[1:-1]
-    ):
-        # This is likely just a distribution filter (e.g., "*clickhouse*")
-        distribution = pattern[1:-1]  # Remove the asterisks
-        if distribution in DISTRIBUTIONS:
-            print(f"Using GSI 'sk-pk-index' to query for distribution: {distribution}")
-            try:
-                all_items = query_by_distribution(distribution)
-                print(
-                    f"Retrieved {len(all_items)} items for distribution '{distribution}'."
-                )
-                return all_items
-            except Exception as e:
-                print(
-                    f"Error querying for distribution '{distribution}': {e}",
-                    file=sys.stderr,
-                )
-                # Fall back to scan on error
 
-    # Otherwise, use scan for more complex patterns or all items
-    print("Using scan operation to retrieve all items")
+def _query_distributions(
+    distributions: List[str], filter_expression: Optional[ConditionBase] = None
+) -> List[Dict]:
+    """
+    Query the distribution GSI for each distribution, in parallel when there
+    is more than one.
+    """
+
+    def query(distribution, session=None):
+        return query_by_distribution(
+            distribution,
+            attributes=REPORT_ATTRIBUTES,
+            filter_expression=filter_expression,
+            session=session,
+        )
+
+    def query_in_thread(distribution):
+        # boto3 resources are not thread-safe, so each worker uses its own session
+        return query(distribution, session=boto3.session.Session())
+
+    if len(distributions) == 1:
+        return query(distributions[0])
+    with ThreadPoolExecutor(max_workers=len(distributions)) as executor:
+        results = executor.map(query_in_thread, distributions)
+        return [item for items in results for item in items]
+
+
+def _scan_all_items(
+    filter_expression: Optional[ConditionBase],
+    item_filter: Optional[Callable[[Dict], bool]],
+    raise_errors: bool = False,
+) -> Iterator[Dict]:
+    """
+    Stream every item in the table that passes filter_expression and
+    item_filter. A failed scan is reported and, unless raise_errors is set,
+    ends the stream early instead of raising.
+    """
     try:
-        # Get all items (already deserialized)
-        all_items = scan_items()
+        # Items are already deserialized
+        yield from scan_items_parallel(
+            filter_expression,
+            attributes=REPORT_ATTRIBUTES,
+            item_filter=item_filter,
+        )
     except Exception as e:
         print(f"Error scanning DynamoDB table: {e}", file=sys.stderr)
+        if raise_errors:
+            raise
+
+
+def fetch_layers_from_dynamodb(
+    pattern: str = None, raise_errors: bool = False
+) -> Iterator[Dict]:
+    """
+    Fetch all layer metadata items from the DynamoDB table.
+    Optionally filters items based on a glob pattern against the layer_arn.
+    When the pattern names a distribution, only that distribution is queried.
+
+    Scanned items are streamed page by page, so the result is an iterator
+    meant to be consumed once. With raise_errors, a scan that fails partway
+    re-raises its error after the items already yielded.
+    """
+    print(f"Querying DynamoDB table '{DYNAMODB_TABLE_NAME}' for layer metadata...")
 
-    print(f"Retrieved {len(all_items)} total items from DynamoDB.")
+    distributions, filter_expression, matcher = _plan_from_pattern(pattern)
+    item_filter = None
+    if matcher:
+        print(f"Filtering items matching pattern: {pattern}")
 
-    # Optional filtering based on pattern
-    if pattern:
-        filtered_items = [
-            item
-            for item in all_items
-            if "layer_arn" in item and fnmatch.fnmatch(item["layer_arn"], pattern)
-        ]
+        def item_filter(item):
+            arn = item.get("layer_arn")
+            return bool(arn) and matcher(arn) is not None
+
+    if distributions:
+        names = ", ".join(distributions)
         print(
-            f"Filtered down to {len(filtered_items)} items matching pattern: {pattern}"
+            f"Using GSI '{GSI_DISTRIBUTION_INDEX}' to query for distribution: {names}"
         )
-        return filtered_items
-    else:
-        return all_items
+        try:
+            items = _query_distributions(distributions, filter_expression)
+        except Exception as e:
+            print(
+                f"Error querying for distribution '{names}': {e}",
+                file=sys.stderr,
+            )
+            # Fall back to scan on error
+        else:
+            retrieved = len(items)
+            items = [item for item in items if item_filter(item)]
+            print(
+                f"Retrieved {retrieved} items for distribution '{names}', "
+                f"{len(items)} matching the pattern."
+            )
+            return iter(items)
+
+    # Otherwise, use scan for more complex patterns or all items
+    print("Using scan operation to retrieve all items")
+    return _scan_all_items(filter_expression, item_filter, raise_errors)
 
 
-def process_dynamodb_items(items: List[Dict]) -> Dict:
+def _report_cache_path(pattern: Optional[str]) -> Path:
     """
-    Process the list of items fetched from DynamoDB and group them by
+    Get the cache file for a pattern. The key also covers the table and the
+    configured AWS region, so switching either does not replay stale items.
+    """
+    region = os.environ.get("AWS_REGION") or os.environ.get("AWS_DEFAULT_REGION")
+    key = "\0".join((DYNAMODB_TABLE_NAME, region or "", pattern or ""))
+    digest = hashlib.sha1(key.encode()).hexdigest()
+    return REPORT_CACHE_DIR / f"layers-{digest}.json.gz"
+
+
+def fetch_layers_cached(pattern: Optional[str], cache_ttl: int) -> Iterable[Dict]:
+    """
+    Fetch layer items like fetch_layers_from_dynamodb, replaying the result of
+    a previous run for the same pattern if it is less than cache_ttl seconds
+    old. A cache_ttl of 0 disables the cache.
+    """
+    if cache_ttl <= 0:
+        return fetch_layers_from_dynamodb(pattern)
+
+    cache_path = _report_cache_path(pattern)
+    try:
+        with gzip.open(cache_path, "rt", encoding="utf-8") as f:
+            cached = json.load(f)
+        age = time.time() - cached["created"]
+        if 0 <= age < cache_ttl:
+            print(f"Using {len(cached['items'])} cached items ({int(age)}s old)")
+            return cached["items"]
+    except Exception:
+        # Missing, unreadable or stale cache; fetch below
+        pass
+
+    items = []
+    try:
+        for item in fetch_layers_from_dynamodb(pattern, raise_errors=True):
+            items.append(item)
+    except Exception:
+        # Already reported; report what was fetched but don't cache a partial scan
+        return items
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump({"created": time.time(), "items": items}, f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Could not write report cache {cache_path}: {e}", file=sys.stderr)
+    return items
+
+
+def process_dynamodb_items(items: Iterable[Dict]) -> Dict:
+    """
+    Process the items fetched from DynamoDB and group them by
     distribution and architecture for the report.
-    This function passes through all AWS Lambda layer versions.
+    The items are consumed in a single pass, so a stream of pages works.
+    Only the latest AWS Lambda layer version of each layer is kept: every
+    group maps (base ARN, region) to the layer with the highest version.
     """
-    layers_by_dist_arch = {}
+    layers_by_dist_arch = defaultdict(dict)
+    item_count = 0
 
     for item in items:
+        item_count += 1
         distribution = item.get("distribution", "unknown")
         architecture = item.get("architecture", "unknown")
         region = item.get("region", "unknown")
@@ -117,37 +301,85 @@ def process_dynamodb_items(items: List[Dict]) -> Dict:
             print(f"Skipping item with missing 'layer_arn': {item}", file=sys.stderr)
             continue
 
+        # The AWS layer version is the numeric suffix of the ARN
+        # (e.g. arn:aws:lambda:us-east-1:123456789012:layer:my-layer:1)
+        version_match = _ARN_VERSION_RE.search(layer_arn_full)
+        if not version_match:
+            print(
+                f"Could not parse AWS layer version from ARN '{layer_arn_full}'. Skipping this item for 'latest' selection.",
+                file=sys.stderr,
+            )
+            continue
+        base_arn = layer_arn_full[: version_match.start()]
+        aws_layer_version_num = int(version_match.group(1))
+
         # Ensure architecture is in our known list, default to unknown
-        if architecture not in ARCHITECTURES:
+        if architecture not in ARCHITECTURES_SET:
             architecture = "unknown"
 
-        key = f"{distribution}:{architecture}"
-        if key not in layers_by_dist_arch:
-            layers_by_dist_arch[key] = []
-
-        layers_by_dist_arch[key].append(
-            {
+        group = layers_by_dist_arch[f"{distribution}:{architecture}"]
+        unique_layer_key = (base_arn, region)
+        current = group.get(unique_layer_key)
+        if current is None or aws_layer_version_num > current["aws_version"]:
+            group[unique_layer_key] = {
                 "region": region,
                 "arn": layer_arn_full,  # Full ARN including AWS Layer Version suffix
                 "version": collector_version_str,  # Collector version string
                 "timestamp": timestamp,
+                "aws_version": aws_layer_version_num,
             }
-        )
     
     print(
-        f"Processed and grouped {len(items)} items into {len(layers_by_dist_arch)} distribution/architecture groups."
+        f"Processed and grouped {item_count} items into {len(layers_by_dist_arch)} distribution/architecture groups."
     )
-    return layers_by_dist_arch
+    # Plain dict, so lookups in the report writer cannot create empty groups
+    return dict(layers_by_dist_arch)
+
+
+def _parse_iso_z(ts: str) -> datetime:
+    """Parse an ISO 8601 timestamp whose UTC offset may be written as "Z"."""
+    if ts.endswith("Z"):
+        ts = ts[:-1] + "+00:00"
+    return datetime.fromisoformat(ts)
+
+
+# datetime.fromisoformat only accepts a trailing "Z" from Python 3.11 onwards
+try:
+    datetime.fromisoformat("2024-01-01T00:00:00Z")
+    _parse_iso = datetime.fromisoformat
+except ValueError:
+    _parse_iso = _parse_iso_z
+
+
+# One markdown table row per layer, filled from the fields process_dynamodb_items sets
+_ROW_TEMPLATE = "\n| %s | `%s` | %s | %s |"
+_ROW_FIELDS = itemgetter("region", "arn", "version")
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_timestamp(ts: str) -> str:
+    """
+    Format a DynamoDB publish timestamp for the report, or return it unchanged
+    if it cannot be parsed. Layers published by the same build share a
+    timestamp across regions, so results are memoized.
+    """
+    try:
+        dt_obj = _parse_iso(ts)
+        return dt_obj.strftime("%Y-%m-%dT%H:%M:%S%Z")
+    except (ValueError, AttributeError):
+        return ts
 
 
 def generate_report(
     layers_by_dist_arch: Dict, output_file: str = "LAYERS.md", pattern: str = None
 ):
     """
-    Generate a markdown report from the processed layer information,
-    ensuring only the latest AWS Lambda Layer version is shown for each unique layer.
+    Generate a markdown report from the processed layer information.
+    process_dynamodb_items has already reduced each unique layer to its
+    latest AWS Lambda Layer version.
     """
-    with open(output_file, "w") as f:
+    # Build the report in memory and write the file in one go
+    with io.StringIO() as f:
         f.write("# OpenTelemetry Lambda Layers Report\n")
         f.write(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
 
@@ -169,130 +401,61 @@ def generate_report(
         else:
             # Dynamically get all unique distribution names from the processed data
             # The keys in layers_by_dist_arch are like "distribution_name:architecture"
-            found_distribution_names = sorted(list(set(
-                k.split(':')[0] for k in layers_by_dist_arch.keys()
-            )))
-
-            if not found_distribution_names:
-                 f.write("No layer distributions found in the processed data.\n\n")
-            else:
-                # We can still try to use the predefined DISTRIBUTIONS list for ordering,
-                # and append any new ones found that are not in the predefined list.
-                
-                # Start with distributions that are in our predefined list and also found
-                ordered_known_distributions = [
-                    d for d in DISTRIBUTIONS if d in found_distribution_names
-                ]
-                
-                # Add any newly found distributions that were not in our predefined list, sorted alphabetically
-                newly_found_distributions = sorted([
-                    d for d in found_distribution_names if d not in DISTRIBUTIONS
-                ])
-                
-                # Combine them for the final processing order
-                distributions_to_report = ordered_known_distributions + newly_found_distributions
-
-                if not distributions_to_report:
-                     f.write("No distributions to report after filtering (this should not happen if found_distribution_names was populated).\n\n")
-                else:
-                    for dist in distributions_to_report:
-                        f.write(f"### {dist} Distribution\n\n")
-
-                        # Use predefined order of architectures
-                        # Ensure we only try to access architectures for the current 'dist'
-                        sorted_architectures = [
-                            a for a in ARCHITECTURES if f"{dist}:{a}" in layers_by_dist_arch
-                        ]
-
-                        for arch in sorted_architectures:
-                            key = f"{dist}:{arch}"
-                            # Check if key exists and the list is not empty
-                            if key in layers_by_dist_arch and layers_by_dist_arch[key]:
-                                f.write(f"#### {arch} Architecture\n\n")
-                                
-                                # --- Filter for latest AWS Lambda Layer Version ---
-                                current_group_layers = layers_by_dist_arch[key]
-                                latest_aws_versions_map = {} # Key: (base_arn, region), Value: layer_item
-
-                                for layer_item in current_group_layers:
-                                    full_arn = layer_item.get("arn")
-                                    item_region = layer_item.get("region")
-
-                                    if not full_arn or full_arn == "N/A":
-                                        print(f"Skipping layer item with invalid ARN: {layer_item}", file=sys.stderr)
-                                        continue
-                                    
-                                    try:
-                                        arn_parts = full_arn.split(':')
-                                        if len(arn_parts) < 7: # Basic check for ARN structure (e.g. arn:partition:service:region:account-id:resource-type/resource-id or :layer:name:version)
-                                            # For layer ARNs, it's usually 7 or 8 parts if version is separate, or version is part of the 7th part.
-                                            # e.g., arn:aws:lambda:us-east-1:123456789012:layer:my-layer:1 (8 parts)
-                                            # or    arn:aws:lambda:us-east-1:123456789012:layer:my-layer (7 parts if no version in ARN explicitly listed in DB, though unlikely for this script)
-                                            # We expect the version to be the last part.
-                                            raise ValueError("ARN does not have enough parts to extract version.")
-
-                                        base_arn = ":".join(arn_parts[:-1])
-                                        aws_layer_version_num = int(arn_parts[-1])
-                                    except (ValueError, IndexError) as e:
-                                        print(f"Could not parse AWS layer version from ARN '{full_arn}': {e}. Skipping this item for 'latest' selection.", file=sys.stderr)
-                                        continue # Skip if ARN not parsable for version
-
-                                    unique_layer_key = (base_arn, item_region)
-                                    
-                                    # Store aws_layer_version_num in the item temporarily for comparison
-                                    # This avoids modifying the original dict if it's shared, but for max(), it's fine.
-                                    # We'll retrieve it from the stored item if this one becomes the candidate.
-                                    
-                                    current_max_item = latest_aws_versions_map.get(unique_layer_key)
-                                    if not current_max_item:
-                                        # Store a copy with the parsed version for future comparisons
-                                        item_copy = dict(layer_item)
-                                        item_copy['_aws_layer_version_num'] = aws_layer_version_num
-                                        latest_aws_versions_map[unique_layer_key] = item_copy
-                                    else:
-                                        # Compare with the stored AWS layer version of the current max item
-                                        if aws_layer_version_num > current_max_item['_aws_layer_version_num']:
-                                            item_copy = dict(layer_item)
-                                            item_copy['_aws_layer_version_num'] = aws_layer_version_num
-                                            latest_aws_versions_map[unique_layer_key] = item_copy
-                                
-                                layers_to_display = list(latest_aws_versions_map.values())
-                                # --- End filter ---
-
-                                if not layers_to_display:
-                                    f.write("No layers to display for this architecture after filtering.\n\n")
-                                    continue
-
-
-                                f.write(
-                                    "| Region | Layer ARN | Version | Published (DB Timestamp) |\n"
-                                )
-                                f.write(
-                                    "|--------|-----------|---------|-------------------------|"
-                                )
+            found_distribution_names = {
+                k.partition(":")[0] for k in layers_by_dist_arch
+            }
 
-                                # Sort the filtered list by region and timestamp for consistent output
-                                sorted_layers = sorted(
-                                    layers_to_display,
-                                    key=lambda x: (x.get("region", ""), x.get("timestamp", "")),
-                                )
+            # Distributions from the predefined DISTRIBUTIONS list keep its order;
+            # any newly found ones follow, sorted alphabetically
+            distributions_to_report = [
+                d for d in DISTRIBUTIONS if d in found_distribution_names
+            ] + sorted(found_distribution_names - DISTRIBUTIONS_SET)
 
-                                for layer in sorted_layers:
-                                    ts = layer.get("timestamp", "Unknown")
-                                    try:
-                                        dt_obj = datetime.fromisoformat(
-                                            ts.replace("Z", "+00:00")
-                                        )
-                                        formatted_ts = dt_obj.strftime("%Y-%m-%dT%H:%M:%S%Z")
-                                    except (ValueError, AttributeError):
-                                        formatted_ts = ts
+            for dist in distributions_to_report:
+                f.write(f"### {dist} Distribution\n\n")
 
-                                    # The 'version' field here is the collector_version_str
-                                    f.write(
-                                        f"\n| {layer.get('region', '?')} | `{layer.get('arn', 'N/A')}` | {layer.get('version', '?')} | {formatted_ts} |"
-                                    )
+                # Use predefined order of architectures
+                # Ensure we only try to access architectures for the current 'dist'
+                sorted_architectures = [
+                    a for a in ARCHITECTURES if f"{dist}:{a}" in layers_by_dist_arch
+                ]
 
-                                f.write("\n\n")
+                for arch in sorted_architectures:
+                    key = f"{dist}:{arch}"
+                    # Check if key exists and the list is not empty
+                    if key in layers_by_dist_arch and layers_by_dist_arch[key]:
+                        f.write(f"#### {arch} Architecture\n\n")
+
+                        # Groups only hold the latest AWS Lambda Layer Version
+                        layers_to_display = layers_by_dist_arch[key].values()
+
+                        f.write(
+                            "| Region | Layer ARN | Version | Published (DB Timestamp) |\n"
+                        )
+                        f.write(
+                            "|--------|-----------|---------|-------------------------|"
+                        )
+
+                        # Sort the filtered list by region and timestamp for consistent output
+                        # (process_dynamodb_items always sets both fields)
+                        sorted_layers = sorted(
+                            layers_to_display,
+                            key=itemgetter("region", "timestamp"),
+                        )
+
+                        # The 'version' field here is the collector_version_str
+                        f.write(
+                            "".join(
+                                _ROW_TEMPLATE
+                                % (
+                                    *_ROW_FIELDS(layer),
+                                    _format_timestamp(layer["timestamp"]),
+                                )
+                                for layer in sorted_layers
+                            )
+                        )
+
+                        f.write("\n\n")
 
         f.write("## Usage Instructions\n\n")
         f.write(
@@ -306,6 +469,10 @@ def generate_report(
         f.write(
             "For more information, see the [documentation](https://github.com/open-telemetry/opentelemetry-lambda).\n"
         )
+        report = f.getvalue()
+
+    with open(output_file, "w") as out:
+        out.write(report)
 
     print(f"Report generated and saved to {output_file}")
 
@@ -321,10 +488,17 @@ def generate_report(
     default="LAYERS.md",
     help="Output file path for the markdown report",
 )
-def main(pattern, output):
+@click.option(
+    "--cache-ttl",
+    default=0,
+    type=click.IntRange(min=0),
+    show_default=True,
+    help="Reuse DynamoDB results cached by a previous run within this many seconds (0 disables the cache)",
+)
+def main(pattern, output, cache_ttl):
     """Generate a markdown report of OpenTelemetry Lambda layers from DynamoDB"""
 
-    all_items = fetch_layers_from_dynamodb(pattern)
+    all_items = fetch_layers_cached(pattern, cache_ttl)
     layers_by_dist_arch = process_dynamodb_items(all_items)
     generate_report(layers_by_dist_arch, output, pattern)
 
@@ -18,12 +18,19 @@ import click
 from botocore.exceptions import ClientError
 
 # Import DynamoDB utilities
-from otel_layer_utils.dynamodb_utils import DYNAMODB_TABLE_NAME, query_by_distribution
+from otel_layer_utils.dynamodb_utils import (
+    DYNAMODB_TABLE_NAME,
+    query_by_distribution_prefetch,
+)
 from otel_layer_utils.regions_utils import get_region_info, get_wide_region
 
+# Items DynamoDB evaluates per query page, so grouping starts on the first page
+QUERY_PAGE_SIZE = 100
+
 
 def _get_latest_aws_layer_versions(layer_list: list) -> list:
     """Filters a list of layer items to return only the latest AWS layer version for each base ARN."""
+    # base ARN -> (AWS layer version, item)
     latest_versions_map = {}
     for item in layer_list:
         full_arn = item.get("layer_arn")
@@ -31,24 +38,19 @@ def _get_latest_aws_layer_versions(layer_list: list) -> list:
             print(f"Skipping item with invalid ARN in _get_latest_aws_layer_versions: {item}", file=sys.stderr)
             continue
         try:
-            arn_parts = full_arn.split(':')
-            if len(arn_parts) < 8:
+            if full_arn.count(":") < 7:
                 raise ValueError("ARN does not have enough parts to extract version.")
-            base_arn = ":".join(arn_parts[:-1])
-            aws_layer_version_num = int(arn_parts[-1])
-        except (ValueError, IndexError) as e:
+            base_arn, _, version_str = full_arn.rpartition(":")
+            aws_layer_version_num = int(version_str)
+        except ValueError as e:
             print(f"Could not parse AWS layer version from ARN '{full_arn}' in _get_latest_aws_layer_versions: {e}. Skipping.", file=sys.stderr)
             continue
 
-        # Store the parsed version number with the item for comparison
-        item_with_parsed_version = dict(item)
-        item_with_parsed_version['_aws_layer_version_num'] = aws_layer_version_num
+        current = latest_versions_map.get(base_arn)
+        if current is None or aws_layer_version_num > current[0]:
+            latest_versions_map[base_arn] = (aws_layer_version_num, item)
 
-        current_max_item = latest_versions_map.get(base_arn)
-        if not current_max_item or aws_layer_version_num > current_max_item['_aws_layer_version_num']:
-            latest_versions_map[base_arn] = item_with_parsed_version
-    
-    return list(latest_versions_map.values())
+    return [item for _, item in latest_versions_map.values()]
 
 
 def generate_notes(distribution: str, collector_version: str, build_tags: str):
@@ -59,20 +61,49 @@ def generate_notes(distribution: str, collector_version: str, build_tags: str):
         file=sys.stderr,
     )
 
-    # Use the GSI to query directly by distribution (sk)
+    # Use the GSI to query directly by distribution (sk); DynamoDB filters
+    # the results down to the requested collector version. Items are grouped
+    # by wide region and region while the next page is being fetched.
+    wide_regions = {}
+    item_count = 0
+    # The item with the overall latest AWS layer version sources the most
+    # up-to-date description for this collector_version release
+    latest_item_for_description = None
+    max_aws_version = -1
     try:
-        items = query_by_distribution(distribution)
-        print(
-            f"Found {len(items)} raw items for distribution. Filtering for collector version '{collector_version}'...",
-            file=sys.stderr,
+        items = query_by_distribution_prefetch(
+            distribution,
+            collector_version=collector_version,
+            page_size=QUERY_PAGE_SIZE,
         )
+        for item in items:
+            item_count += 1
+            get = item.get
+            region = get("region", "unknown")
 
-        # Filter results in Python for the specific collector version
-        filtered_items = [
-            item
-            for item in items
-            if item.get("collector_version_input") == collector_version
-        ]
+            wide_region = get_wide_region(region)
+            regions = wide_regions.get(wide_region)
+            if regions is None:
+                regions = wide_regions[wide_region] = {}
+
+            arch_lists = regions.get(region)
+            if arch_lists is None:
+                arch_lists = regions[region] = {"amd64": [], "arm64": []}
+
+            arch_list = arch_lists.get(get("architecture", "unknown"))
+            if arch_list is not None:
+                arch_list.append(item)
+
+            full_arn = get("layer_arn")
+            if full_arn:
+                try:
+                    version_num = int(full_arn.split(':')[-1])
+                    if version_num > max_aws_version:
+                        max_aws_version = version_num
+                        latest_item_for_description = item
+                except (ValueError, IndexError):
+                    # Malformed ARN or version part, skip this candidate for description sourcing
+                    print(f"Warning: Could not parse AWS layer version from ARN '{full_arn}' while seeking description.", file=sys.stderr)
     except ClientError as e:
         print(
             f"Error: Failed querying DynamoDB GSI for distribution '{distribution}': {e}",
@@ -88,34 +119,16 @@ def generate_notes(distribution: str, collector_version: str, build_tags: str):
         return f"# Error\n\nAn unexpected error occurred while querying DynamoDB: {e}"
 
     print(
-        f"Found {len(filtered_items)} items matching the collector version.",
+        f"Found {item_count} items matching the collector version.",
         file=sys.stderr,
     )
 
     # Get region information
     region_display_map = get_region_info()
 
-    dist_description_from_db = None # Initialize
-    if filtered_items:
-        # Find the overall latest AWS layer version among these filtered_items
-        # to source the most up-to-date description for this collector_version release.
-        latest_item_for_description = None
-        max_aws_version = -1
-        for item_candidate in filtered_items:
-            full_arn = item_candidate.get("layer_arn")
-            if full_arn:
-                try:
-                    version_num = int(full_arn.split(':')[-1])
-                    if version_num > max_aws_version:
-                        max_aws_version = version_num
-                        latest_item_for_description = item_candidate
-                except (ValueError, IndexError):
-                    # Malformed ARN or version part, skip this candidate for description sourcing
-                    print(f"Warning: Could not parse AWS layer version from ARN '{full_arn}' while seeking description.", file=sys.stderr)
-                    continue 
-        
-        if latest_item_for_description:
-            dist_description_from_db = latest_item_for_description.get("distribution_description")
+    dist_description_from_db = None
+    if latest_item_for_description:
+        dist_description_from_db = latest_item_for_description.get("distribution_description")
 
     # --- Generate Markdown Body ---
     # Use literal \n for multi-line strings passed to gh release create --notes
@@ -143,37 +156,11 @@ def generate_notes(distribution: str, collector_version: str, build_tags: str):
     body_lines.append("\n")  # Add blank line for spacing
 
     body_lines.append("<details><summary>\n\n### Layer ARNs by Region (click to expand)\n\n</summary>\n")
-    if not filtered_items:
+    if not item_count:
         body_lines.append(
             "No matching layers found in the metadata store for this specific version and distribution.\n"
         )
     else:
-        # Sort and group items
-        sorted_items = sorted(
-            filtered_items,
-            key=lambda x: (
-                get_wide_region(x.get("region", "zzzz")),
-                x.get("region", "zzzz"),
-                x.get("architecture", "zzzz"),
-            ),
-        )
-
-        # Group by wide region and region
-        wide_regions = {}
-        for item in sorted_items:
-            region = item.get("region", "unknown")
-            wide_region = get_wide_region(region)
-
-            if wide_region not in wide_regions:
-                wide_regions[wide_region] = {}
-
-            if region not in wide_regions[wide_region]:
-                wide_regions[wide_region][region] = {"amd64": [], "arm64": []}
-
-            arch = item.get("architecture", "unknown")
-            if arch in ["amd64", "arm64"]:
-                wide_regions[wide_region][region][arch].append(item)
-
         # Generate tables with badges
         for wide_region_name in sorted(wide_regions.keys()):
             body_lines.append("<table>")
@@ -0,0 +1,33 @@
+"""
+Shared botocore configuration for AWS clients.
+
+Scripts that fan out requests across regions or layer versions use a
+larger connection pool and adaptive retries, so all clients are built
+from the same configuration.
+"""
+
+from functools import lru_cache
+
+from botocore.config import Config
+
+# Connection pool size per client
+MAX_POOL_CONNECTIONS = 64
+
+# Retry policy: back off on throttling instead of failing the request
+RETRY_CONFIG = {"mode": "adaptive", "max_attempts": 10}
+
+
+@lru_cache(maxsize=1)
+def client_config() -> Config:
+    """
+    Get the botocore Config shared by all AWS clients and resources.
+
+    Returns:
+        botocore.config.Config: Config with a larger connection pool, adaptive
+        retries and TCP keepalive enabled for long-running fan-outs
+    """
+    return Config(
+        max_pool_connections=MAX_POOL_CONNECTIONS,
+        retries=RETRY_CONFIG,
+        tcp_keepalive=True,
+    )
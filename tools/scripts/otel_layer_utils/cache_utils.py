@@ -0,0 +1,11 @@
+"""
+cache_utils.py
+
+Location of the per-user cache shared by the local build and the report scripts.
+"""
+
+import os
+from pathlib import Path
+
+# Per-user cache for data that can be reused across runs
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "ocelot"
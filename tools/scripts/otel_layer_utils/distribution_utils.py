@@ -5,9 +5,15 @@ distribution_utils.py
 Utility functions for loading and processing the distributions.yaml configuration.
 """
 
+import copy
+import sys
 import yaml
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Set, Optional
+from typing import Dict, Iterator, List, Optional, Set
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 class DistributionError(Exception):
@@ -16,18 +22,135 @@ class DistributionError(Exception):
     pass
 
 
+@lru_cache(maxsize=16)
+def _parse_distributions(path: str, mtime_ns: int, size: int) -> Dict:
+    """
+    Parse a distributions YAML file, cached per (path, mtime, size).
+
+    Callers must not mutate the returned dict; load_distributions hands out copies.
+    """
+    try:
+        with open(path, "r") as f:
+            distributions_data = yaml.load(f, Loader=_YAML_LOADER)
+        if not distributions_data or not isinstance(distributions_data, dict):
+            raise DistributionError(f"{path} is empty or invalid.")
+        # Intern distribution names so lookups by CLI-chosen names compare by identity
+        return {
+            sys.intern(name) if isinstance(name, str) else name: info
+            for name, info in distributions_data.items()
+        }
+    except yaml.YAMLError as e:
+        raise DistributionError(f"Error parsing {path}: {e}")
+    except Exception as e:
+        raise DistributionError(f"Error reading {path}: {e}")
+
+
 def load_distributions(yaml_path: Path) -> Dict:
-    """Loads distribution data from the specified YAML file."""
+    """
+    Loads distribution data from the specified YAML file.
+
+    The file is parsed once per process for as long as it is unchanged; each
+    call returns a fresh copy that the caller is free to modify.
+    """
+    if not yaml_path.is_file():
+        raise DistributionError(f"Distribution YAML file not found at {yaml_path}")
+    st = yaml_path.stat()
+    return copy.deepcopy(
+        _parse_distributions(str(yaml_path.resolve()), st.st_mtime_ns, st.st_size)
+    )
+
+
+def _node_events(event: yaml.Event, events: Iterator[yaml.Event]) -> List[yaml.Event]:
+    """Consume and return the events of the node starting with event."""
+    node = [event]
+    if not isinstance(event, yaml.CollectionStartEvent):
+        return node
+    depth = 1
+    for event in events:
+        node.append(event)
+        if isinstance(event, yaml.CollectionStartEvent):
+            depth += 1
+        elif isinstance(event, yaml.CollectionEndEvent):
+            depth -= 1
+            if depth == 0:
+                break
+    return node
+
+
+def _uses_outside_anchor(node: List[yaml.Event]) -> bool:
+    """Whether the node refers to an anchor defined outside of it."""
+    anchors = set()
+    for event in node:
+        if isinstance(event, yaml.AliasEvent):
+            if event.anchor not in anchors:
+                return True
+        elif getattr(event, "anchor", None):
+            anchors.add(event.anchor)
+    return False
+
+
+def load_single_distribution(yaml_path: Path, distribution_name: str) -> Optional[Dict]:
+    """
+    Loads one distribution's entry from the YAML file without building the rest.
+
+    The file is walked as a stream of parser events and the other top-level
+    entries are skipped. The matching entry is re-emitted and loaded with the
+    safe loader, so scalars are typed exactly as load_distributions types them.
+    An entry that refers to an anchor elsewhere in the file falls back to
+    load_distributions.
+
+    Args:
+        yaml_path: Path to the distributions YAML file.
+        distribution_name: The distribution to load.
+
+    Returns:
+        The distribution's mapping, or None if it is missing or not a mapping.
+
+    Raises:
+        DistributionError: If the file is missing or cannot be parsed.
+    """
     if not yaml_path.is_file():
         raise DistributionError(f"Distribution YAML file not found at {yaml_path}")
     try:
         with open(yaml_path, "r") as f:
-            distributions_data = yaml.safe_load(f)
-        if not distributions_data or not isinstance(distributions_data, dict):
-            raise DistributionError(f"{yaml_path} is empty or invalid.")
-        return distributions_data
+            events = yaml.parse(f, Loader=_YAML_LOADER)
+            for event in events:
+                if isinstance(event, yaml.MappingStartEvent):
+                    break
+            else:
+                raise DistributionError(f"{yaml_path} is empty or invalid.")
+
+            node = None
+            for key_event in events:
+                if isinstance(key_event, yaml.MappingEndEvent):
+                    break
+                value_events = _node_events(next(events), events)
+                if (
+                    isinstance(key_event, yaml.ScalarEvent)
+                    and key_event.value == distribution_name
+                ):
+                    node = value_events
+                    break
+        if node is None:
+            return None
+        if _uses_outside_anchor(node):
+            dist_info = load_distributions(yaml_path).get(distribution_name)
+        else:
+            document = yaml.emit(
+                [
+                    yaml.StreamStartEvent(),
+                    yaml.DocumentStartEvent(),
+                    *node,
+                    yaml.DocumentEndEvent(),
+                    yaml.StreamEndEvent(),
+                ]
+            )
+            dist_info = yaml.load(document, Loader=_YAML_LOADER)
+        return dist_info if isinstance(dist_info, dict) else None
     except yaml.YAMLError as e:
         raise DistributionError(f"Error parsing {yaml_path}: {e}")
+    except DistributionError:
+        raise
     except Exception as e:
         raise DistributionError(f"Error reading {yaml_path}: {e}")
 
@@ -5,18 +5,47 @@ This module centralizes DynamoDB operations used across various scripts
 to maintain consistency and reduce code duplication.
 """
 
+import queue
+import threading
+import time
 import boto3
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
-from typing import Dict, List, Optional
-from boto3.dynamodb.conditions import Key
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+from boto3.dynamodb.conditions import Attr, Key
+
+from .boto_utils import client_config
 
 # Common constants
 DYNAMODB_TABLE_NAME = "ocelot-layers"
 GSI_DISTRIBUTION_INDEX = "distribution-index"
 GSI_BASE_LAYER_INDEX = "base-layer-index"
 
+# BatchWriteItem accepts at most 25 requests per call
+BATCH_WRITE_MAX_ITEMS = 25
+
+# Number of segments (and worker threads) for a parallel full-table scan
+SCAN_TOTAL_SEGMENTS = 8
+
+# Pages a prefetching query, or each segment of a parallel scan, may buffer
+# ahead of its consumer
+PREFETCH_PAGES = 2
+
 
-def get_table(region: str = None):
+class BatchDeleteError(Exception):
+    """
+    A batch delete stopped because a batch write failed.
+
+    The original error is chained as __cause__; unprocessed lists the ARNs
+    that were not confirmed deleted.
+    """
+
+    def __init__(self, message: str, unprocessed: List[str]):
+        super().__init__(message)
+        self.unprocessed = unprocessed
+
+
+def get_table(region: str = None, session=None):
     """
     Get a reference to the DynamoDB table.
 
@@ -25,12 +54,16 @@ def get_table(region: str = None):
                If not provided, boto3 will use the region from:
                - AWS_REGION or AWS_DEFAULT_REGION environment variables
                - ~/.aws/config file
+        session: Optional boto3 Session to create the resource from.
+                 Defaults to the module-level default session.
 
     Returns:
         boto3.resource.Table: DynamoDB table resource
     """
     # If region is None, boto3 will use environment variables or AWS config
-    dynamodb = boto3.resource("dynamodb", region_name=region)
+    dynamodb = (session or boto3).resource(
+        "dynamodb", region_name=region, config=client_config()
+    )
     table = dynamodb.Table(DYNAMODB_TABLE_NAME)
     return table
 
@@ -144,43 +177,299 @@ def delete_item(layer_arn: str, region: str = None) -> bool:
     return status_code == 200
 
 
-def query_by_distribution(distribution_value: str, region: str = None) -> List[Dict]:
+def batch_delete_items(
+    layer_arns: List[str], region: str = None, max_retries: int = 5
+) -> List[str]:
     """
-    Query items by distribution using the GSI 'distribution-index'.
+    Delete items from DynamoDB by primary key (layer_arn) using BatchWriteItem.
+
+    Keys are sent in chunks of 25, and unprocessed keys are retried with
+    exponential backoff. If a batch write fails, the remaining chunks are not
+    attempted.
 
     Args:
-        distribution_value: Distribution name to query
+        layer_arns: The full ARNs of the layers to delete (primary HASH keys)
         region: Optional AWS region for DynamoDB.
                 If not provided, boto3 will use the region from environment variables or AWS config.
+        max_retries: Maximum number of retries for unprocessed keys per chunk
 
     Returns:
-        List[Dict]: List of items matching the distribution
+        List[str]: ARNs that could not be deleted after all retries
 
     Raises:
-        ClientError: If the query operation fails
+        BatchDeleteError: If a batch write operation fails; it carries every
+                          ARN not confirmed deleted, including later chunks
     """
+    if not layer_arns:
+        return []
+
     table = get_table(region)
-    items = []
+    client = table.meta.client
+    failed = []
+
+    for start in range(0, len(layer_arns), BATCH_WRITE_MAX_ITEMS):
+        chunk = layer_arns[start : start + BATCH_WRITE_MAX_ITEMS]
+        request_items = {
+            DYNAMODB_TABLE_NAME: [
+                {"DeleteRequest": {"Key": {"layer_arn": arn}}} for arn in chunk
+            ]
+        }
+
+        try:
+            for attempt in range(max_retries + 1):
+                response = client.batch_write_item(RequestItems=request_items)
+                request_items = response.get("UnprocessedItems") or {}
+                if not request_items:
+                    break
+                if attempt < max_retries:
+                    time.sleep(0.05 * (2**attempt))
+        except Exception as e:
+            # request_items still holds the keys of this chunk not yet deleted
+            pending = [
+                request["DeleteRequest"]["Key"]["layer_arn"]
+                for request in request_items.get(DYNAMODB_TABLE_NAME, [])
+            ]
+            remaining = layer_arns[start + BATCH_WRITE_MAX_ITEMS :]
+            raise BatchDeleteError(
+                f"Batch delete failed: {e}", failed + pending + remaining
+            ) from e
+
+        for request in request_items.get(DYNAMODB_TABLE_NAME, []):
+            failed.append(request["DeleteRequest"]["Key"]["layer_arn"])
+
+    return failed
+
+
+def _projection_args(attributes: Optional[Sequence[str]]) -> Dict:
+    """
+    Build the ProjectionExpression arguments that limit items to the given
+    attributes.
+
+    Every attribute name goes through a placeholder, since some of them (such
+    as "region") are DynamoDB reserved words.
+    """
+    if not attributes:
+        return {}
+    names = {f"#p{i}": attribute for i, attribute in enumerate(attributes)}
+    return {
+        "ProjectionExpression": ",".join(names),
+        "ExpressionAttributeNames": names,
+    }
+
+
+def _query_distribution_pages(
+    distribution_value: str,
+    region: Optional[str],
+    attributes: Optional[Sequence[str]],
+    filter_expression,
+    collector_version: Optional[str],
+    page_size: Optional[int],
+    session=None,
+) -> Iterator[List[Dict]]:
+    """
+    Query the GSI 'distribution-index', yielding one list of deserialized
+    items per page. See query_by_distribution_iter for the arguments.
+    """
+    if collector_version is not None:
+        version_condition = Attr("collector_version_input").eq(collector_version)
+        filter_expression = (
+            version_condition
+            if filter_expression is None
+            else filter_expression & version_condition
+        )
+
+    table = get_table(region, session=session)
     last_evaluated_key = None
 
     while True:
         query_args = {
             "IndexName": GSI_DISTRIBUTION_INDEX,
             "KeyConditionExpression": Key("distribution").eq(distribution_value),
+            **_projection_args(attributes),
         }
+        if filter_expression:
+            query_args["FilterExpression"] = filter_expression
+        if page_size:
+            query_args["Limit"] = page_size
         if last_evaluated_key:
             query_args["ExclusiveStartKey"] = last_evaluated_key
 
         response = table.query(**query_args)
-
-        for item in response.get("Items", []):
-            items.append(deserialize_item(item))
+        yield [deserialize_item(item) for item in response.get("Items", [])]
 
         last_evaluated_key = response.get("LastEvaluatedKey")
         if not last_evaluated_key:
             break
 
-    return items
+
+def query_by_distribution_iter(
+    distribution_value: str,
+    region: str = None,
+    attributes: Optional[Sequence[str]] = None,
+    filter_expression=None,
+    collector_version: Optional[str] = None,
+    page_size: Optional[int] = None,
+    session=None,
+) -> Iterator[Dict]:
+    """
+    Query items by distribution using the GSI 'distribution-index', yielding
+    items page by page as they arrive.
+
+    Args:
+        distribution_value: Distribution name to query
+        region: Optional AWS region for DynamoDB.
+                If not provided, boto3 will use the region from environment variables or AWS config.
+        attributes: Optional attribute names to fetch instead of whole items
+        filter_expression: Optional DynamoDB filter expression
+        collector_version: Optional collector version; only items whose
+                           collector_version_input equals it are returned,
+                           filtered on the DynamoDB side
+        page_size: Optional maximum number of items DynamoDB evaluates per page
+        session: Optional boto3 Session to query with; threads querying
+                 concurrently each need their own
+
+    Yields:
+        Dict: Deserialized items matching the distribution
+
+    Raises:
+        ClientError: If the query operation fails
+    """
+    for page in _query_distribution_pages(
+        distribution_value,
+        region,
+        attributes,
+        filter_expression,
+        collector_version,
+        page_size,
+        session,
+    ):
+        yield from page
+
+
+def _put_until_stopped(pages: queue.Queue, entry, stop: threading.Event) -> bool:
+    """
+    Put entry on a bounded queue, blocking while it is full.
+
+    Returns False without putting the entry if stop is set first, so a
+    producer whose consumer went away does not block forever.
+    """
+    while not stop.is_set():
+        try:
+            pages.put(entry, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def query_by_distribution_prefetch(
+    distribution_value: str,
+    region: str = None,
+    attributes: Optional[Sequence[str]] = None,
+    filter_expression=None,
+    collector_version: Optional[str] = None,
+    page_size: Optional[int] = None,
+) -> Iterator[Dict]:
+    """
+    Like query_by_distribution_iter, but the next page is fetched on a
+    background thread while the caller processes the current one.
+
+    At most PREFETCH_PAGES pages are buffered ahead of the caller. Closing
+    the iterator early stops the background query after its current page.
+
+    Args:
+        distribution_value: Distribution name to query
+        region: Optional AWS region for DynamoDB.
+                If not provided, boto3 will use the region from environment variables or AWS config.
+        attributes: Optional attribute names to fetch instead of whole items
+        filter_expression: Optional DynamoDB filter expression
+        collector_version: Optional collector version; only items whose
+                           collector_version_input equals it are returned,
+                           filtered on the DynamoDB side
+        page_size: Optional maximum number of items DynamoDB evaluates per page
+
+    Yields:
+        Dict: Deserialized items matching the distribution
+
+    Raises:
+        ClientError: If the query operation fails
+    """
+    pages = queue.Queue(maxsize=PREFETCH_PAGES)
+    stop = threading.Event()
+
+    def put(entry) -> bool:
+        return _put_until_stopped(pages, entry, stop)
+
+    def produce() -> None:
+        try:
+            for page in _query_distribution_pages(
+                distribution_value,
+                region,
+                attributes,
+                filter_expression,
+                collector_version,
+                page_size,
+            ):
+                if not put(page):
+                    return
+            put(None)
+        except Exception as e:
+            put(e)
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        executor.submit(produce)
+        while True:
+            page = pages.get()
+            if page is None:
+                break
+            if isinstance(page, Exception):
+                raise page
+            yield from page
+    finally:
+        stop.set()
+        executor.shutdown(wait=False)
+
+
+def query_by_distribution(
+    distribution_value: str,
+    region: str = None,
+    attributes: Optional[Sequence[str]] = None,
+    filter_expression=None,
+    collector_version: Optional[str] = None,
+    session=None,
+) -> List[Dict]:
+    """
+    Query items by distribution using the GSI 'distribution-index'.
+
+    Args:
+        distribution_value: Distribution name to query
+        region: Optional AWS region for DynamoDB.
+                If not provided, boto3 will use the region from environment variables or AWS config.
+        attributes: Optional attribute names to fetch instead of whole items
+        filter_expression: Optional DynamoDB filter expression
+        collector_version: Optional collector version; only items whose
+                           collector_version_input equals it are returned,
+                           filtered on the DynamoDB side
+        session: Optional boto3 Session to query with; threads querying
+                 concurrently each need their own
+
+    Returns:
+        List[Dict]: List of items matching the distribution
+
+    Raises:
+        ClientError: If the query operation fails
+    """
+    return list(
+        query_by_distribution_iter(
+            distribution_value,
+            region,
+            attributes=attributes,
+            filter_expression=filter_expression,
+            collector_version=collector_version,
+            session=session,
+        )
+    )
 
 
 def query_by_base_layer_arn(
@@ -241,27 +530,37 @@ def query_by_base_layer_arn(
     return items
 
 
-def scan_items(filter_expression=None, region: str = None) -> List[Dict]:
+def scan_items_iter(
+    filter_expression=None,
+    region: str = None,
+    attributes: Optional[Sequence[str]] = None,
+    item_filter: Optional[Callable[[Dict], bool]] = None,
+) -> Iterator[Dict]:
     """
-    Scan the DynamoDB table, optionally with a filter expression.
+    Scan the DynamoDB table page by page, yielding items as they arrive.
+
+    Only one page (at most 1 MB) of items is held at a time, so callers that
+    process items in a single pass never materialize the whole table.
 
     Args:
         filter_expression: Optional DynamoDB filter expression
         region: Optional AWS region for DynamoDB.
                 If not provided, boto3 will use the region from environment variables or AWS config.
+        attributes: Optional attribute names to fetch instead of whole items
+        item_filter: Optional client-side predicate applied to each raw item
+                     before it is deserialized
 
-    Returns:
-        List[Dict]: List of items from the scan
+    Yields:
+        Dict: Deserialized items from the scan
 
     Raises:
         ClientError: If the scan operation fails
     """
     table = get_table(region)
-    items = []
     last_evaluated_key = None
 
     while True:
-        scan_args = {}
+        scan_args = _projection_args(attributes)
         if filter_expression:
             scan_args["FilterExpression"] = filter_expression
         if last_evaluated_key:
@@ -270,13 +569,142 @@ def scan_items(filter_expression=None, region: str = None) -> List[Dict]:
         response = table.scan(**scan_args)
 
         for item in response.get("Items", []):
-            items.append(deserialize_item(item))
+            if item_filter is None or item_filter(item):
+                yield deserialize_item(item)
 
         last_evaluated_key = response.get("LastEvaluatedKey")
         if not last_evaluated_key:
             break
 
-    return items
+
+def scan_items(filter_expression=None, region: str = None) -> List[Dict]:
+    """
+    Scan the DynamoDB table, optionally with a filter expression.
+
+    Args:
+        filter_expression: Optional DynamoDB filter expression
+        region: Optional AWS region for DynamoDB.
+                If not provided, boto3 will use the region from environment variables or AWS config.
+
+    Returns:
+        List[Dict]: List of items from the scan
+
+    Raises:
+        ClientError: If the scan operation fails
+    """
+    return list(scan_items_iter(filter_expression, region))
+
+
+def _scan_segment(
+    segment: int,
+    total_segments: int,
+    filter_expression,
+    region: Optional[str],
+    attributes: Optional[Sequence[str]],
+    item_filter: Optional[Callable[[Dict], bool]],
+    pages: queue.Queue,
+    stop: threading.Event,
+) -> None:
+    """
+    Drain one segment of a parallel scan, putting each page of items on a queue.
+
+    A None on the queue marks the end of the segment; an exception raised by
+    the scan is put on the queue instead. Puts block while the queue is full
+    and give up once stop is set.
+    """
+    try:
+        # boto3 resources are not thread-safe, so each worker uses its own session
+        table = get_table(region, session=boto3.session.Session())
+        last_evaluated_key = None
+
+        while not stop.is_set():
+            scan_args = {
+                "Segment": segment,
+                "TotalSegments": total_segments,
+                **_projection_args(attributes),
+            }
+            if filter_expression:
+                scan_args["FilterExpression"] = filter_expression
+            if last_evaluated_key:
+                scan_args["ExclusiveStartKey"] = last_evaluated_key
+
+            response = table.scan(**scan_args)
+            page = [
+                deserialize_item(item)
+                for item in response.get("Items", [])
+                if item_filter is None or item_filter(item)
+            ]
+            if not _put_until_stopped(pages, page, stop):
+                return
+
+            last_evaluated_key = response.get("LastEvaluatedKey")
+            if not last_evaluated_key:
+                break
+        _put_until_stopped(pages, None, stop)
+    except Exception as e:
+        _put_until_stopped(pages, e, stop)
+
+
+def scan_items_parallel(
+    filter_expression=None,
+    region: str = None,
+    total_segments: int = SCAN_TOTAL_SEGMENTS,
+    attributes: Optional[Sequence[str]] = None,
+    item_filter: Optional[Callable[[Dict], bool]] = None,
+) -> Iterator[Dict]:
+    """
+    Scan the DynamoDB table with a parallel scan, yielding items as pages arrive.
+
+    Each of the total_segments segments is drained by its own thread, and
+    pages are yielded in whatever order they complete. At most PREFETCH_PAGES
+    pages per segment are buffered ahead of the caller, so a slow consumer
+    throttles the scan instead of holding the whole table in memory.
+
+    Args:
+        filter_expression: Optional DynamoDB filter expression
+        region: Optional AWS region for DynamoDB.
+                If not provided, boto3 will use the region from environment variables or AWS config.
+        total_segments: Number of segments to split the scan into
+        attributes: Optional attribute names to fetch instead of whole items
+        item_filter: Optional client-side predicate applied to each raw item
+                     in the worker threads, before it is deserialized
+
+    Yields:
+        Dict: Deserialized items from the scan
+
+    Raises:
+        ClientError: If the scan of any segment fails
+    """
+    pages = queue.Queue(maxsize=total_segments * PREFETCH_PAGES)
+    stop = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=total_segments)
+    try:
+        for segment in range(total_segments):
+            executor.submit(
+                _scan_segment,
+                segment,
+                total_segments,
+                filter_expression,
+                region,
+                attributes,
+                item_filter,
+                pages,
+                stop,
+            )
+
+        remaining = total_segments
+        while remaining:
+            page = pages.get()
+            if page is None:
+                remaining -= 1
+            elif isinstance(page, Exception):
+                raise page
+            else:
+                yield from page
+    finally:
+        # Let the other segments stop after their current page
+        stop.set()
+        executor.shutdown(wait=False)
 
 
 def get_all_items(region: str = None) -> List[Dict]:
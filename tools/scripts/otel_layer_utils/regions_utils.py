@@ -68,9 +68,12 @@ def get_region_info(enabled_regions: Optional[List[str]] = None) -> Dict[str, st
     return region_info
 
 
+@lru_cache(maxsize=64)
 def get_wide_region(region_code: str) -> str:
     """
     Get the continent name for a specific AWS region.
+    Results are memoized per region code, since callers look up the same
+    handful of regions for every layer item.
 
     Args:
         region_code: AWS region code (e.g., 'us-east-1')
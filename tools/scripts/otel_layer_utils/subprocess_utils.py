@@ -6,8 +6,10 @@ This module provides utility functions for subprocess execution with enhanced ou
 error reporting, and GitHub environment variable capture.
 """
 
+import io
 import os
 import subprocess
+import sys
 import tempfile
 from typing import Dict, List, Optional, Tuple, Union
 
@@ -22,6 +24,70 @@ from .ui_utils import (
     display_command,
 )
 
+# Block size for streaming command output through a pipe
+STREAM_BUFSIZE = 64 * 1024
+
+
+def default_stream_bufsize() -> Optional[int]:
+    """Return the stream_bufsize to use for run_command given the current stdout.
+
+    Interactive terminals keep the inherited TTY (None) so tools can draw progress
+    output; otherwise (e.g. CI) output is piped through in STREAM_BUFSIZE blocks.
+    """
+    return None if sys.stdout.isatty() else STREAM_BUFSIZE
+
+
+def _stdout_fd() -> Optional[int]:
+    """Return the file descriptor behind sys.stdout, or None if it has none.
+
+    sys.stdout may be replaced by an in-memory stream (click's CliRunner,
+    io.StringIO, pytest capture), which cannot be streamed to by descriptor.
+    """
+    try:
+        return sys.stdout.fileno()
+    except (AttributeError, io.UnsupportedOperation):
+        return None
+
+
+def _run_streamed(
+    cmd: List[str], cwd: Optional[str], env: Dict[str, str], bufsize: int, out_fd: int
+) -> subprocess.CompletedProcess:
+    """Run a command, piping its combined output to our stdout in large blocks.
+
+    Args:
+        cmd: Command to run as a list of strings
+        cwd: Working directory for the command
+        env: Full environment for the command
+        bufsize: Pipe buffer and read block size in bytes
+        out_fd: File descriptor of our stdout
+
+    Returns:
+        The completed process object (stdout and stderr are not retained)
+    """
+    # Flush anything we've buffered so it isn't interleaved with the child's output
+    sys.stdout.flush()
+
+    with subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=bufsize,
+    ) as proc:
+        in_fd = proc.stdout.fileno()
+        while True:
+            chunk = os.read(in_fd, bufsize)
+            if not chunk:
+                break
+            # os.write may write fewer bytes than requested
+            view = memoryview(chunk)
+            while view:
+                view = view[os.write(out_fd, view) :]
+        returncode = proc.wait()
+
+    return subprocess.CompletedProcess(cmd, returncode)
+
 
 def run_command(
     cmd: List[str],
@@ -30,6 +96,7 @@ def run_command(
     check: bool = True,
     capture_output: bool = False,
     capture_github_env: bool = False,
+    stream_bufsize: Optional[int] = None,
 ) -> Union[
     subprocess.CompletedProcess, Tuple[subprocess.CompletedProcess, Dict[str, str]]
 ]:
@@ -42,6 +109,8 @@ def run_command(
         check: Whether to raise an exception on non-zero exit
         capture_output: Whether to capture stdout/stderr instead of streaming
         capture_github_env: Whether to capture GitHub environment variables
+        stream_bufsize: If set, stream output through a pipe read in blocks of this
+            many bytes instead of inheriting the terminal (ignored with capture_output)
 
     Returns:
         The completed process object, or a tuple of (process, github_env_vars) if
@@ -81,15 +150,19 @@ def run_command(
             {"GITHUB_ENV": github_env_path, "GITHUB_OUTPUT": github_output_path}
         )
 
-    # Run the command
-    process = subprocess.run(
-        cmd,
-        cwd=cwd,
-        env=full_env,
-        text=True,
-        check=False,  # We'll handle errors ourselves
-        capture_output=capture_output,
-    )
+    # Run the command; streaming needs a real stdout descriptor
+    out_fd = _stdout_fd() if stream_bufsize and not capture_output else None
+    if out_fd is not None:
+        process = _run_streamed(cmd, cwd, full_env, stream_bufsize, out_fd)
+    else:
+        process = subprocess.run(
+            cmd,
+            cwd=cwd,
+            env=full_env,
+            text=True,
+            check=False,  # We'll handle errors ourselves
+            capture_output=capture_output,
+        )
 
     # Handle the output
     failed = process.returncode != 0
@@ -18,7 +18,7 @@ import os
 import sys # Import sys for isatty check
 from yaspin import yaspin as yaspin_func
 from yaspin.spinners import Spinners
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Tuple
 import time  # Add time module for tracking elapsed time
 import traceback
 import textwrap
@@ -165,6 +165,22 @@ def detail(text: str, value: str) -> None:
     click.echo(f"{STYLE_CONFIG['separator']}{value}")
 
 
+def details(items: List[Tuple[str, str]]) -> None:
+    """Display several detail messages with a single write.
+
+    Args:
+        items: (label, value) pairs, rendered like detail()
+    """
+    prefix = STYLE_CONFIG["detail_prefix"]
+    sep = STYLE_CONFIG["separator"]
+    click.echo(
+        "\n".join(
+            f"{click.style(prefix + text, fg=COLORS['info'])}{sep}{value}"
+            for text, value in items
+        )
+    )
+
+
 def success(text: str, value: Optional[str] = None) -> None:
     """Display a success message.
 
@@ -478,7 +494,7 @@ def progress_bar(
         progress_text += f" | {suffix}"
 
     # Use carriage return to update in-place without newline
-    click.echo(progress_text, nl=False)
+    click.echo(f"\r{progress_text}", nl=False)
 
     # Add newline if complete
     if current >= total:
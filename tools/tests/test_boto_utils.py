@@ -0,0 +1,15 @@
+from scripts.otel_layer_utils.boto_utils import (
+    client_config,
+    MAX_POOL_CONNECTIONS,
+)
+
+
+def test_client_config_settings():
+    config = client_config()
+    assert config.max_pool_connections == MAX_POOL_CONNECTIONS
+    assert config.retries == {"mode": "adaptive", "max_attempts": 10}
+    assert config.tcp_keepalive is True
+
+
+def test_client_config_is_shared():
+    assert client_config() is client_config()
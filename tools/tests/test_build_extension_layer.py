@@ -33,3 +33,200 @@ def test_resolve_components_by_tags_with_direct_match():
     }
     included = resolve_components_by_tags(active_tags, dependency_mappings)
     assert included == ["lambdacomponents.exporter.clickhouse"]
+
+
+def test_resolve_components_by_tags_reuses_result(monkeypatch):
+    from scripts import build_extension_layer
+
+    calls = []
+    monkeypatch.setattr(
+        build_extension_layer, "detail", lambda *args: calls.append(args)
+    )
+    active_tags = ["lambdacomponents.exporter.clickhouse"]
+    dependency_mappings = {"lambdacomponents.exporter.clickhouse": ["dep3"]}
+    first = resolve_components_by_tags(active_tags, dependency_mappings)
+    second = resolve_components_by_tags(list(active_tags), dependency_mappings)
+    assert first == second == ["lambdacomponents.exporter.clickhouse"]
+    assert len(calls) == 1
+
+    other_mappings = {"lambdacomponents.exporter.clickhouse": ["dep4"]}
+    assert resolve_components_by_tags(active_tags, other_mappings) == first
+    assert len(calls) == 2
+
+
+def test_add_dependencies_uses_single_go_mod_edit(tmp_path):
+    from unittest.mock import patch
+
+    from scripts.build_extension_layer import add_dependencies
+
+    dependency_mappings = {
+        "lambdacomponents.exporter.clickhouse": [
+            "example.com/a",
+            "example.com/b@v1.2.3",
+        ],
+    }
+    with patch("scripts.build_extension_layer.run_command") as mock_run:
+        add_dependencies(
+            tmp_path,
+            ["lambdacomponents.exporter.clickhouse"],
+            dependency_mappings,
+            "0.42.0",
+        )
+    edit_cmds = [c[0][0] for c in mock_run.call_args_list if c[0][0][2] == "edit"]
+    assert len(edit_cmds) == 1
+    assert sorted(edit_cmds[0][3:]) == [
+        "-require=example.com/a@v0.42.0",
+        "-require=example.com/b@v1.2.3",
+    ]
+
+
+def test_selective_copy_components_copies_selected_files(tmp_path):
+    from scripts.build_extension_layer import selective_copy_components
+
+    component_dir = tmp_path / "components"
+    exporter_dir = component_dir / "collector" / "lambdacomponents" / "exporter"
+    exporter_dir.mkdir(parents=True)
+    (exporter_dir / "clickhouse.go").write_text("package exporter\n")
+    (exporter_dir / "other.go").write_text("package exporter\n")
+    (component_dir / "common").mkdir()
+    (component_dir / "common" / "util.go").write_text("package common\n")
+    upstream_dir = tmp_path / "upstream"
+
+    copied = selective_copy_components(
+        component_dir,
+        upstream_dir,
+        ["lambdacomponents.exporter.clickhouse"],
+        {"lambdacomponents.exporter.clickhouse": ["dep"]},
+    )
+
+    dest_dir = upstream_dir / "collector" / "lambdacomponents" / "exporter"
+    assert copied == ["lambdacomponents.exporter.clickhouse"]
+    assert (dest_dir / "clickhouse.go").is_file()
+    assert not (dest_dir / "other.go").exists()
+    assert (upstream_dir / "collector" / "common" / "util.go").is_file()
+
+
+def test_fast_copy_overrides_existing_destination(tmp_path):
+    from scripts.build_extension_layer import _fast_copy
+
+    source = tmp_path / "custom.go"
+    source.write_text("custom\n")
+    destination = tmp_path / "upstream.go"
+    destination.write_text("upstream\n")
+    _fast_copy(source, destination)
+    assert destination.read_text() == "custom\n"
+
+    linked = tmp_path / "linked.go"
+    _fast_copy(source, linked)
+    assert linked.read_text() == "custom\n"
+
+
+def test_add_dependencies_runs_tidy_when_go_mod_unchanged(tmp_path):
+    from unittest.mock import patch
+
+    from scripts.build_extension_layer import add_dependencies
+
+    (tmp_path / "go.mod").write_text("module example.com/collector\n")
+    dependency_mappings = {"lambdacomponents.exporter.clickhouse": ("example.com/a",)}
+    with patch("scripts.build_extension_layer.run_command") as mock_run:
+        add_dependencies(
+            tmp_path,
+            ["lambdacomponents.exporter.clickhouse"],
+            dependency_mappings,
+            "v0.42.0",
+        )
+    # The overlaid sources may still need go.sum entries that only tidy adds
+    assert [c[0][0][2] for c in mock_run.call_args_list] == ["edit", "tidy"]
+
+
+def test_load_component_dependencies_normalizes_entries(tmp_path):
+    from scripts.build_extension_layer import load_component_dependencies
+
+    yaml_path = tmp_path / "component_dependencies.yaml"
+    yaml_path.write_text(
+        "dependencies:\n"
+        "  lambdacomponents.exporter.a: example.com/a\n"
+        "  lambdacomponents.exporter.b: [example.com/b, example.com/c]\n"
+        "  lambdacomponents.exporter.c:\n"
+    )
+    assert load_component_dependencies(yaml_path) == {
+        "lambdacomponents.exporter.a": ("example.com/a",),
+        "lambdacomponents.exporter.b": ("example.com/b", "example.com/c"),
+        "lambdacomponents.exporter.c": (),
+    }
+
+
+def test_go_mod_require_bisects_failing_module(tmp_path):
+    import subprocess
+    from unittest.mock import patch
+
+    from scripts.build_extension_layer import _go_mod_require
+
+    modules = [f"example.com/m{i}@v1.0.0" for i in range(8)]
+    modules[5] = "example.com/bad@v1.0.0"
+
+    def fake_run(cmd, **kwargs):
+        if "-require=example.com/bad@v1.0.0" in cmd:
+            raise subprocess.CalledProcessError(1, cmd, stderr="bad module")
+
+    with patch("scripts.build_extension_layer.run_command", side_effect=fake_run) as m:
+        added, failed = _go_mod_require(tmp_path, modules)
+    assert failed == ["example.com/bad@v1.0.0"]
+    assert sorted(added) == sorted(mod for mod in modules if "bad" not in mod)
+    assert m.call_count < len(modules)
+
+
+def test_go_mod_require_reports_failure_from_run_command(tmp_path):
+    import subprocess
+    from unittest.mock import patch
+
+    from scripts.build_extension_layer import _go_mod_require
+
+    modules = ["example.com/a@v1.0.0", "example.com/bad@v1.0.0"]
+
+    def fake_run(cmd, **kwargs):
+        failed = "-require=example.com/bad@v1.0.0" in cmd
+        return subprocess.CompletedProcess(
+            cmd,
+            1 if failed else 0,
+            stdout="",
+            stderr="go: invalid module path" if failed else "",
+        )
+
+    with patch("subprocess.run", side_effect=fake_run), patch(
+        "scripts.build_extension_layer.warning"
+    ) as mock_warning:
+        added, failed = _go_mod_require(tmp_path, modules)
+    assert added == ["example.com/a@v1.0.0"]
+    assert failed == ["example.com/bad@v1.0.0"]
+    mock_warning.assert_called_once_with(
+        "Failed to add dependency with exact version: example.com/bad@v1.0.0",
+        "Error: go: invalid module path",
+    )
+
+
+def test_selective_copy_components_with_all_and_specific_tag(tmp_path):
+    from scripts.build_extension_layer import selective_copy_components
+
+    component_dir = tmp_path / "components"
+    exporter_dir = component_dir / "collector" / "lambdacomponents" / "exporter"
+    exporter_dir.mkdir(parents=True)
+    (exporter_dir / "clickhouse.go").write_text("package exporter\n")
+    upstream_dir = tmp_path / "upstream"
+
+    copied = selective_copy_components(
+        component_dir,
+        upstream_dir,
+        ["lambdacomponents.exporter.all"],
+        {
+            "lambdacomponents.exporter.all": [],
+            "lambdacomponents.exporter.clickhouse": ["dep"],
+        },
+    )
+
+    dest_dir = upstream_dir / "collector" / "lambdacomponents" / "exporter"
+    assert sorted(copied) == [
+        "lambdacomponents.exporter.all",
+        "lambdacomponents.exporter.clickhouse",
+    ]
+    assert (dest_dir / "clickhouse.go").read_text() == "package exporter\n"
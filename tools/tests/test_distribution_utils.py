@@ -5,6 +5,7 @@ import pytest
 
 from scripts.otel_layer_utils.distribution_utils import (
     load_distributions,
+    load_single_distribution,
     resolve_build_tags,
     DistributionError,
 )
@@ -18,6 +19,18 @@ def test_load_distributions_success(tmp_path):
     assert loaded == data
 
 
+def test_load_distributions_returns_copy_and_reloads_on_change(tmp_path):
+    yaml_path = tmp_path / "distributions.yaml"
+    yaml_path.write_text(yaml.dump({"dist1": {"buildtags": ["tag1"]}}))
+
+    first = load_distributions(yaml_path)
+    first["dist1"]["buildtags"].append("mutated")
+    assert load_distributions(yaml_path) == {"dist1": {"buildtags": ["tag1"]}}
+
+    yaml_path.write_text(yaml.dump({"dist2": {"buildtags": ["tag2", "tag3"]}}))
+    assert load_distributions(yaml_path) == {"dist2": {"buildtags": ["tag2", "tag3"]}}
+
+
 def test_load_distributions_file_not_found():
     with pytest.raises(DistributionError):
         load_distributions(Path("/nonexistent/path.yaml"))
@@ -31,6 +44,50 @@ def test_load_distributions_invalid_yaml(tmp_path):
         load_distributions(yaml_path)
 
 
+def test_load_single_distribution(tmp_path):
+    data = {
+        "first": {"description": "First", "buildtags": ["a"], "extra": {"x": ["y"]}},
+        "second": {"description": "Second", "config-file": "second.yaml"},
+    }
+    yaml_path = tmp_path / "distributions.yaml"
+    yaml_path.write_text(yaml.dump(data, sort_keys=False))
+
+    assert load_single_distribution(yaml_path, "second") == data["second"]
+    assert load_single_distribution(yaml_path, "first") == data["first"]
+    assert load_single_distribution(yaml_path, "missing") is None
+
+
+def test_load_single_distribution_types_scalars_like_load_distributions(tmp_path):
+    yaml_path = tmp_path / "distributions.yaml"
+    yaml_path.write_text(
+        "base: &defaults\n"
+        "  public: true\n"
+        "typed:\n"
+        "  description: ~\n"
+        "  public: true\n"
+        "  retries: 1\n"
+        "  ratio: 0.5\n"
+        "  version: '1'\n"
+        "  base: null\n"
+        "merged:\n"
+        "  <<: *defaults\n"
+        "  buildtags: [a]\n"
+    )
+    full = load_distributions(yaml_path)
+
+    assert load_single_distribution(yaml_path, "typed") == full["typed"]
+    assert full["typed"]["public"] is True
+    assert full["typed"]["description"] is None
+    assert load_single_distribution(yaml_path, "merged") == full["merged"]
+
+
+def test_load_single_distribution_invalid_yaml(tmp_path):
+    yaml_path = tmp_path / "bad.yaml"
+    yaml_path.write_text("invalid: [unclosed list")
+    with pytest.raises(DistributionError):
+        load_single_distribution(yaml_path, "invalid")
+
+
 def test_resolve_build_tags_simple():
     dists = {
         "dist1": {"buildtags": ["tag1", "tag2"]},
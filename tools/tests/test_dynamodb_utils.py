@@ -1,3 +1,4 @@
+import time
 from decimal import Decimal
 from unittest.mock import patch, MagicMock
 
@@ -8,8 +9,12 @@ from scripts.otel_layer_utils.dynamodb_utils import (
     write_item,
     get_item,
     delete_item,
+    batch_delete_items,
+    BatchDeleteError,
     query_by_distribution,
+    query_by_distribution_prefetch,
     scan_items,
+    scan_items_parallel,
 )
 
 
@@ -93,6 +98,64 @@ def test_delete_item_not_exists(mock_get_table):
     mock_table.delete_item.assert_not_called()
 
 
+@patch("scripts.otel_layer_utils.dynamodb_utils.get_table")
+def test_batch_delete_items_chunks_requests(mock_get_table):
+    mock_table = MagicMock()
+    mock_client = mock_table.meta.client
+    mock_client.batch_write_item.return_value = {"UnprocessedItems": {}}
+    mock_get_table.return_value = mock_table
+
+    arns = [f"arn:test:key:{i}" for i in range(30)]
+    failed = batch_delete_items(arns)
+    assert failed == []
+    assert mock_client.batch_write_item.call_count == 2
+    first_batch = mock_client.batch_write_item.call_args_list[0].kwargs["RequestItems"]
+    assert len(first_batch["ocelot-layers"]) == 25
+
+
+@patch("scripts.otel_layer_utils.dynamodb_utils.time.sleep")
+@patch("scripts.otel_layer_utils.dynamodb_utils.get_table")
+def test_batch_delete_items_retries_unprocessed(mock_get_table, mock_sleep):
+    mock_table = MagicMock()
+    mock_client = mock_table.meta.client
+    unprocessed = {
+        "ocelot-layers": [{"DeleteRequest": {"Key": {"layer_arn": "arn:test:key:1"}}}]
+    }
+    mock_client.batch_write_item.side_effect = [
+        {"UnprocessedItems": unprocessed},
+        {"UnprocessedItems": unprocessed},
+    ]
+    mock_get_table.return_value = mock_table
+
+    failed = batch_delete_items(["arn:test:key:0", "arn:test:key:1"], max_retries=1)
+    assert failed == ["arn:test:key:1"]
+    assert mock_client.batch_write_item.call_count == 2
+    mock_sleep.assert_called_once()
+
+
+@patch("scripts.otel_layer_utils.dynamodb_utils.time.sleep")
+@patch("scripts.otel_layer_utils.dynamodb_utils.get_table")
+def test_batch_delete_items_reports_unprocessed_on_error(mock_get_table, mock_sleep):
+    mock_table = MagicMock()
+    mock_client = mock_table.meta.client
+    unprocessed = {
+        "ocelot-layers": [{"DeleteRequest": {"Key": {"layer_arn": "arn:test:key:30"}}}]
+    }
+    error = RuntimeError("throttled")
+    mock_client.batch_write_item.side_effect = [
+        {"UnprocessedItems": {}},
+        {"UnprocessedItems": unprocessed},
+        error,
+    ]
+    mock_get_table.return_value = mock_table
+
+    arns = [f"arn:test:key:{i}" for i in range(60)]
+    with pytest.raises(BatchDeleteError) as exc_info:
+        batch_delete_items(arns)
+    assert exc_info.value.unprocessed == ["arn:test:key:30"] + arns[50:]
+    assert exc_info.value.__cause__ is error
+
+
 @patch("scripts.otel_layer_utils.dynamodb_utils.get_table")
 def test_query_by_distribution(mock_get_table):
     mock_table = MagicMock()
@@ -133,3 +196,125 @@ def test_scan_items(mock_get_table):
     assert len(items) == 3
     assert {"pk": "1"} in items
     assert {"pk": "3"} in items
+
+
+@patch("scripts.otel_layer_utils.dynamodb_utils.get_table")
+def test_scan_items_parallel_drains_every_segment(mock_get_table):
+    def scan(Segment, TotalSegments, ExclusiveStartKey=None):
+        assert TotalSegments == 3
+        if ExclusiveStartKey is None:
+            return {
+                "Items": [{"pk": f"{Segment}-a"}],
+                "LastEvaluatedKey": {"pk": f"{Segment}-a"},
+            }
+        return {"Items": [{"pk": f"{Segment}-b"}]}
+
+    mock_get_table.return_value.scan.side_effect = scan
+
+    items = list(scan_items_parallel(total_segments=3))
+    assert sorted(item["pk"] for item in items) == [
+        "0-a",
+        "0-b",
+        "1-a",
+        "1-b",
+        "2-a",
+        "2-b",
+    ]
+
+
+@patch("scripts.otel_layer_utils.dynamodb_utils.get_table")
+def test_scan_items_parallel_raises_segment_error(mock_get_table):
+    mock_get_table.return_value.scan.side_effect = RuntimeError("throttled")
+
+    with pytest.raises(RuntimeError):
+        list(scan_items_parallel(total_segments=2))
+
+
+@patch("scripts.otel_layer_utils.dynamodb_utils.get_table")
+def test_scan_items_parallel_bounds_buffered_pages(mock_get_table):
+    from scripts.otel_layer_utils.dynamodb_utils import PREFETCH_PAGES
+
+    pages_per_segment = 20
+
+    def scan(Segment, TotalSegments, ExclusiveStartKey=None):
+        page = ExclusiveStartKey["page"] + 1 if ExclusiveStartKey else 0
+        response = {"Items": [{"pk": f"{Segment}-{page}"}]}
+        if page < pages_per_segment - 1:
+            response["LastEvaluatedKey"] = {"page": page}
+        return response
+
+    mock_table = mock_get_table.return_value
+    mock_table.scan.side_effect = scan
+
+    items = scan_items_parallel(total_segments=2)
+    first = next(items)
+    # Give the workers time to run ahead of the stalled consumer
+    time.sleep(0.3)
+    # Consumed page + full queue + one page in hand per blocked worker
+    assert mock_table.scan.call_count <= 1 + 2 * PREFETCH_PAGES + 2
+
+    rest = list(items)
+    assert len(rest) + 1 == 2 * pages_per_segment
+    assert first not in rest
+
+
+@patch("scripts.otel_layer_utils.dynamodb_utils.get_table")
+def test_query_by_distribution_projects_attributes(mock_get_table):
+    mock_table = MagicMock()
+    mock_table.query.return_value = {"Items": [{"region": "us-east-1"}]}
+    mock_get_table.return_value = mock_table
+
+    items = query_by_distribution("dist", attributes=("layer_arn", "region"))
+    assert items == [{"region": "us-east-1"}]
+    _, kwargs = mock_table.query.call_args
+    assert kwargs["ProjectionExpression"] == "#p0,#p1"
+    assert kwargs["ExpressionAttributeNames"] == {"#p0": "layer_arn", "#p1": "region"}
+
+
+@patch("scripts.otel_layer_utils.dynamodb_utils.get_table")
+def test_scan_items_parallel_applies_item_filter(mock_get_table):
+    mock_get_table.return_value.scan.return_value = {
+        "Items": [{"pk": "keep"}, {"pk": "drop"}]
+    }
+
+    items = list(
+        scan_items_parallel(
+            total_segments=2, item_filter=lambda item: item["pk"] == "keep"
+        )
+    )
+    assert items == [{"pk": "keep"}, {"pk": "keep"}]
+
+
+@patch("scripts.otel_layer_utils.dynamodb_utils.get_table")
+def test_query_by_distribution_filters_collector_version(mock_get_table):
+    from boto3.dynamodb.conditions import Attr
+
+    mock_table = MagicMock()
+    mock_table.query.return_value = {"Items": []}
+    mock_get_table.return_value = mock_table
+
+    query_by_distribution("dist", collector_version="v0.42.0")
+    _, kwargs = mock_table.query.call_args
+    assert kwargs["FilterExpression"] == Attr("collector_version_input").eq("v0.42.0")
+
+
+@patch("scripts.otel_layer_utils.dynamodb_utils.get_table")
+def test_query_by_distribution_prefetch_yields_all_pages(mock_get_table):
+    mock_table = MagicMock()
+    mock_table.query.side_effect = [
+        {"Items": [{"pk": str(i)}], "LastEvaluatedKey": {"pk": str(i)}}
+        for i in range(4)
+    ] + [{"Items": [{"pk": "4"}]}]
+    mock_get_table.return_value = mock_table
+
+    items = list(query_by_distribution_prefetch("dist", page_size=1))
+    assert items == [{"pk": str(i)} for i in range(5)]
+    assert mock_table.query.call_args.kwargs["Limit"] == 1
+
+
+@patch("scripts.otel_layer_utils.dynamodb_utils.get_table")
+def test_query_by_distribution_prefetch_raises_query_error(mock_get_table):
+    mock_get_table.return_value.query.side_effect = RuntimeError("throttled")
+
+    with pytest.raises(RuntimeError):
+        list(query_by_distribution_prefetch("dist"))
@@ -0,0 +1,195 @@
+from unittest.mock import patch
+
+from boto3.dynamodb.conditions import Attr
+
+from scripts.generate_layers_report import (
+    REPORT_ATTRIBUTES,
+    _plan_from_pattern,
+    fetch_layers_from_dynamodb,
+)
+
+
+def _arn(name, version=1):
+    return f"arn:aws:lambda:us-east-1:123456789012:layer:{name}:{version}"
+
+
+def test_plan_from_pattern_narrows_to_pinned_distribution():
+    distributions, _, matcher = _plan_from_pattern("*arm64-clickhouse-0_42_0*")
+    assert distributions == ["clickhouse"]
+    assert matcher(_arn("ocelot-arm64-clickhouse-0_42_0-prod"))
+    assert not matcher(_arn("ocelot-amd64-clickhouse-0_42_0-prod"))
+
+    distributions, _, _ = _plan_from_pattern("*arm64-clickhouse-otlphttp-0_*")
+    assert distributions == ["clickhouse-otlphttp"]
+
+
+def test_plan_from_pattern_scans_without_pinned_distribution():
+    assert _plan_from_pattern(None) == ([], None, None)
+    distributions, _, matcher = _plan_from_pattern("*amd64*")
+    assert distributions == []
+    assert matcher(_arn("ocelot-amd64-full-0_42_0"))
+
+    # Could also match a distribution that is not in DISTRIBUTIONS
+    assert _plan_from_pattern("*arm64-clickhouse*")[0] == []
+    assert _plan_from_pattern("*arm64-clickhouse*-0_42*")[0] == []
+    assert _plan_from_pattern("*arm64-experimental-0_42*")[0] == []
+
+
+@patch("scripts.generate_layers_report.scan_items_parallel")
+@patch("scripts.generate_layers_report.query_by_distribution")
+def test_fetch_layers_queries_distribution_index(mock_query, mock_scan):
+    mock_query.return_value = [
+        {"layer_arn": _arn("ocelot-amd64-minimal-0_42_0")},
+        {"layer_arn": _arn("ocelot-arm64-minimal-0_42_0")},
+        {"distribution": "minimal"},
+    ]
+    items = list(fetch_layers_from_dynamodb("*amd64-minimal-0_42_0*"))
+    mock_query.assert_called_once_with(
+        "minimal",
+        attributes=REPORT_ATTRIBUTES,
+        filter_expression=Attr("layer_arn").contains("amd64-minimal-0_42_0"),
+        session=None,
+    )
+    mock_scan.assert_not_called()
+    assert items == [{"layer_arn": _arn("ocelot-amd64-minimal-0_42_0")}]
+
+
+@patch("scripts.generate_layers_report.scan_items_parallel")
+@patch("scripts.generate_layers_report.query_by_distribution")
+def test_fetch_layers_falls_back_to_scan_on_query_error(mock_query, mock_scan):
+    mock_query.side_effect = RuntimeError("throttled")
+    mock_scan.return_value = [{"layer_arn": _arn("ocelot-amd64-full-0_42_0")}]
+    assert (
+        list(fetch_layers_from_dynamodb("*amd64-full-0_42_0*"))
+        == mock_scan.return_value
+    )
+    mock_query.assert_called_once()
+
+
+@patch("scripts.generate_layers_report.scan_items_parallel")
+def test_fetch_layers_streams_scan_into_grouping(mock_scan):
+    from scripts.generate_layers_report import process_dynamodb_items
+
+    def pages():
+        yield {
+            "layer_arn": _arn("ocelot-amd64-full-0_42_0"),
+            "distribution": "full",
+            "architecture": "amd64",
+        }
+        raise RuntimeError("connection reset")
+
+    mock_scan.return_value = pages()
+    items = fetch_layers_from_dynamodb()
+    mock_scan.assert_not_called()
+    grouped = process_dynamodb_items(items)
+    assert list(grouped) == ["full:amd64"]
+
+
+def test_process_dynamodb_items_keeps_latest_layer_version(tmp_path):
+    from scripts.generate_layers_report import generate_report, process_dynamodb_items
+
+    items = [
+        {
+            "layer_arn": _arn("ocelot-amd64-full-0_42_0", version),
+            "distribution": "full",
+            "architecture": "amd64",
+            "region": "us-east-1",
+        }
+        for version in (2, 10, 3)
+    ]
+    items.append({"layer_arn": "not-an-arn", "distribution": "full"})
+
+    grouped = process_dynamodb_items(items)
+    layers = list(grouped["full:amd64"].values())
+    assert [layer["arn"] for layer in layers] == [_arn("ocelot-amd64-full-0_42_0", 10)]
+
+    output = tmp_path / "LAYERS.md"
+    generate_report(grouped, str(output))
+    report = output.read_text()
+    assert (
+        f"\n| us-east-1 | `{_arn('ocelot-amd64-full-0_42_0', 10)}` | unknown | Unknown |"
+        in report
+    )
+    assert _arn("ocelot-amd64-full-0_42_0", 3) not in report
+
+
+def test_format_timestamp():
+    from scripts.generate_layers_report import _format_timestamp
+
+    assert _format_timestamp("2024-05-01T12:30:00Z") == "2024-05-01T12:30:00UTC"
+    assert _format_timestamp("Unknown") == "Unknown"
+
+
+def test_parse_iso_z_accepts_utc_designator():
+    from datetime import timezone
+
+    from scripts.generate_layers_report import _parse_iso_z
+
+    parsed = _parse_iso_z("2024-05-01T12:30:00Z")
+    assert parsed.tzinfo == timezone.utc
+    assert _parse_iso_z("2024-05-01T12:30:00+02:00").utcoffset().seconds == 7200
+
+
+@patch("scripts.generate_layers_report.fetch_layers_from_dynamodb")
+def test_fetch_layers_cached_replays_within_ttl(mock_fetch, tmp_path, monkeypatch):
+    from scripts import generate_layers_report
+    from scripts.generate_layers_report import fetch_layers_cached
+
+    monkeypatch.setattr(generate_layers_report, "REPORT_CACHE_DIR", tmp_path)
+    items = [{"layer_arn": _arn("ocelot-amd64-full-0_42_0")}]
+    mock_fetch.side_effect = lambda pattern, raise_errors=False: iter(items)
+
+    assert fetch_layers_cached("*full*", 60) == items
+    assert fetch_layers_cached("*full*", 60) == items
+    assert mock_fetch.call_count == 1
+
+    # A different pattern, an expired entry or a disabled cache all refetch
+    fetch_layers_cached("*minimal*", 60)
+    assert mock_fetch.call_count == 2
+    now = generate_layers_report.time.time()
+    monkeypatch.setattr(generate_layers_report.time, "time", lambda: now + 120)
+    fetch_layers_cached("*full*", 60)
+    assert mock_fetch.call_count == 3
+    fetch_layers_cached("*full*", 0)
+    assert mock_fetch.call_count == 4
+
+
+@patch("scripts.generate_layers_report.scan_items_parallel")
+def test_fetch_layers_cached_skips_failed_scan(mock_scan, tmp_path, monkeypatch):
+    from scripts import generate_layers_report
+    from scripts.generate_layers_report import fetch_layers_cached
+
+    monkeypatch.setattr(generate_layers_report, "REPORT_CACHE_DIR", tmp_path)
+    item = {"layer_arn": _arn("ocelot-amd64-full-0_42_0")}
+
+    def failing_scan(*args, **kwargs):
+        yield item
+        raise RuntimeError("throttled")
+
+    mock_scan.side_effect = failing_scan
+
+    assert fetch_layers_cached(None, 60) == [item]
+    assert list(tmp_path.iterdir()) == []
+    fetch_layers_cached(None, 60)
+    assert mock_scan.call_count == 2
+
+
+def test_plan_from_pattern_filters_on_literal_tokens():
+    _, filter_expression, _ = _plan_from_pattern("*us-east-1*[ab]*amd64*")
+    assert filter_expression == (
+        Attr("layer_arn").contains("us-east-1") & Attr("layer_arn").contains("amd64")
+    )
+
+
+@patch("scripts.generate_layers_report.query_by_distribution")
+def test_query_distributions_gives_each_thread_a_session(mock_query):
+    from scripts.generate_layers_report import _query_distributions
+
+    mock_query.return_value = []
+    _query_distributions(["clickhouse", "clickhouse-otlphttp"])
+    sessions = [call.kwargs["session"] for call in mock_query.call_args_list]
+    assert sorted(call.args[0] for call in mock_query.call_args_list) == [
+        "clickhouse",
+        "clickhouse-otlphttp",
+    ]
+    assert len({id(session) for session in sessions}) == 2
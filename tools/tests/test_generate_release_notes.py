@@ -0,0 +1,60 @@
+from unittest.mock import patch
+
+from scripts.generate_release_notes import generate_notes
+
+
+def _item(region, arch, version, description=None):
+    item = {
+        "layer_arn": f"arn:aws:lambda:{region}:123456789012:layer:ocelot-{arch}:{version}",
+        "region": region,
+        "architecture": arch,
+    }
+    if description:
+        item["distribution_description"] = description
+    return item
+
+
+@patch("scripts.generate_release_notes.get_region_info")
+@patch("scripts.generate_release_notes.get_wide_region")
+@patch("scripts.generate_release_notes.query_by_distribution_prefetch")
+def test_generate_notes_groups_streamed_items(
+    mock_query, mock_wide_region, mock_region_info
+):
+    mock_query.return_value = iter(
+        [
+            _item("us-east-1", "amd64", 1, "old"),
+            _item("us-east-1", "amd64", 3, "latest"),
+            _item("eu-west-1", "arm64", 2),
+        ]
+    )
+    mock_wide_region.side_effect = {
+        "us-east-1": "North America",
+        "eu-west-1": "Europe",
+    }.get
+    mock_region_info.return_value = {"us-east-1": "US East (N. Virginia)"}
+
+    notes = generate_notes("minimal", "v0.42.0", "tag1")
+
+    assert mock_query.call_args.kwargs["collector_version"] == "v0.42.0"
+    assert "> latest" in notes
+    assert "ocelot-amd64:3</code>" in notes
+    assert "ocelot-amd64:1</code>" not in notes
+    assert notes.index("Europe") < notes.index("North America")
+    assert "US East (N. Virginia)" in notes
+
+
+def test_get_latest_aws_layer_versions_keeps_highest_version():
+    from scripts.generate_release_notes import _get_latest_aws_layer_versions
+
+    layers = [
+        _item("us-east-1", "amd64", 2),
+        _item("us-east-1", "amd64", 10),
+        _item("us-east-1", "arm64", 1),
+        {"layer_arn": "arn:aws:lambda:us-east-1:123456789012:layer:broken"},
+    ]
+    latest = _get_latest_aws_layer_versions(layers)
+    assert sorted(item["layer_arn"].rsplit(":", 1)[1] for item in latest) == [
+        "1",
+        "10",
+    ]
+    assert latest[0] is layers[1]
@@ -1,17 +1,35 @@
+import tempfile
 from unittest.mock import patch, MagicMock
 from pathlib import Path
 
+import pytest
+
 from local_build.upstream import (
     clone_repository,
     determine_upstream_version,
     cleanup_temp_dir,
 )
+from local_build.exceptions import TerminateApp
+
+
+@pytest.fixture(autouse=True)
+def _temp_dirs_in_tmp_path(tmp_path, monkeypatch):
+    """Create clone temp dirs under tmp_path instead of /dev/shm."""
+    real_mkdtemp = tempfile.mkdtemp
+
+    def mkdtemp(suffix=None, prefix=None, dir=None):
+        return real_mkdtemp(suffix, prefix, str(tmp_path))
+
+    monkeypatch.setattr(tempfile, "mkdtemp", mkdtemp)
 
 
 @patch("local_build.upstream.run_command")
 def test_clone_repository_integration(
-    mock_run, mock_build_context, mock_tracker, temp_test_dir
+    mock_run, mock_build_context, mock_tracker, temp_test_dir, monkeypatch
 ):
+    monkeypatch.setattr(
+        "local_build.upstream.MIRROR_CACHE_DIR", temp_test_dir / "cache"
+    )
     mock_run.return_value = MagicMock(returncode=0)
     # Simulate the clone by creating the directory structure
     temp_clone = temp_test_dir / "upstream"
@@ -27,8 +45,44 @@ def test_clone_repository_integration(
         result = clone_repository(mock_build_context, mock_tracker)
     # The clone_repository creates its own temp dir, so just check it exists
     assert Path(result.temp_upstream_dir).is_dir()
-    mock_run.assert_called_once()
-    assert "git" in mock_run.call_args[0][0]
+    cmds = [call[0][0] for call in mock_run.call_args_list]
+    mirror_path = temp_test_dir / "cache" / "opentelemetry" / "mock-repo.git"
+    mirror_clone = next(cmd for cmd in cmds if cmd[:2] == ["git", "clone"])
+    assert "--bare" in mirror_clone
+    assert mirror_clone[-1] == str(mirror_path)
+    # The working copy is cloned from the mirror, narrowed and checked out
+    working_clone = cmds[-3]
+    assert working_clone[:2] == ["git", "clone"]
+    assert "--sparse" in working_clone
+    assert working_clone[-2:] == [mirror_path.as_uri(), result.temp_upstream_dir]
+    assert cmds[-2][-4:] == ["sparse-checkout", "set", "--cone", "collector"]
+    assert cmds[-1][-2:] == ["checkout", "main"]
+
+
+@patch("local_build.upstream.run_command")
+def test_clone_repository_uses_version_cache(
+    mock_run, mock_build_context, mock_tracker, temp_test_dir, monkeypatch
+):
+    monkeypatch.setattr(
+        "local_build.upstream.MIRROR_CACHE_DIR", temp_test_dir / "cache"
+    )
+    sha = "a" * 40
+    mock_run.return_value = MagicMock(returncode=0, stdout=f"{sha}\trefs/heads/main\n")
+    with patch("local_build.upstream.determine_upstream_version") as mock_determine:
+        mock_determine.side_effect = lambda ctx, tracker: (
+            ctx.set_upstream_version("v0.42.0") or ctx
+        )
+        clone_repository(mock_build_context, mock_tracker)
+    cache_file = mock_build_context.build_dir / ".upstream-version-cache.json"
+    assert cache_file.is_file()
+
+    mock_run.reset_mock()
+    mock_build_context.set_upstream_version(None)
+    mock_build_context.set_temp_dir(None)
+    result = clone_repository(mock_build_context, mock_tracker)
+    assert result.upstream_version == "v0.42.0"
+    assert result.temp_upstream_dir is None
+    assert [call[0][0][1] for call in mock_run.call_args_list] == ["ls-remote"]
 
 
 @patch("local_build.upstream.run_command")
@@ -43,8 +97,57 @@ def test_determine_upstream_version_integration(
     mock_tracker.complete_step.assert_called_with(1, "Version: v0.42.0")
 
 
+@patch("local_build.upstream.run_command")
+def test_determine_upstream_version_from_makefile(
+    mock_run, mock_build_context, mock_tracker, mock_upstream_repo
+):
+    makefile = mock_upstream_repo / "collector" / "Makefile"
+    makefile.write_text("OTELCOL_VERSION ?= v0.43.0\n")
+    mock_build_context.set_temp_dir(str(mock_upstream_repo))
+    result = determine_upstream_version(mock_build_context, mock_tracker)
+    assert result.upstream_version == "v0.43.0"
+    mock_run.assert_not_called()
+
+
 def test_cleanup_temp_dir(mock_build_context, mock_upstream_repo):
     mock_build_context.set_temp_dir(str(mock_upstream_repo))
     mock_build_context.keep_temp = False
     cleanup_temp_dir(mock_build_context)
     assert not Path(mock_upstream_repo).exists()
+
+
+@patch("local_build.upstream.run_command")
+def test_clone_repository_reuses_existing_checkout(
+    mock_run, mock_build_context, mock_tracker, mock_upstream_repo
+):
+    mock_run.return_value = MagicMock(returncode=0)
+    mock_build_context.reuse_upstream = str(mock_upstream_repo)
+    result = clone_repository(mock_build_context, mock_tracker)
+    assert result.temp_upstream_path == mock_upstream_repo
+    assert result.upstream_version == "v0.42.0"
+    cmds = [call[0][0] for call in mock_run.call_args_list]
+    assert cmds[0] == [
+        "git",
+        "-C",
+        str(mock_upstream_repo),
+        "fetch",
+        "--depth",
+        "1",
+        "origin",
+        "main",
+    ]
+    assert cmds[1][-3:] == ["reset", "--hard", "FETCH_HEAD"]
+    cleanup_temp_dir(result)
+    assert mock_upstream_repo.is_dir()
+
+
+@patch("local_build.upstream.run_command")
+def test_clone_repository_failure_removes_temp_dir(
+    mock_run, mock_build_context, mock_tracker, tmp_path, monkeypatch
+):
+    monkeypatch.setattr("local_build.upstream.MIRROR_CACHE_DIR", tmp_path / "cache")
+    mock_run.side_effect = [MagicMock(returncode=0, stdout=""), RuntimeError("boom")]
+    with pytest.raises(TerminateApp):
+        clone_repository(mock_build_context, mock_tracker)
+    assert mock_build_context.temp_upstream_dir is None
+    assert not any(tmp_path.glob("otel-upstream-*"))
@@ -2,88 +2,103 @@ from unittest.mock import patch, MagicMock
 
 import pytest
 
-from local_build.aws import (
-    check_aws_credentials,
-    get_aws_region,
-    verify_credentials,
-)
-from local_build.context import BuildContext
+from local_build.aws import verify_credentials
 from local_build.exceptions import TerminateApp
 
 
-@patch("boto3.client")
-def test_check_aws_credentials_success(mock_client):
-    mock_sts = MagicMock()
-    mock_sts.get_caller_identity.return_value = {"Account": "123456789012"}
-    mock_client.return_value = mock_sts
+def _mock_session(region="us-east-1", account="123456789012", sts_error=None):
+    session = MagicMock()
+    session.region_name = region
+    sts = session.client.return_value
+    if sts_error is not None:
+        sts.get_caller_identity.side_effect = sts_error
+    else:
+        sts.get_caller_identity.return_value = {"Account": account}
+    return session
 
-    assert check_aws_credentials() is True
 
+@patch("local_build.aws._session")
+def test_verify_credentials_success(mock_session_fn, mock_build_context, mock_tracker):
+    mock_session_fn.return_value = _mock_session()
+    updated_ctx = verify_credentials(mock_build_context, mock_tracker)
+    assert updated_ctx.aws_region == "us-east-1"
+    assert updated_ctx.dynamodb_region == "us-east-1"
+
+
+@patch("local_build.aws._session")
+def test_verify_credentials_fail_creds(
+    mock_session_fn, mock_build_context, mock_tracker
+):
+    mock_session_fn.return_value = _mock_session(sts_error=Exception("fail"))
+    with pytest.raises(TerminateApp):
+        verify_credentials(mock_build_context, mock_tracker)
 
-@patch("boto3.client")
-def test_check_aws_credentials_failure(mock_client):
-    mock_sts = MagicMock()
-    mock_sts.get_caller_identity.side_effect = Exception("fail")
-    mock_client.return_value = mock_sts
 
-    assert check_aws_credentials() is False
+@patch("local_build.aws._session")
+def test_verify_credentials_boto3_missing(
+    mock_session_fn, mock_build_context, mock_tracker
+):
+    mock_session_fn.side_effect = ImportError("No module named 'boto3'")
 
+    with pytest.raises(TerminateApp, match="AWS credentials check failed"):
+        verify_credentials(mock_build_context, mock_tracker)
 
-@patch("boto3.session.Session")
-def test_get_aws_region_success(mock_session_cls):
-    mock_session = MagicMock()
-    mock_session.region_name = "us-east-1"
-    mock_session_cls.return_value = mock_session
 
-    assert get_aws_region() == "us-east-1"
+@patch("local_build.aws._session")
+def test_verify_credentials_skip_aws_checks(
+    mock_session_fn, mock_build_context, mock_tracker
+):
+    session = _mock_session()
+    mock_session_fn.return_value = session
+    mock_build_context.skip_aws_checks = True
+    updated_ctx = verify_credentials(mock_build_context, mock_tracker)
+    session.client.assert_not_called()
+    assert updated_ctx.aws_region == "us-east-1"
 
 
-@patch("boto3.session.Session")
-def test_get_aws_region_failure(mock_session_cls):
-    mock_session = MagicMock()
-    mock_session.region_name = None
-    mock_session_cls.return_value = mock_session
+@patch("local_build.aws.success")
+@patch("local_build.aws.error")
+@patch("local_build.aws.subheader")
+@patch("local_build.aws._session")
+def test_verify_credentials_reports_in_order(
+    mock_session_fn,
+    mock_subheader,
+    mock_error,
+    mock_success,
+    mock_build_context,
+    mock_tracker,
+):
+    mock_session_fn.return_value = _mock_session(region=None)
+    events = []
+    mock_subheader.side_effect = lambda *a: events.append(("subheader", a[0]))
+    mock_error.side_effect = lambda *a: events.append(("error", a[0]))
+    mock_success.side_effect = lambda *a: events.append(("success", a[0]))
 
     with pytest.raises(TerminateApp):
-        get_aws_region()
-
-
-@patch("local_build.aws.get_aws_region", return_value="us-east-1")
-@patch("local_build.aws.check_aws_credentials", return_value=True)
-def test_verify_credentials_success(mock_check, mock_region):
-    ctx = BuildContext(
-        distribution="dist",
-        architecture="amd64",
-        upstream_repo="repo",
-        upstream_ref="ref",
-        layer_name="layer",
-        runtimes="python3.8",
-        skip_publish=False,
-        verbose=True,
-        public=False,
-        keep_temp=False,
+        verify_credentials(mock_build_context, mock_tracker)
+
+    assert events == [
+        ("subheader", "Checking AWS credentials"),
+        ("success", "AWS credentials are configured"),
+        ("subheader", "Determining AWS region"),
+        ("error", "Could not determine AWS region from boto3 session."),
+    ]
+
+
+@patch("local_build.aws.error")
+@patch("local_build.aws._session")
+def test_verify_credentials_fail_creds_skips_region_error(
+    mock_session_fn, mock_error, mock_build_context, mock_tracker
+):
+    mock_session_fn.return_value = _mock_session(
+        region=None, sts_error=Exception("fail")
     )
-    tracker = MagicMock()
-    updated_ctx = verify_credentials(ctx, tracker)
-    assert updated_ctx.aws_region == "us-east-1"
-    assert updated_ctx.dynamodb_region == "us-east-1"
 
+    with pytest.raises(TerminateApp, match="AWS credentials check failed"):
+        verify_credentials(mock_build_context, mock_tracker)
 
-@patch("local_build.aws.get_aws_region", return_value="us-east-1")
-@patch("local_build.aws.check_aws_credentials", return_value=False)
-def test_verify_credentials_fail_creds(mock_check, mock_region):
-    ctx = BuildContext(
-        distribution="dist",
-        architecture="amd64",
-        upstream_repo="repo",
-        upstream_ref="ref",
-        layer_name="layer",
-        runtimes="python3.8",
-        skip_publish=False,
-        verbose=True,
-        public=False,
-        keep_temp=False,
-    )
-    tracker = MagicMock()
-    with pytest.raises(TerminateApp):
-        verify_credentials(ctx, tracker)
+    messages = [c.args[0] for c in mock_error.call_args_list]
+    assert messages == [
+        "AWS credentials are not configured correctly",
+        "AWS credentials check failed",
+    ]
@@ -5,12 +5,21 @@ import pytest
 from local_build.config import (
     load_distribution_choices,
     load_distributions,
+    prefetch_distributions,
     determine_build_tags,
 )
 from local_build.context import BuildContext
+from scripts.otel_layer_utils.distribution_utils import DistributionError
 from local_build.exceptions import TerminateApp
 
 
+@pytest.fixture(autouse=True)
+def distributions_cache_path(temp_test_dir, monkeypatch):
+    cache_path = temp_test_dir / "distributions.json"
+    monkeypatch.setattr("local_build.config.DISTRIBUTIONS_CACHE_PATH", cache_path)
+    return cache_path
+
+
 @patch("local_build.config._load_distributions_utils")
 def test_load_distribution_choices_success(mock_load):
     mock_load.return_value = {
@@ -31,12 +40,46 @@ def test_load_distribution_choices_file_not_found(mock_load):
 
 @patch("local_build.config._load_distributions_utils")
 def test_load_distribution_choices_other_error(mock_load):
-    mock_load.side_effect = Exception("fail")
+    mock_load.side_effect = DistributionError("fail")
     with pytest.raises(TerminateApp):
         load_distribution_choices()
 
 
 @patch("local_build.config._load_distributions_utils")
+def test_load_distribution_choices_uses_disk_cache(
+    mock_load, temp_test_dir, distributions_cache_path, monkeypatch
+):
+    yaml_path = temp_test_dir / "distributions.yaml"
+    yaml_path.write_text("dist1: {}\n")
+    monkeypatch.setattr("local_build.config.DIST_YAML_PATH", yaml_path)
+    mock_load.return_value = {"dist1": {}}
+
+    assert load_distribution_choices()[0] == ["dist1"]
+    assert load_distribution_choices()[0] == ["dist1"]
+    mock_load.assert_called_once()
+    assert distributions_cache_path.is_file()
+
+    yaml_path.write_text("dist1: {}\ndist2: {}\n")
+    mock_load.return_value = {"dist1": {}, "dist2": {}}
+    assert load_distribution_choices()[0] == ["dist1", "dist2"]
+
+
+@patch("local_build.config._load_distributions_utils")
+def test_load_distribution_choices_ignores_corrupt_cache(
+    mock_load, temp_test_dir, distributions_cache_path, monkeypatch
+):
+    yaml_path = temp_test_dir / "distributions.yaml"
+    yaml_path.write_text("dist1: {}\n")
+    monkeypatch.setattr("local_build.config.DIST_YAML_PATH", yaml_path)
+    mock_load.return_value = {"dist1": {}}
+
+    for corrupt in ("not json", "[1, 2]", '{"key": "x"}'):
+        distributions_cache_path.write_text(corrupt)
+        assert load_distribution_choices()[0] == ["dist1"]
+    assert mock_load.call_count == 3
+
+
+@patch("local_build.context._load_distributions_utils")
 def test_load_distributions_success(mock_load):
     mock_load.return_value = {"dist": {}}
     ctx = BuildContext(
@@ -55,9 +98,28 @@ def test_load_distributions_success(mock_load):
     assert updated_ctx.distributions_data == {"dist": {}}
 
 
-@patch("local_build.config._load_distributions_utils")
+@patch("local_build.context._load_distributions_utils")
 def test_load_distributions_error(mock_load):
-    mock_load.side_effect = Exception("fail")
+    mock_load.side_effect = DistributionError("fail")
+    ctx = BuildContext(
+        distribution="dist",
+        architecture="amd64",
+        upstream_repo="repo",
+        upstream_ref="ref",
+        layer_name="layer",
+        runtimes="python3.8",
+        skip_publish=False,
+        verbose=False,
+        public=False,
+        keep_temp=False,
+    )
+    with pytest.raises(TerminateApp):
+        load_distributions(ctx)
+
+
+@patch("local_build.context._load_distributions_utils")
+def test_prefetch_distributions_defers_errors(mock_load):
+    mock_load.side_effect = DistributionError("fail")
     ctx = BuildContext(
         distribution="dist",
         architecture="amd64",
@@ -70,6 +132,7 @@ def test_load_distributions_error(mock_load):
         public=False,
         keep_temp=False,
     )
+    prefetch_distributions(ctx)
     with pytest.raises(TerminateApp):
         load_distributions(ctx)
 
@@ -97,7 +160,7 @@ def test_determine_build_tags_success(mock_resolve):
 
 @patch("local_build.config.resolve_build_tags")
 def test_determine_build_tags_error(mock_resolve):
-    mock_resolve.side_effect = Exception("fail")
+    mock_resolve.side_effect = DistributionError("fail")
     ctx = BuildContext(
         distribution="dist",
         architecture="amd64",
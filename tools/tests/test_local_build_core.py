@@ -1,3 +1,8 @@
+from unittest.mock import patch
+
+import pytest
+
+from local_build import testing
 from local_build.exceptions import TerminateApp
 from local_build.context import BuildContext
 
@@ -63,3 +68,67 @@ def test_build_context_initialization_and_setters():
 
     ctx.set_dynamodb_region("us-west-2")
     assert ctx.dynamodb_region == "us-west-2"
+    assert ctx.dynamodb_region_str == "us-west-2"
+
+    ctx.set_distribution_description_from_config("From config")
+    assert ctx.distribution_description == "From config"
+    assert ctx.distribution_description_from_config == "From config"
+
+    assert ctx.public_str == "false"
+    ctx.public = True
+    assert ctx.public_str == "true"
+
+
+@patch("local_build.context._load_distributions_utils")
+def test_build_context_loads_distributions_lazily(mock_load):
+    mock_load.return_value = {"dist": {"description": "A distribution"}}
+    ctx = BuildContext(
+        distribution="dist",
+        architecture="amd64",
+        upstream_repo="repo",
+        upstream_ref="ref",
+        layer_name="layer",
+        runtimes="python3.8",
+        skip_publish=True,
+        verbose=False,
+        public=False,
+        keep_temp=False,
+    )
+    mock_load.assert_not_called()
+
+    assert ctx.distributions_data == mock_load.return_value
+    assert ctx.distribution_description == "A distribution"
+    mock_load.assert_called_once()
+
+    ctx.set_distributions_data({"dist": {}})
+    assert ctx.distribution_description is None
+
+
+def test_inject_error_disabled_returns_function_unchanged(monkeypatch):
+    monkeypatch.setattr(testing, "_INJECT_ERROR_TARGET", None)
+
+    def step():
+        return "ok"
+
+    assert testing.inject_error(step_index=1)(step) is step
+
+
+def test_inject_error_leaves_other_functions_unchanged(monkeypatch):
+    monkeypatch.setattr(testing, "_INJECT_ERROR_TARGET", "other_step")
+
+    def step():
+        return "ok"
+
+    assert testing.inject_error(step_index=1)(step) is step
+
+
+def test_inject_error_raises_for_target(monkeypatch):
+    monkeypatch.setattr(testing, "_INJECT_ERROR_TARGET", "step")
+
+    @testing.inject_error(step_index=1)
+    def step():
+        return "ok"
+
+    with pytest.raises(TerminateApp) as exc_info:
+        step()
+    assert exc_info.value.step_index == 1
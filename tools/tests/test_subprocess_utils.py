@@ -1,4 +1,5 @@
 import subprocess
+import sys
 import tempfile
 
 import pytest
@@ -42,6 +43,34 @@ def test_run_command_failure_check_false(mock_run):
     assert result.returncode == 1
 
 
+def test_run_command_stream_bufsize(capfd):
+    result = run_command(
+        [sys.executable, "-c", "import sys; print('streamed'); sys.exit(0)"],
+        stream_bufsize=1024,
+    )
+    assert result.returncode == 0
+    assert "streamed" in capfd.readouterr().out
+
+
+def test_run_command_stream_bufsize_failure():
+    with pytest.raises(subprocess.CalledProcessError):
+        run_command(
+            [sys.executable, "-c", "import sys; sys.exit(3)"],
+            stream_bufsize=1024,
+        )
+
+
+def test_run_command_stream_bufsize_without_stdout_fd(monkeypatch):
+    import io
+
+    monkeypatch.setattr(sys, "stdout", io.StringIO())
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = subprocess.CompletedProcess(args=["true"], returncode=0)
+        result = run_command(["true"], stream_bufsize=1024)
+    assert result.returncode == 0
+    mock_run.assert_called_once()
+
+
 @patch("subprocess.run")
 def test_run_command_capture_github_env(mock_run):
     # Prepare fake subprocess result
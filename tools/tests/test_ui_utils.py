@@ -1,5 +1,7 @@
 
 from scripts.otel_layer_utils.ui_utils import (
+    detail,
+    details,
     format_elapsed_time,
     format_file_size,
     format_traceback,
@@ -29,3 +31,12 @@ def test_format_traceback_simple():
         # The formatted traceback should include the error type and message
         assert "ValueError" in tb_str
         assert "Test error" in tb_str
+
+
+def test_details_matches_detail_output(capsys):
+    detail("Region", "us-east-1")
+    detail("Architecture", "arm64")
+    expected = capsys.readouterr().out
+
+    details([("Region", "us-east-1"), ("Architecture", "arm64")])
+    assert capsys.readouterr().out == expected